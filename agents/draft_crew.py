@@ -7,6 +7,7 @@ import asyncio
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +19,12 @@ from core.mcp_integration import MCPClient
 from api.sleeper_client import SleeperClient
 from core.league_context import league_manager
 
+# Blocking crew.kickoff() calls run here rather than in the loop's default
+# executor - a timed-out kickoff can't be interrupted and keeps its thread, so
+# this bounds how many stuck kickoffs there can be without starving
+# asyncio.to_thread users
+CREW_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='crew-kickoff')
+
 
 # Helper function to get live rankings data for agents
 async def get_cached_rankings_data(position: str = "ALL", limit: int = 50, cache_minutes: int = 5) -> str:
@@ -139,7 +146,7 @@ def get_sleeper_rankings_fallback() -> str:
     try:
         import requests
         import asyncio
-        from api.sleeper_client import SleeperClient
+        from api.sleeper_client import SleeperClient, run_with_session
         
         print("🔄 Fetching live rankings from Sleeper API as fallback...")
         
@@ -151,7 +158,7 @@ def get_sleeper_rankings_fallback() -> str:
         try:
             # Try to run in current event loop if it exists
             players_task = sleeper_client.get_all_players()
-            players = asyncio.run(players_task)
+            players = run_with_session(players_task)
         except RuntimeError:
             # If we're already in an async context, use the current loop
             loop = asyncio.get_event_loop()
@@ -159,7 +166,7 @@ def get_sleeper_rankings_fallback() -> str:
                 # Create a new thread for the async operation
                 import concurrent.futures
                 with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, sleeper_client.get_all_players())
+                    future = executor.submit(run_with_session, sleeper_client.get_all_players())
                     players = future.result(timeout=10)
             else:
                 players = loop.run_until_complete(sleeper_client.get_all_players())
@@ -289,12 +296,13 @@ async def get_live_rankings_data(position: str = "ALL", limit: int = 50) -> str:
     except Exception as e:
         print(f"❌ MCP rankings failed: {e}")
         print("🔄 Attempting direct FantasyPros API call...")
-        fallback_result = get_sync_rankings_fallback()
+        # Both fallbacks block on HTTP - keep them off the event loop
+        fallback_result = await asyncio.to_thread(get_sync_rankings_fallback)
         
         # If API call failed, fall back to Sleeper rankings
         if "ERROR:" in fallback_result:
             print("⚠️ FantasyPros API unavailable, falling back to Sleeper rankings")
-            return get_sleeper_rankings_fallback()
+            return await asyncio.to_thread(get_sleeper_rankings_fallback)
         else:
             return fallback_result
 
@@ -520,21 +528,15 @@ class FantasyDraftCrew:
                 verbose=False  # Reduce output for speed
             )
             
-            # Set shorter timeout
-            import signal
-            
-            def timeout_handler(signum, frame):
-                raise TimeoutError("CrewAI execution timed out")
-            
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(25)  # 25 second timeout for speed
-            
+            # kickoff() is synchronous - run it on CREW_EXECUTOR so the caller's
+            # event loop keeps serving other requests, with a shorter timeout.
+            # (SIGALRM only works on the main thread, so it can't be used here.)
+            loop = asyncio.get_running_loop()
             try:
-                result = crew.kickoff()
-                signal.alarm(0)  # Cancel timeout
+                result = await asyncio.wait_for(loop.run_in_executor(CREW_EXECUTOR, crew.kickoff), timeout=25)
                 return str(result)
-            except TimeoutError:
-                signal.alarm(0)
+            except asyncio.TimeoutError:
+                # The worker thread can't be interrupted; it finishes in the background
                 return await self._handle_simple_question(question)
                 
         except Exception as e:
@@ -594,16 +596,13 @@ class FantasyDraftCrew:
                 draft_id = self.session_context.get('draft_id')
                 if draft_id and user_roster_id:
                     try:
-                        import requests
-                        draft_info_response = requests.get(f"https://api.sleeper.app/v1/draft/{draft_id}")
-                        if draft_info_response.status_code == 200:
-                            draft_info = draft_info_response.json()
-                            # The draft_order maps user_id to draft_slot, we need to find the user_id for our roster_id
-                            draft_order = draft_info.get('draft_order', {})
-                            for sleeper_user_id, draft_slot in draft_order.items():
-                                if draft_slot == user_roster_id:
-                                    user_sleeper_id = sleeper_user_id
-                                    break
+                        draft_info = await self.sleeper_client.get_draft_info(draft_id)
+                        # The draft_order maps user_id to draft_slot, we need to find the user_id for our roster_id
+                        draft_order = draft_info.get('draft_order') or {}
+                        for sleeper_user_id, draft_slot in draft_order.items():
+                            if draft_slot == user_roster_id:
+                                user_sleeper_id = sleeper_user_id
+                                break
                     except Exception as e:
                         print(f"⚠️ Could not fetch draft info for user ID mapping: {e}")
                 
@@ -836,7 +835,7 @@ class FantasyDraftCrew:
                 verbose=False
             )
             
-            result = mini_crew.kickoff()
+            result = await asyncio.get_running_loop().run_in_executor(CREW_EXECUTOR, mini_crew.kickoff)
             # Check if we got a valid result
             if result:
                 return str(result)  # Return the raw result without wrapping
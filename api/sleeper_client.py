@@ -5,13 +5,217 @@ Handles all interactions with the Sleeper Fantasy Football platform API
 
 import aiohttp
 import asyncio
+import heapq
 import json
 import os
 import ssl
+from itertools import islice
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+# Optional streaming JSON parser - lets us parse /players/nfl without buffering the whole body
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Optional fast JSON parser - used for API responses and the JSON cache fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Responses bigger than this are parsed in a worker thread so the event loop
+# keeps serving other in-flight requests (picks, rosters) meanwhile
+OFFLOAD_PARSE_BYTES = 256 * 1024
+
+# Optional CA bundle - more reliable than the system store on some Mac Python installs
+try:
+    import certifi
+    HAS_CERTIFI = True
+except ImportError:
+    HAS_CERTIFI = False
+
+# aiohttp only decodes brotli ("br") responses when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# Compressed encodings we ask Sleeper for - JSON shrinks 5-8x on the wire
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+# Optional binary cache format - MessagePack + zstd decodes far faster than pretty JSON
+try:
+    import msgpack
+    import zstandard
+    HAS_BINARY_CACHE = True
+except ImportError:
+    HAS_BINARY_CACHE = False
+
+
+# Player fields the draft assistant actually reads - everything else in the
+# ~5MB /players/nfl payload is dropped while parsing
+PLAYER_FIELDS = (
+    'first_name', 'last_name', 'full_name', 'team', 'position',
+    'fantasy_positions', 'search_rank', 'years_exp', 'age',
+    'injury_status', 'active', 'status', 'sport',
+)
+
+
+def _slim_player(player_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a raw Sleeper player record down to PLAYER_FIELDS (missing keys stay missing)"""
+    return {field: player_data[field] for field in PLAYER_FIELDS if field in player_data}
+
+
+# Fields read when indexing a player, with the default used when a key is missing
+INDEX_FIELDS = (
+    ('first_name', ''), ('last_name', ''), ('team', None), ('fantasy_positions', None),
+    ('search_rank', None), ('years_exp', 0), ('age', None), ('injury_status', None),
+    ('active', True),
+)
+_index_getter = itemgetter(*(field for field, _ in INDEX_FIELDS))
+
+
+def _index_fields(player_data: Dict[str, Any]) -> tuple:
+    """Fetch INDEX_FIELDS from a player record as a tuple (itemgetter fast path)"""
+    try:
+        return _index_getter(player_data)
+    except KeyError:
+        # Sleeper normally sends every key (null when unknown) - fill gaps with defaults
+        return tuple(player_data.get(field, default) for field, default in INDEX_FIELDS)
+
+
+async def _parse_json(raw: bytes) -> Any:
+    """Parse a JSON body, off the event loop thread when it's large"""
+    if len(raw) > OFFLOAD_PARSE_BYTES:
+        return await asyncio.to_thread(_json_loads, raw)
+    return _json_loads(raw)
+
+
+# On-disk shard for active players with no fantasy position - only needed to
+# rebuild the "ALL" list from shards
+UNPOSITIONED_SHARD = "NONE"
+
+
+def _drafted_ids(picks: List[Dict[str, Any]]) -> frozenset:
+    """Frozen set of player IDs already picked (empty/None player_ids skipped)"""
+    return frozenset(filter(None, (pick.get('player_id') for pick in picks)))
+
+
+def _build_ssl_context() -> ssl.SSLContext:
+    """
+    Build the TLS context for Sleeper requests
+    
+    Certificates are verified against certifi's CA bundle (or the system store).
+    Verification is only disabled when SLEEPER_DEV_INSECURE_SSL=1 is set, for
+    local machines with broken certificate setups.
+    """
+    if os.getenv('SLEEPER_DEV_INSECURE_SSL') == '1':
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        return ssl_context
+    
+    if HAS_CERTIFI:
+        return ssl.create_default_context(cafile=certifi.where())
+    return ssl.create_default_context()
+
+
+def _read_cache_file(path: Path) -> Any:
+    """Load a cache file written by _write_cache_file (format picked from the suffix)"""
+    if path.suffix == '.zst':
+        with open(path, 'rb') as f:
+            raw = zstandard.ZstdDecompressor().decompress(f.read())
+        return msgpack.unpackb(raw, raw=False)
+    
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _write_cache_file(path: Path, data: Any) -> None:
+    """Write a cache file as MessagePack + zstd (.msgpack.zst) or plain JSON (.json)"""
+    if path.suffix == '.zst':
+        packed = msgpack.packb(data, use_bin_type=True)
+        with open(path, 'wb') as f:
+            f.write(zstandard.ZstdCompressor(level=3).compress(packed))
+        return
+    
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+@dataclass(slots=True, frozen=True)
+class PlayerSlim:
+    """
+    Compact, fixed-layout record for an available player
+    
+    Same fields as the player_info dicts from get_available_players, but with
+    ~40% less memory and attribute access (player.rank) instead of key lookups.
+    Use to_dict() at serialization boundaries (JSON, enrichment).
+    """
+    player_id: str
+    name: str
+    team: Optional[str]
+    positions: tuple
+    rank: int
+    years_exp: Optional[int]
+    age: Optional[int]
+    injury_status: Optional[str]
+    
+    @classmethod
+    def from_info(cls, player_info: Dict[str, Any]) -> 'PlayerSlim':
+        """Build a record from a player_info dict"""
+        return cls(
+            player_id=player_info['player_id'],
+            name=player_info['name'],
+            team=player_info['team'],
+            positions=tuple(player_info['positions']),
+            rank=player_info['rank'],
+            years_exp=player_info['years_exp'],
+            age=player_info['age'],
+            injury_status=player_info['injury_status']
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the player_info dict shape (positions as a list)"""
+        return {
+            'player_id': self.player_id,
+            'name': self.name,
+            'team': self.team,
+            'positions': list(self.positions),
+            'rank': self.rank,
+            'years_exp': self.years_exp,
+            'age': self.age,
+            'injury_status': self.injury_status
+        }
+
+
+class SleeperAPIError(Exception):
+    """
+    Sleeper answered a request with an HTTP error status
+    
+    The message is only formatted when the error is actually displayed.
+    """
+    
+    def __init__(self, endpoint: str, status: int, reason: str = None):
+        super().__init__(endpoint, status, reason)
+        self.endpoint = endpoint
+        self.status = status
+        self.reason = reason
+    
+    def __str__(self) -> str:
+        return f"Sleeper API request failed for {self.endpoint}: {self.status} {self.reason or ''}".rstrip()
+
 
 class SleeperClient:
     """
@@ -21,29 +225,108 @@ class SleeperClient:
     
     BASE_URL = "https://api.sleeper.app/v1"
     
+    # One aiohttp session per event loop, shared by every SleeperClient on that loop
+    # so keep-alive connections (and their TLS handshakes) are reused across clients
+    # and endpoints. Entry points close it with aclose_shared() / run_with_session()
+    _shared_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+    
+    # How long the player database (and its per-position views) stays fresh (seconds)
+    PLAYERS_CACHE_TTL = 86400
+    
+    # Past the TTL but younger than this, the cache is revalidated with a cheap
+    # conditional HEAD (ETag) instead of re-downloading 5MB (seconds)
+    PLAYERS_CACHE_HARD_TTL = 7 * 86400
+    
+    # How long a fetched pick list is served without asking Sleeper again (seconds)
+    PICKS_CACHE_TTL = 5
+    
     def __init__(self, username: str = None, league_id: str = None):
         self.username = username or os.getenv('SLEEPER_USERNAME')
         self.league_id = league_id or os.getenv('SLEEPER_LEAGUE_ID')
         self.session = None
         self.players_cache = {}
+        # When the in-memory players_cache was fetched from Sleeper (epoch seconds)
+        self._players_fetched_at = 0.0
+        # Position -> rank-sorted list of player_info dicts, plus an "ALL" bucket
+        self._by_position: Dict[str, List[Dict[str, Any]]] = {}
+        # True once _by_position was built from the full player database
+        # (False while it only holds position views loaded from disk)
+        self._index_complete = False
+        # Position -> when its disk-loaded view goes stale (shard mtime + PLAYERS_CACHE_TTL);
+        # only used while _index_complete is False
+        self._shard_expires_at: Dict[str, float] = {}
+        # player_id -> PlayerSlim, filled lazily for get_available_players(as_records=True)
+        self._player_records: Dict[str, PlayerSlim] = {}
+        # draft_id -> (fetched_at, etag, picks) for short-lived pick list caching
+        self._picks_cache: Dict[str, Tuple[float, Optional[str], List[Dict[str, Any]]]] = {}
+        # draft_id -> background pick watcher task / pick-change event
+        self._picks_watchers: Dict[str, asyncio.Task] = {}
+        self._picks_events: Dict[str, asyncio.Event] = {}
+        # request key -> in-flight task, for single-flight request dedup
+        self._inflight: Dict[str, asyncio.Task] = {}
         self.cache_dir = Path(__file__).parent.parent / "data"
         self.cache_dir.mkdir(exist_ok=True)
         
+    @classmethod
+    async def get_session(cls) -> aiohttp.ClientSession:
+        """
+        Get the running loop's shared aiohttp session, creating it on first use
+        
+        Each event loop gets its own session, so a worker thread running
+        asyncio.run() (e.g. the CrewAI tools) never replaces the main loop's.
+        
+        Returns:
+            The aiohttp ClientSession for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        session = cls._shared_sessions.get(loop)
+        
+        if session is None or session.closed:
+            # Verified TLS lets keep-alive and session tickets skip repeat handshakes
+            ssl_context = _build_ssl_context()
+            
+            # Draft turns burst many small requests at one host: raise the pool
+            # limits, cache DNS and keep idle connections alive between turns
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context,
+                limit=200,
+                limit_per_host=50,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+                force_close=False
+            )
+            
+            # Bound tail latency - total leaves room for the ~5MB /players/nfl download
+            timeout = aiohttp.ClientTimeout(total=30, connect=3, sock_read=10)
+            
+            # Ask for compressed bodies; aiohttp decompresses transparently (auto_decompress)
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={'Accept-Encoding': ACCEPT_ENCODING}
+            )
+            cls._shared_sessions[loop] = session
+        
+        return session
+    
+    @classmethod
+    async def aclose_shared(cls) -> None:
+        """Close the running loop's shared session - call once before the loop ends"""
+        session = cls._shared_sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
+    
     async def __aenter__(self):
         """Async context manager entry"""
-        # For development - disable SSL verification (common Mac issue)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        
-        self.session = aiohttp.ClientSession(connector=connector)
+        self.session = await self.get_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit - the shared session stays open until aclose_shared()"""
+        await self.stop_watching_picks()
+        self.session = None
     
     async def _make_request(self, endpoint: str) -> Dict[str, Any]:
         """
@@ -54,6 +337,7 @@ class SleeperClient:
         - Making async HTTP GET request using aiohttp
         - Converting response to JSON automatically
         - Proper error handling with meaningful messages
+        - Single-flight: concurrent calls for the same endpoint share one request
         
         Args:
             endpoint: API endpoint path (without base URL, e.g., "/user/adamrubinsky")
@@ -62,23 +346,147 @@ class SleeperClient:
             Dict containing the parsed JSON API response
             
         Raises:
-            Exception: If API request fails for any reason (network, HTTP error, etc.)
+            SleeperAPIError: If Sleeper answers with an HTTP error status
+            aiohttp.ClientError: On network failures (propagated as-is)
+        """
+        return await self._single_flight(endpoint, lambda: self._fetch_json(endpoint))
+    
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
         """
+        Collapse concurrent identical requests into one in-flight task
+        
+        During a draft several UI components often ask for the same data at the
+        same moment. The first caller starts the work; later callers with the same
+        key await the same task instead of repeating the network + parse work.
+        
+        Args:
+            key: Identifies the request (e.g. the endpoint path)
+            fetch: Zero-argument coroutine factory doing the real work
+            
+        Returns:
+            Result of the shared task
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        
+        # Only share tasks from this event loop (scripts may drive one client from several)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        
+        # shield() so one cancelled caller doesn't cancel the request for everyone else
+        return await asyncio.shield(task)
+    
+    def _forget_inflight(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished single-flight task (unless a newer one replaced it)"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+    
+    async def _fetch_json(self, endpoint: str) -> Any:
+        """GET an endpoint and parse its JSON body (the work behind _make_request)"""
         # Construct full URL by combining base URL with specific endpoint
         url = f"{self.BASE_URL}{endpoint}"
+        session = await self.get_session()
+        
+        # Use async context manager to make HTTP GET request
+        # This ensures the connection is properly closed after use
+        async with session.get(url) as response:
+            # Plain status check instead of raise_for_status() + try/except keeps
+            # exception machinery off the success path
+            if response.status >= 400:
+                raise SleeperAPIError(endpoint, response.status, response.reason)
+            # Parse JSON response body (large bodies off the event loop)
+            return await _parse_json(await response.read())
+    
+    async def _make_conditional_request(self, endpoint: str, etag: str = None) -> Tuple[int, Optional[str], Any]:
+        """
+        Make a conditional GET request using If-None-Match
+        
+        Args:
+            endpoint: API endpoint path (without base URL)
+            etag: ETag from a previous response, if we have one
+            
+        Returns:
+            Tuple of (status, etag, data) - data is None when the server answers
+            304 Not Modified, meaning the previously fetched body is still current
+            
+        Raises:
+            SleeperAPIError: If Sleeper answers with an HTTP error status
+            aiohttp.ClientError: On network failures (propagated as-is)
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+        headers = {'If-None-Match': etag} if etag else None
+        session = await self.get_session()
+        
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return 304, etag, None
+            if response.status >= 400:
+                raise SleeperAPIError(endpoint, response.status, response.reason)
+            return response.status, response.headers.get('ETag'), await _parse_json(await response.read())
+    
+    async def _stream_players(self, endpoint: str) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+        """
+        Stream-parse the player database endpoint into slim player dicts
+        
+        The /players/nfl body is ~5MB. Instead of buffering the full text and then
+        building the full dict, we feed the response stream to ijson in chunks and
+        keep only PLAYER_FIELDS for each player as it is parsed. Peak memory is
+        roughly the slim dict instead of raw text + full dict.
+        
+        Falls back to a buffered parse (still projected) when ijson isn't installed.
+        
+        Args:
+            endpoint: API endpoint path returning a {player_id: player_data} object
+            
+        Returns:
+            Tuple of (slim player dicts keyed by player_id, response ETag or None)
+            
+        Raises:
+            SleeperAPIError: If Sleeper answers with an HTTP error status
+            aiohttp.ClientError: On network failures (propagated as-is)
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+        players = {}
+        session = await self.get_session()
+        
+        async with session.get(url) as response:
+            if response.status >= 400:
+                raise SleeperAPIError(endpoint, response.status, response.reason)
+            etag = response.headers.get('ETag')
+            
+            if HAS_IJSON:
+                # response.content is an async stream - ijson pulls it in 64KB chunks
+                async for player_id, player_data in ijson.kvitems_async(response.content, '', use_float=True):
+                    players[player_id] = _slim_player(player_data)
+            else:
+                raw_players = await _parse_json(await response.read())
+                for player_id, player_data in raw_players.items():
+                    players[player_id] = _slim_player(player_data)
+        
+        return players, etag
+    
+    async def _is_not_modified(self, endpoint: str, etag: str) -> bool:
+        """
+        Check with a conditional HEAD request whether a resource is unchanged
+        
+        Args:
+            endpoint: API endpoint path (without base URL)
+            etag: ETag saved from the last full download
+            
+        Returns:
+            True if the server answered 304 Not Modified, False otherwise
+            (including on network errors - the caller then does a full fetch)
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+        session = await self.get_session()
         
         try:
-            # Use async context manager to make HTTP GET request
-            # This ensures the connection is properly closed after use
-            async with self.session.get(url) as response:
-                # Check if HTTP status is success (200-299), raise exception if not
-                response.raise_for_status()
-                # Parse JSON response body and return as Python dictionary
-                return await response.json()
-        except aiohttp.ClientError as e:
-            # Catch any HTTP client errors (network issues, HTTP errors, etc.)
-            # Re-raise as our own exception with context about which endpoint failed
-            raise Exception(f"Sleeper API request failed for {endpoint}: {e}")
+            async with session.head(url, headers={'If-None-Match': etag}) as response:
+                return response.status == 304
+        except aiohttp.ClientError:
+            return False
     
     async def get_user(self, username: str = None) -> Dict[str, Any]:
         """
@@ -158,13 +566,137 @@ class SleeperClient:
         """
         Get all picks made in a draft
         
+        Pick lists are cached for PICKS_CACHE_TTL seconds. After that we revalidate
+        with the last ETag, so an unchanged draft costs a 304 instead of a full
+        download and JSON parse. Call invalidate_picks() to force a refetch.
+        
+        While watch_picks() is running for this draft, the watcher keeps the cache
+        current and this returns it without any HTTP call.
+        
         Args:
             draft_id: Draft ID
             
         Returns:
             List of pick dictionaries
         """
-        return await self._make_request(f"/draft/{draft_id}/picks")
+        cached = self._picks_cache.get(draft_id)
+        
+        # Fresh enough (or kept fresh by a watcher) - no network call at all
+        if cached and (self._is_watching(draft_id)
+                       or time.monotonic() - cached[0] < self.PICKS_CACHE_TTL):
+            return cached[2]
+        
+        picks, _ = await self._single_flight(f"picks:{draft_id}", lambda: self._refresh_picks(draft_id))
+        return picks
+    
+    async def _refresh_picks(self, draft_id: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Revalidate a draft's pick list with a conditional GET
+        
+        Args:
+            draft_id: Draft ID
+            
+        Returns:
+            Tuple of (picks, changed) - changed is True when the list differs from
+            what was cached before; the draft's change event is set in that case
+        """
+        cached = self._picks_cache.get(draft_id)
+        now = time.monotonic()
+        
+        status, etag, picks = await self._make_conditional_request(
+            f"/draft/{draft_id}/picks", cached[1] if cached else None
+        )
+        if status == 304:
+            # No new picks since last fetch - keep serving the cached list
+            picks = cached[2]
+        
+        changed = cached is None or (status != 304 and picks != cached[2])
+        self._picks_cache[draft_id] = (now, etag, picks)
+        
+        if changed and draft_id in self._picks_events:
+            self._picks_events[draft_id].set()
+        
+        return picks, changed
+    
+    def invalidate_picks(self, draft_id: str = None) -> None:
+        """
+        Drop cached pick lists so the next get_draft_picks call refetches
+        
+        Args:
+            draft_id: Draft to invalidate (all drafts if None)
+        """
+        if draft_id is None:
+            self._picks_cache.clear()
+        else:
+            self._picks_cache.pop(draft_id, None)
+    
+    def watch_picks(self, draft_id: str, interval: float = 2.0) -> asyncio.Event:
+        """
+        Start a background poller that keeps a draft's pick list current
+        
+        Sleeper has no public push API for drafts, so the watcher revalidates
+        /draft/{id}/picks every `interval` seconds with If-None-Match. Advice calls
+        then read picks from memory, with zero HTTP on the critical path.
+        
+        Args:
+            draft_id: Draft to watch
+            interval: Seconds between revalidations
+            
+        Returns:
+            The draft's pick-change event (see picks_changed_event)
+        """
+        if not self._is_watching(draft_id):
+            self._picks_watchers[draft_id] = asyncio.create_task(self._watch_picks(draft_id, interval))
+        return self.picks_changed_event(draft_id)
+    
+    def picks_changed_event(self, draft_id: str) -> asyncio.Event:
+        """
+        Event that is set whenever a new pick shows up in a draft
+        
+        Waiters should clear() it after handling the change, e.g. to push an
+        update to the UI.
+        
+        Args:
+            draft_id: Draft ID
+            
+        Returns:
+            asyncio.Event for this draft
+        """
+        if draft_id not in self._picks_events:
+            self._picks_events[draft_id] = asyncio.Event()
+        return self._picks_events[draft_id]
+    
+    async def stop_watching_picks(self, draft_id: str = None) -> None:
+        """
+        Stop pick watchers
+        
+        Args:
+            draft_id: Draft to stop watching (all drafts if None)
+        """
+        draft_ids = [draft_id] if draft_id else list(self._picks_watchers)
+        for watched_id in draft_ids:
+            task = self._picks_watchers.pop(watched_id, None)
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+    
+    def _is_watching(self, draft_id: str) -> bool:
+        """True if a pick watcher is running for this draft"""
+        task = self._picks_watchers.get(draft_id)
+        return task is not None and not task.done()
+    
+    async def _watch_picks(self, draft_id: str, interval: float) -> None:
+        """Background loop behind watch_picks()"""
+        while True:
+            try:
+                await self._refresh_picks(draft_id)
+            except Exception as e:
+                # Keep watching - a transient failure shouldn't stop pick updates
+                print(f"⚠️ Pick watcher error for draft {draft_id}: {e}")
+            await asyncio.sleep(interval)
     
     async def get_all_players(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
@@ -177,8 +709,12 @@ class SleeperClient:
         4. Each player has fantasy_positions, team, rank, etc. that we need
         
         Caching Strategy:
-        - Cache file stored in data/players_cache.json
+        - Cache file stored in data/players_cache.msgpack.zst (MessagePack + zstd),
+          or data/players_cache.json when msgpack/zstandard aren't installed
+        - An existing players_cache.json is converted to the binary format once
         - Cache expires after 24 hours (86400 seconds)
+        - Between 24 hours and 7 days old, a conditional HEAD with the saved ETag
+          (data/players_cache.etag) renews the cache if Sleeper's data is unchanged
         - force_refresh parameter bypasses cache for fresh data
         - Cache includes all player metadata: positions, teams, rankings, etc.
         
@@ -187,41 +723,245 @@ class SleeperClient:
             
         Returns:
             Dict of all NFL players keyed by player_id (e.g., "4881" -> {player data})
-            Each player dict contains: first_name, last_name, team, fantasy_positions, 
-            search_rank, years_exp, age, injury_status, etc.
+            Each player dict is trimmed to PLAYER_FIELDS: first_name, last_name, team,
+            fantasy_positions, search_rank, years_exp, age, injury_status, active, etc.
         """
+        # Already loaded in this process and still fresh - no disk or network work
+        if (not force_refresh and self.players_cache
+                and datetime.now().timestamp() - self._players_fetched_at < self.PLAYERS_CACHE_TTL):
+            return self.players_cache
+        
+        # Concurrent callers share one cache load / 5MB download
+        return await self._single_flight(
+            f"players:{force_refresh}", lambda: self._load_all_players(force_refresh)
+        )
+    
+    async def _load_all_players(self, force_refresh: bool) -> Dict[str, Any]:
+        """Load the player database from the cache file or Sleeper (see get_all_players)"""
         # Define path to our local cache file in the data directory
-        cache_file = self.cache_dir / "players_cache.json"
+        legacy_cache_file = self.cache_dir / "players_cache.json"
+        cache_file = self._cache_path("players_cache")
+        if HAS_BINARY_CACHE:
+            # One-time migration of an old JSON cache, keeping its mtime so the TTL still applies
+            if not cache_file.exists() and legacy_cache_file.exists():
+                legacy_mtime = legacy_cache_file.stat().st_mtime
+                legacy_players = await asyncio.to_thread(_read_cache_file, legacy_cache_file)
+                await asyncio.to_thread(_write_cache_file, cache_file, legacy_players)
+                os.utime(cache_file, (legacy_mtime, legacy_mtime))
+                legacy_cache_file.unlink()
+        
+        # ETag of the download the cache file was written from
+        etag_file = self.cache_dir / "players_cache.etag"
         
         # Check if we should use cached data instead of making API call
         if not force_refresh and cache_file.exists():
             # Calculate how old our cached file is by comparing timestamps
-            cache_age = datetime.now().timestamp() - cache_file.stat().st_mtime
+            cache_mtime = cache_file.stat().st_mtime
+            cache_age = datetime.now().timestamp() - cache_mtime
             
-            # If cache is less than 24 hours old, use cached data
-            if cache_age < 86400:  # 24 hours in seconds
-                # Load cached player data from JSON file
-                with open(cache_file, 'r') as f:
-                    self.players_cache = json.load(f)
-                    print(f"Loaded {len(self.players_cache)} players from cache")
+            # Past the TTL but not the hard expiry: ask Sleeper whether the data
+            # changed. On 304 we renew the cache (and position views) in place
+            if (self.PLAYERS_CACHE_TTL <= cache_age < self.PLAYERS_CACHE_HARD_TTL
+                    and etag_file.exists()
+                    and await self._is_not_modified("/players/nfl", etag_file.read_text().strip())):
+                self._touch_player_cache_files(cache_file)
+                cache_mtime = cache_file.stat().st_mtime
+                cache_age = 0
+                print("Player data unchanged on Sleeper - renewed cache")
+                
+                if self.players_cache:
+                    self._players_fetched_at = cache_mtime
                     return self.players_cache
+            
+            # If cache is less than 24 hours old, use cached data
+            if cache_age < self.PLAYERS_CACHE_TTL:
+                # Load cached player data from the cache file - read + decode of the
+                # multi-MB file runs in a worker thread to keep the event loop free
+                self.players_cache = await asyncio.to_thread(_read_cache_file, cache_file)
+                self._players_fetched_at = cache_mtime
+                self._build_position_index(self.players_cache)
+                print(f"Loaded {len(self.players_cache)} players from cache")
+                return self.players_cache
         
         # Cache is stale or force_refresh requested - fetch fresh data from API
         print("Fetching fresh player data from Sleeper API...")
-        # Make API call to get all NFL players (this is the big 5MB download)
-        players_data = await self._make_request("/players/nfl")
+        # Stream the big 5MB download, keeping only the fields we use per player
+        players_data, etag = await self._stream_players("/players/nfl")
         
-        # Save the fresh data to cache file for next time
-        with open(cache_file, 'w') as f:
-            json.dump(players_data, f)
+        # Save the fresh data to cache file for next time, with its ETag alongside
+        await asyncio.to_thread(_write_cache_file, cache_file, players_data)
+        if etag:
+            etag_file.write_text(etag)
+        elif etag_file.exists():
+            etag_file.unlink()
         
-        # Store in instance variable for quick access
+        # Store in instance variable for quick access and rebuild the position index
         self.players_cache = players_data
+        self._players_fetched_at = datetime.now().timestamp()
+        self._build_position_index(players_data)
+        
+        # Also shard each position's slim, rank-sorted list to disk so a fresh process
+        # can answer a single-position query without decoding the whole database
+        await asyncio.to_thread(self._write_position_views)
         print(f"Cached {len(players_data)} players")
         
         return players_data
     
-    async def get_available_players(self, draft_id: str, position: str = None, enhanced: bool = False) -> List[Dict[str, Any]]:
+    def _build_position_index(self, players: Dict[str, Any]) -> None:
+        """
+        Pre-index the player database into rank-sorted lists per fantasy position
+        
+        Runs once whenever the player cache is loaded or refreshed, so that
+        get_available_players only has to drop drafted players from an already
+        sorted slice instead of rebuilding and re-sorting ~11,000 dicts per call.
+        
+        Args:
+            players: Dict of all players keyed by player_id (from get_all_players)
+        """
+        # Single fused pass: pull all fields with one C-level itemgetter call per
+        # player, drop inactive players and emit the clean player_info dict
+        all_players = [
+            {
+                'player_id': player_id,  # Unique identifier
+                
+                # Combine first and last name, handle missing names gracefully
+                'name': f"{first_name} {last_name}".strip(),
+                
+                'team': team,  # NFL team (BUF, KC, etc.)
+                'positions': positions or [],  # List of fantasy positions
+                
+                # Search rank from Sleeper (1 is best), unranked (None) normalized to 999
+                'rank': rank if rank is not None else 999,
+                
+                'years_exp': years_exp,  # NFL experience
+                'age': age,  # Current age
+                'injury_status': injury_status  # Injury info
+            }
+            for player_id, (first_name, last_name, team, positions, rank, years_exp, age, injury_status, active)
+            in zip(players.keys(), map(_index_fields, players.values()))
+            # Only active NFL players can be drafted
+            if active
+        ]
+        
+        by_position = {"ALL": all_players}
+        for player_info in all_players:
+            for pos in player_info['positions']:
+                by_position.setdefault(pos, []).append(player_info)
+        
+        # Sort each bucket once - lower rank = better player
+        for bucket in by_position.values():
+            bucket.sort(key=itemgetter('rank'))
+        
+        self._by_position = by_position
+        self._index_complete = True
+        self._shard_expires_at = {}
+        self._player_records = {}
+    
+    def _cache_path(self, name: str) -> Path:
+        """Path of a cache file in the data directory, using the binary format when available"""
+        suffix = ".msgpack.zst" if HAS_BINARY_CACHE else ".json"
+        return self.cache_dir / f"{name}{suffix}"
+    
+    def _touch_player_cache_files(self, cache_file: Path) -> None:
+        """Reset the mtime of the players cache and its position shards after a 304"""
+        cache_file.touch()
+        for shard_file in self.cache_dir.glob(f"players_by_pos_*{cache_file.suffix}"):
+            shard_file.touch()
+        index_file = self._cache_path("players_index")
+        if index_file.exists():
+            index_file.touch()
+    
+    def _is_fresh(self, path: Path) -> bool:
+        """True if a cache file exists and is younger than PLAYERS_CACHE_TTL"""
+        return path.exists() and datetime.now().timestamp() - path.stat().st_mtime < self.PLAYERS_CACHE_TTL
+    
+    def _write_position_views(self) -> None:
+        """
+        Shard the in-memory index to disk, one players_by_pos_{POS} file per position
+        
+        Also writes players_index (player_id -> shard names) so the full "ALL" list
+        can be rebuilt from shards alone. The index is written last, so its presence
+        means every shard it references is on disk.
+        """
+        all_players = self._by_position["ALL"]
+        shards = {position: bucket for position, bucket in self._by_position.items() if position != "ALL"}
+        shards[UNPOSITIONED_SHARD] = [p for p in all_players if not p['positions']]
+        
+        for position, bucket in shards.items():
+            _write_cache_file(self._cache_path(f"players_by_pos_{position}"), bucket)
+        
+        players_index = {p['player_id']: p['positions'] or [UNPOSITIONED_SHARD] for p in all_players}
+        _write_cache_file(self._cache_path("players_index"), players_index)
+    
+    async def _load_all_from_shards(self) -> List[Dict[str, Any]]:
+        """
+        Rebuild the rank-sorted "ALL" list by merging the on-disk position shards
+        
+        Each shard is already sorted by rank, so a k-way heapq.merge gives the
+        combined order; players listed under several positions (RB/WR) are kept once.
+        """
+        players_index = await asyncio.to_thread(_read_cache_file, self._cache_path("players_index"))
+        shard_names = sorted({name for names in players_index.values() for name in names})
+        
+        shards = await asyncio.gather(*(self._get_position_bucket(name) for name in shard_names))
+        
+        seen = set()
+        merged = []
+        for player_info in heapq.merge(*shards, key=itemgetter('rank')):
+            if player_info['player_id'] not in seen:
+                seen.add(player_info['player_id'])
+                merged.append(player_info)
+        return merged
+    
+    async def _get_position_bucket(self, position: str = None) -> List[Dict[str, Any]]:
+        """
+        Get the rank-sorted player_info list for one position
+        
+        If the full index isn't in memory yet, the fresh on-disk shard for that
+        position is loaded on its own (~50-200KB) instead of decoding the full
+        ~5MB database; position=None merges all shards. Anything else falls back
+        to get_all_players, which builds the full index.
+        
+        Args:
+            position: Fantasy position ("QB", "RB", ...) or None for all players
+            
+        Returns:
+            Rank-sorted list of active player_info dicts (empty for unknown positions)
+        """
+        key = position or "ALL"
+        
+        if not self._index_complete:
+            # A view loaded from disk earlier is only good until its file would
+            # have gone stale - after that reload it (or rebuild everything)
+            if key in self._by_position and datetime.now().timestamp() < self._shard_expires_at.get(key, 0):
+                return self._by_position[key]
+            self._by_position.pop(key, None)
+            
+            if key == "ALL":
+                source_file = self._cache_path("players_index")
+            else:
+                source_file = self._cache_path(f"players_by_pos_{key}")
+            
+            if self._is_fresh(source_file):
+                expires_at = source_file.stat().st_mtime + self.PLAYERS_CACHE_TTL
+                if key == "ALL":
+                    view = await self._load_all_from_shards()
+                else:
+                    view = await asyncio.to_thread(_read_cache_file, source_file)
+                # Merging shards may have rebuilt the full index instead
+                if not self._index_complete:
+                    self._by_position[key] = view
+                    self._shard_expires_at[key] = expires_at
+            else:
+                await self.get_all_players()
+        else:
+            # Keeps the index in step with the 24h player cache TTL
+            await self.get_all_players()
+        
+        return self._by_position.get(key, [])
+    
+    async def get_available_players(self, draft_id: str, position: str = None, enhanced: bool = False,
+                                    as_records: bool = False) -> List[Any]:
         """
         Get players still available in the draft - THIS IS THE KEY METHOD FOR DRAFT DAY
         
@@ -245,9 +985,12 @@ class SleeperClient:
             draft_id: The specific draft ID (found in league info)
             position: Optional filter by position ("QB", "RB", "WR", "TE", etc.)
             enhanced: If True, add ADP, bye weeks, and playoff data
+            as_records: If True, return PlayerSlim records instead of dicts (records
+                are cached per player, so repeated calls allocate nothing new).
+                Can't be combined with enhanced, which adds extra keys.
             
         Returns:
-            List of player dictionaries, each containing:
+            List of player dictionaries (or PlayerSlim records), each containing:
             - player_id: Unique Sleeper player identifier
             - name: Full name (first + last)
             - team: NFL team abbreviation (BUF, BAL, etc.)
@@ -264,57 +1007,31 @@ class SleeperClient:
             - playoff_outlook: Playoff matchup strength (favorable/neutral/difficult)
             - fantasy_score: Composite fantasy relevance score
         """
-        # Step 1: Get the complete NFL player database (cached for performance)
-        players = await self.get_all_players()
+        if enhanced and as_records:
+            raise ValueError("enhanced results are dicts - use as_records=False")
         
-        # Step 2: Get all picks made in this draft so far
-        picks = await self.get_draft_picks(draft_id)
+        # Steps 1-2: Load the rank-sorted player list for this position (from the
+        # in-memory index or its on-disk position view) and this draft's picks -
+        # they're independent, so fetch them concurrently
+        bucket, picks = await asyncio.gather(
+            self._get_position_bucket(position),
+            self.get_draft_picks(draft_id)
+        )
         
-        # Step 3: Create a set of already-drafted player IDs for fast lookup
-        # Using set comprehension for O(1) lookup instead of O(n) list search
-        # Only include picks that actually have a player_id (some might be empty)
-        drafted_player_ids = {pick['player_id'] for pick in picks if pick.get('player_id')}
+        # Step 3: Create a frozenset of already-drafted player IDs for O(1) lookup
+        # Bind its __contains__ once so the filter below skips the attribute lookup
+        drafted = _drafted_ids(picks).__contains__
         
-        # Step 4: Filter through all players to find available ones
-        available = []  # Will store our final list of available players
+        # Steps 4-7: The position bucket already holds active players as clean,
+        # rank-sorted player_info dicts - we only need to drop drafted players
+        available = [p for p in bucket if not drafted(p['player_id'])]
         
-        # Loop through every player in the NFL database
-        for player_id, player_data in players.items():
-            # Check if this player is still available
-            # Conditions: not drafted AND currently active in NFL
-            if player_id not in drafted_player_ids and player_data.get('active', True):
-                
-                # Step 5: Apply position filter if specified
-                # Get player's fantasy positions (could be multiple like RB/WR)
-                positions = player_data.get('fantasy_positions') or []
-                
-                # If position filter specified, check if player matches
-                # If no filter specified, include all positions
-                if not position or position in positions:
-                    
-                    # Step 6: Build clean player info dictionary with key data
-                    player_info = {
-                        'player_id': player_id,  # Unique identifier
-                        
-                        # Combine first and last name, handle missing names gracefully
-                        'name': f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip(),
-                        
-                        'team': player_data.get('team'),  # NFL team (BUF, KC, etc.)
-                        'positions': positions,  # List of fantasy positions
-                        
-                        # Search rank from Sleeper (1 is best, 999 is unranked)
-                        'rank': player_data.get('search_rank', 999),
-                        
-                        'years_exp': player_data.get('years_exp', 0),  # NFL experience
-                        'age': player_data.get('age'),  # Current age
-                        'injury_status': player_data.get('injury_status')  # Injury info
-                    }
-                    available.append(player_info)
-        
-        # Step 7: Sort by rank with None value handling
-        # Lower rank = better player (Josh Allen = rank 2, backup QB = rank 300+)
-        # Handle None values by treating them as rank 999 (unranked)
-        available.sort(key=lambda x: x['rank'] if x['rank'] is not None else 999)
+        if as_records:
+            return [self._record_for(p) for p in available]
+        
+        # The bucket's dicts are shared with the cached index - hand out copies
+        # so callers can add keys (rankings, notes...) without corrupting it
+        available = [dict(p) for p in available]
         
         # Step 8: Enhance with additional data if requested
         if enhanced:
@@ -331,6 +1048,65 @@ class SleeperClient:
         
         return available
     
+    async def get_top_available(self, draft_id: str, position: str = None, n: int = 25) -> List[Dict[str, Any]]:
+        """
+        Get only the best N available players
+        
+        Most callers show the top handful of players at a position. The position
+        buckets are already sorted by rank, so a lazy filter stops as soon as N
+        undrafted players are found - no full filtered list, no sort.
+        
+        Args:
+            draft_id: The specific draft ID
+            position: Optional filter by position ("QB", "RB", ...)
+            n: How many players to return
+            
+        Returns:
+            Up to N rank-sorted player dicts (same shape as get_available_players)
+        """
+        bucket, picks = await asyncio.gather(
+            self._get_position_bucket(position),
+            self.get_draft_picks(draft_id)
+        )
+        drafted = _drafted_ids(picks).__contains__
+        
+        # Copies, like get_available_players - the index's dicts stay untouched
+        return [dict(p) for p in islice((p for p in bucket if not drafted(p['player_id'])), n)]
+    
+    def _record_for(self, player_info: Dict[str, Any]) -> PlayerSlim:
+        """Get (or create once) the PlayerSlim record for a player_info dict"""
+        record = self._player_records.get(player_info['player_id'])
+        if record is None:
+            record = PlayerSlim.from_info(player_info)
+            self._player_records[player_info['player_id']] = record
+        return record
+    
+    async def get_available_by_positions(self, draft_id: str, positions: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get available players for several positions in one pass
+        
+        Loads each position's rank-sorted bucket and the draft picks once, then
+        drops drafted players in memory. Use this instead of calling get_available_players
+        once per position (e.g. QB, RB, WR, TE for a SUPERFLEX board).
+        
+        Args:
+            draft_id: The specific draft ID
+            positions: Positions to return ("QB", "RB", ...; None or "ALL" for everyone)
+            
+        Returns:
+            Dict mapping each requested position to its rank-sorted available players
+        """
+        *buckets, picks = await asyncio.gather(
+            *(self._get_position_bucket(position) for position in positions),
+            self.get_draft_picks(draft_id)
+        )
+        drafted = _drafted_ids(picks).__contains__
+        
+        return {
+            position: [dict(p) for p in bucket if not drafted(p['player_id'])]
+            for position, bucket in zip(positions, buckets)
+        }
+    
     async def find_draft_id_for_league(self, league_id: str = None) -> Optional[str]:
         """
         Find the draft ID for a league (useful helper method)
@@ -345,6 +1121,48 @@ class SleeperClient:
         return league_info.get('draft_id')
 
 
+def install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop when it's available
+    
+    uvloop is a drop-in, libuv-based loop that cuts per-socket-event overhead
+    for aiohttp clients. Call before asyncio.run(). Silently keeps the default
+    loop where uvloop isn't installed or supported (e.g. Windows).
+    
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def run_with_session(main: Awaitable[Any]) -> Any:
+    """
+    asyncio.run() that closes the loop's shared Sleeper session before it ends
+    
+    Use this in place of asyncio.run() for entry points that touch SleeperClient,
+    otherwise aiohttp warns about an unclosed client session at exit.
+    
+    Args:
+        main: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    async def _run() -> Any:
+        try:
+            return await main
+        finally:
+            await SleeperClient.aclose_shared()
+    
+    return asyncio.run(_run())
+
+
 # Test functions for development
 async def test_sleeper_connection():
     """Test basic Sleeper API connectivity"""
@@ -357,14 +1175,20 @@ async def test_sleeper_connection():
     
     async with SleeperClient(username=username, league_id=league_id) as client:
         try:
-            # Test 1: Get user info
+            # Tests 1, 2 and 6 are independent - fetch user, league and players concurrently
             print(f"Testing Sleeper API with username: {username}")
-            user = await client.get_user()
-            print(f"✅ User found: {user.get('display_name')} (ID: {user.get('user_id')})")
+            print(f"Testing league access with ID: {league_id}")
+            print(f"Testing player data cache...")
+            user, league, players = await asyncio.gather(
+                client.get_user(),
+                client.get_league_info(),
+                client.get_all_players()
+            )
+            
+            # Test 1: Get user info
+            print(f"\n✅ User found: {user.get('display_name')} (ID: {user.get('user_id')})")
             
             # Test 2: Get league info
-            print(f"\nTesting league access with ID: {league_id}")
-            league = await client.get_league_info()
             print(f"✅ League found: {league.get('name')} ({league.get('total_rosters')} teams)")
             print(f"   Draft status: {league.get('status')}")
             print(f"   Scoring: {league.get('scoring_settings', {}).get('rec', 'Standard')} PPR")
@@ -374,22 +1198,20 @@ async def test_sleeper_connection():
             if draft_id:
                 print(f"   Draft ID: {draft_id}")
                 
-                # Test 4: Get draft info
-                draft_info = await client.get_draft_info(draft_id)
+                # Tests 4 and 5: Draft info and existing picks only need the draft ID
+                draft_info, picks = await asyncio.gather(
+                    client.get_draft_info(draft_id),
+                    client.get_draft_picks(draft_id)
+                )
                 print(f"   Draft type: {draft_info.get('type')}")
                 print(f"   Draft status: {draft_info.get('status')}")
-                
-                # Test 5: Get any existing picks
-                picks = await client.get_draft_picks(draft_id)
                 print(f"   Picks made so far: {len(picks)}")
                 
             else:
                 print("   No draft found for this league")
             
             # Test 6: Load player data
-            print(f"\nTesting player data cache...")
-            players = await client.get_all_players()
-            print(f"✅ Loaded {len(players)} total NFL players")
+            print(f"\n✅ Loaded {len(players)} total NFL players")
             
             # Show some sample players
             sample_players = list(players.values())[:3]
@@ -412,4 +1234,5 @@ if __name__ == "__main__":
     dotenv.load_dotenv('.env.local')  # Load local credentials first
     dotenv.load_dotenv()              # Fallback to .env
     
-    asyncio.run(test_sleeper_connection())
\ No newline at end of file
+    install_uvloop()
+    run_with_session(test_sleeper_connection())
\ No newline at end of file
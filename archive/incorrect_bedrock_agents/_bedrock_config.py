@@ -0,0 +1,37 @@
+"""
+Region, model IDs and client settings shared by the AgentCore scripts
+
+BEDROCK_CFG is built on first access so importing REGION or the model IDs
+doesn't load botocore (see __getattr__ below).
+"""
+
+import functools
+
+REGION = 'us-east-1'
+
+# Foundation model the fantasy agents are deployed with
+MODEL_ID_PROD = 'anthropic.claude-3-5-sonnet-20240620-v1:0'
+# Cheaper/faster model for smoke checks that only need *a* reply
+MODEL_ID_SMOKE = 'anthropic.claude-3-haiku-20240307-v1:0'
+
+# Adaptive retries (client-side rate limiting + capped exponential backoff) so
+# Bedrock ThrottlingExceptions don't fail a run. Also used for the aioboto3
+# clients, whose AioConfig takes the same retries dict.
+BEDROCK_RETRIES = {'mode': 'adaptive', 'total_max_attempts': 10}
+
+@functools.lru_cache(maxsize=1)
+def _build_bedrock_cfg():
+    from botocore.config import Config
+
+    # Long read timeout for streamed invoke_agent replies
+    return Config(
+        retries=BEDROCK_RETRIES,
+        connect_timeout=5,
+        read_timeout=300,
+        tcp_keepalive=True
+    )
+
+def __getattr__(name):
+    if name == 'BEDROCK_CFG':
+        return _build_bedrock_cfg()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,48 @@
+"""
+Deployment bookkeeping shared by the AgentCore deploy scripts
+
+deploy_agentcore_incremental.py, deploy_fantasy_agents_to_agentcore.py and
+deploy_with_role.py all write agentcore_deployment.json and create live
+aliases - the helpers for both live here so they can't drift apart.
+"""
+
+import json
+import os
+import uuid
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+DEPLOYMENT_FILE = 'agentcore_deployment.json'
+
+def alias_client_token(agent_id: str, alias_name: str) -> str:
+    """
+    Deterministic idempotency token for create_agent_alias
+    
+    The same agent/alias pair always yields the same token, so a retried or
+    repeated create is deduplicated server-side instead of raising a conflict.
+    """
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{agent_id}:{alias_name}"))
+
+def write_deployment_file(deployment: dict, path: str = DEPLOYMENT_FILE):
+    """
+    Write deployment info atomically
+    
+    Serializes to a per-process temp file, fsyncs it and os.replace()s it over
+    the target, so a crash mid-write or two deployers running at once can never
+    leave a truncated file behind.
+    """
+    if HAS_ORJSON:
+        payload = orjson.dumps(deployment, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(deployment, indent=2).encode('utf-8')
+    
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
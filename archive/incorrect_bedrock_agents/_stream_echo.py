@@ -0,0 +1,34 @@
+"""
+Throttled terminal echo for streamed agent replies
+
+invoke_agent delivers a reply as many small chunks; flushing stdout after each
+one costs a write() syscall per chunk. StreamEcho batches them and flushes at
+most every FLUSH_BYTES bytes or FLUSH_INTERVAL seconds, whichever comes first.
+"""
+
+import sys
+import time
+
+FLUSH_BYTES = 1024
+FLUSH_INTERVAL = 0.05  # seconds
+
+class StreamEcho:
+    def __init__(self):
+        self.pending = bytearray()
+        self.last_flush = time.monotonic()
+
+    def write(self, data: bytes):
+        """Queue raw reply bytes, flushing if enough has built up"""
+        self.pending += data
+
+        now = time.monotonic()
+        if len(self.pending) >= FLUSH_BYTES or now - self.last_flush >= FLUSH_INTERVAL:
+            self.flush(now)
+
+    def flush(self, now: float = None):
+        """Write out anything queued - call once more after the stream ends"""
+        if self.pending:
+            sys.stdout.buffer.write(self.pending)
+            sys.stdout.flush()
+            self.pending.clear()
+        self.last_flush = time.monotonic() if now is None else now
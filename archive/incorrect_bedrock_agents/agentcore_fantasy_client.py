@@ -11,6 +11,9 @@ import uuid
 from typing import Dict, List, Optional, Any
 from botocore.exceptions import ClientError
 
+from _bedrock_config import REGION
+from _stream_echo import StreamEcho
+
 class FantasyAgentCoreClient:
     def __init__(self, deployment_file: str = 'agentcore_deployment.json'):
         # Load deployment info
@@ -23,7 +26,7 @@ class FantasyAgentCoreClient:
         # AgentCore runtime client (CORRECT client for invoking agents)
         self.runtime_client = boto3.client(
             'bedrock-agent-runtime', 
-            region_name=self.deployment.get('region', 'us-east-1')
+            region_name=self.deployment.get('region', REGION)
         )
         
         self.agent_ids = self.deployment['agent_ids']
@@ -60,18 +63,20 @@ class FantasyAgentCoreClient:
             
             # Process streaming response from AgentCore
             event_stream = response['completion']
-            full_response = ""
+            buf = bytearray()
             
+            print("📝 ", end='', flush=True)
+            echo = StreamEcho()
             for event in event_stream:
                 if 'chunk' in event:
                     chunk = event['chunk']
                     if 'bytes' in chunk:
-                        chunk_text = chunk['bytes'].decode('utf-8')
-                        full_response += chunk_text
-                        print(f"📝 {chunk_text}", end='', flush=True)
+                        buf += chunk['bytes']
+                        echo.write(chunk['bytes'])
+            echo.flush()
             
             print()  # New line after streaming
-            return full_response
+            return buf.decode('utf-8', errors='replace')
             
         except ClientError as e:
             print(f"❌ Error invoking {agent_name}: {e}")
@@ -196,7 +201,7 @@ Provide:
             print()
         
         print(f"🔗 Session ID: {self.session_id}")
-        print(f"🌍 Region: {self.deployment.get('region', 'us-east-1')}")
+        print(f"🌍 Region: {self.deployment.get('region', REGION)}")
 
 def main():
     """Run Fantasy Draft Assistant using AgentCore"""
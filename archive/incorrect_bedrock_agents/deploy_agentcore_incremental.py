@@ -3,70 +3,255 @@
 Incremental AgentCore Deployment - Handle timeouts and prepare agents step by step
 """
 
-import boto3
 import json
+import logging
+import os
+import random
+import sys
 import time
-from botocore.exceptions import ClientError
+from pathlib import Path
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Optional
+
+from _bedrock_config import BEDROCK_RETRIES, MODEL_ID_PROD, REGION
+from _deployment import alias_client_token, write_deployment_file
+from _instructions import DATA_COLLECTOR, ANALYSIS, STRATEGY, ADVISOR
+
+# Per-poll detail goes to the logger (set AGENTCORE_DEBUG=1 to see it); stdout
+# only gets a line when an agent's status actually changes
+logger = logging.getLogger(__name__)
+
+# boto3/botocore are imported on first use (see _ensure_boto3) so importing this
+# module for its configs - or running --help style tooling - stays cheap
+ClientError = None
+BOTO_CONFIG = None
+_SESSION = None
+_CLIENTS = {}
+
+def _ensure_boto3():
+    """
+    Import boto3 and build the shared session/config on first call
+    
+    One session and one client per (service, region) for the whole process - every
+    deployer instance reuses the same keep-alive connection pool, and adaptive
+    retries back off on throttling when several agents are being deployed at once.
+    """
+    global ClientError, BOTO_CONFIG, _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError
+    
+    BOTO_CONFIG = Config(
+        max_pool_connections=20,
+        tcp_keepalive=True,
+        retries=BEDROCK_RETRIES
+    )
+    _SESSION = boto3.Session()
+    return _SESSION
+
+def get_client(service_name: str, region_name: str):
+    """Return the shared boto3 client for a service/region, creating it on first use"""
+    key = (service_name, region_name)
+    client = _CLIENTS.get(key)
+    if client is None:
+        session = _ensure_boto3()
+        client = _CLIENTS[key] = session.client(service_name, region_name=region_name, config=BOTO_CONFIG)
+    return client
+
+# list_agents results are reused across re-runs for a short window - iterating on
+# this script otherwise re-fetches the same agent list every time
+AGENTS_CACHE_PATH = Path.home() / '.cache' / 'fantasyagent' / 'agents.json'
+AGENTS_CACHE_TTL = 60  # seconds
+
+# Per-agent pipeline retries - a transient failure on one agent is retried
+# on its own instead of failing (or restarting) the whole deployment
+DEPLOY_MAX_RETRIES = 3
+DEPLOY_RETRY_DELAY = 60  # seconds
+
+# Read-only agent definitions, built once at import rather than per deploy
+AGENT_CONFIGS = (
+    MappingProxyType({
+        'name': 'fantasy-data-collector',
+        'description': 'Collects and aggregates fantasy football data from multiple sources',
+        'instruction': DATA_COLLECTOR,
+        'tags': {
+            'Project': 'FantasyDraftAssistant',
+            'AgentType': 'DataCollector',
+            'Environment': 'Production'
+        }
+    }),
+    MappingProxyType({
+        'name': 'fantasy-analysis-agent',
+        'description': 'Analyzes player data and provides statistical insights',
+        'instruction': ANALYSIS,
+        'tags': {
+            'Project': 'FantasyDraftAssistant',
+            'AgentType': 'Analysis',
+            'Environment': 'Production'
+        }
+    }),
+    MappingProxyType({
+        'name': 'fantasy-strategy-agent',
+        'description': 'Develops optimal draft strategies and contingency plans',
+        'instruction': STRATEGY,
+        'tags': {
+            'Project': 'FantasyDraftAssistant',
+            'AgentType': 'Strategy',
+            'Environment': 'Production'
+        }
+    }),
+    MappingProxyType({
+        'name': 'fantasy-draft-advisor',
+        'description': 'Provides real-time draft recommendations and advice',
+        'instruction': ADVISOR,
+        'tags': {
+            'Project': 'FantasyDraftAssistant',
+            'AgentType': 'Advisor',
+            'Environment': 'Production'
+        }
+    })
+)
+
+_TERMINAL_STATUSES = frozenset({'FAILED', 'DELETING'})
+
+# Fixed parts of each agent's live alias - only the agent name varies per call
+_ALIAS_SUFFIX = "-live"
+_BASE_ALIAS_TAGS = {'Environment': 'Production'}
+
+@dataclass(slots=True)
+class AgentRecord:
+    """Deployment state for one agent"""
+    id: str
+    status: str
+    alias_id: Optional[str] = None
 
 class IncrementalAgentDeployer:
-    def __init__(self, region_name: str = 'us-east-1'):
+    def __init__(self, region_name: str = REGION):
         self.region_name = region_name
-        self.agent_client = boto3.client('bedrock-agent', region_name=region_name)
-        self.runtime_client = boto3.client('bedrock-agent-runtime', region_name=region_name)
-        self.foundation_model = 'anthropic.claude-3-5-sonnet-20240620-v1:0'
+        _ensure_boto3()
+        self.agent_client = get_client('bedrock-agent', region_name)
+        self.runtime_client = get_client('bedrock-agent-runtime', region_name)
+        self.foundation_model = MODEL_ID_PROD
+        
+        # Same region can mean different accounts - key the cache by profile too
+        self._agents_cache_key = f"{region_name}:{_SESSION.profile_name}"
+        self._existing_agents = None
+        self._account_id = None
         
     def check_existing_agents(self) -> dict:
         """Check what agents already exist"""
+        if self._existing_agents is not None:
+            return self._existing_agents
+        
+        cached = self._load_agents_cache()
+        if cached is not None:
+            print("🔍 Using cached AgentCore agent list...")
+            for name, info in cached.items():
+                print(f"📤 {name}: {info['id']} (Status: {info['status']})")
+            self._existing_agents = cached
+            return cached
+        
         try:
-            response = self.agent_client.list_agents()
+            # list_agents is paged - without the paginator, agents past the first
+            # page look missing and we'd try (and fail) to create them again
+            paginator = self.agent_client.get_paginator('list_agents')
+            pages = paginator.paginate(PaginationConfig={'PageSize': 100})
             agents = {}
             
             print("🔍 Checking existing AgentCore agents...")
             
-            for agent in response.get('agentSummaries', []):
-                name = agent['agentName']
-                agent_id = agent['agentId']
-                status = agent['agentStatus']
-                
-                print(f"📤 {name}: {agent_id} (Status: {status})")
-                agents[name] = {
-                    'id': agent_id,
-                    'status': status
-                }
+            for page in pages:
+                for agent in page.get('agentSummaries', []):
+                    name = agent['agentName']
+                    agent_id = agent['agentId']
+                    status = agent['agentStatus']
+                    
+                    print(f"📤 {name}: {agent_id} (Status: {status})")
+                    agents[name] = {
+                        'id': agent_id,
+                        'status': status
+                    }
             
+            self._existing_agents = agents
+            self._save_agents_cache(agents)
             return agents
             
         except ClientError as e:
             print(f"❌ Error checking agents: {e}")
             return {}
     
+    def _load_agents_cache(self):
+        """Return the cached agent list if it's younger than AGENTS_CACHE_TTL, else None"""
+        try:
+            if time.time() - AGENTS_CACHE_PATH.stat().st_mtime > AGENTS_CACHE_TTL:
+                return None
+            with open(AGENTS_CACHE_PATH, 'r') as f:
+                return json.load(f).get(self._agents_cache_key)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_agents_cache(self, agents: dict):
+        """Persist the agent list for this region/profile"""
+        try:
+            AGENTS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(AGENTS_CACHE_PATH, 'w') as f:
+                json.dump({self._agents_cache_key: agents}, f)
+        except OSError as e:
+            print(f"⚠️ Could not write agent cache: {e}")
+    
+    def invalidate_agents_cache(self):
+        """Drop cached agent state once we've created or prepared an agent"""
+        self._existing_agents = None
+        self._account_id = None
+        try:
+            AGENTS_CACHE_PATH.unlink()
+        except FileNotFoundError:
+            pass
+    
     def prepare_agent(self, agent_id: str, agent_name: str) -> bool:
         """Prepare an agent that's in NOT_PREPARED status"""
         try:
             print(f"🔧 Preparing {agent_name} (ID: {agent_id})...")
             
-            # Prepare the agent
-            self.agent_client.prepare_agent(agentId=agent_id)
+            # Prepare the agent - the response already carries the new status,
+            # so we only start polling if it isn't terminal yet
+            status = self.agent_client.prepare_agent(agentId=agent_id).get('agentStatus')
+            self.invalidate_agents_cache()
             
             print(f"⏳ Waiting for {agent_name} to be prepared...")
             
             # Wait for preparation (this can take several minutes)
             max_wait = 600  # 10 minutes
             start_time = time.time()
+            attempt = 0
+            last_status = None
             
             while time.time() - start_time < max_wait:
-                response = self.agent_client.get_agent(agentId=agent_id)
-                status = response['agent']['agentStatus']
+                if status is None:
+                    response = self.agent_client.get_agent(agentId=agent_id)
+                    status = response['agent']['agentStatus']
                 
                 if status == 'PREPARED':
                     print(f"✅ {agent_name} is now PREPARED!")
                     return True
-                elif status in ['FAILED', 'DELETING']:
+                elif status in _TERMINAL_STATUSES:
                     print(f"❌ {agent_name} failed with status: {status}")
                     return False
                 else:
-                    print(f"⏳ {agent_name} status: {status} (waiting...)")
-                    time.sleep(30)  # Check every 30 seconds
+                    # Exponential backoff capped at 30s, plus jitter - fast preparations
+                    # are noticed within a second or two instead of a full 30s tick
+                    delay = min(30, 2 ** attempt) + random.uniform(0, 1)
+                    attempt += 1
+                    if status != last_status:
+                        print(f"⏳ {agent_name} status: {status} (waiting...)")
+                        last_status = status
+                    logger.debug("%s status %s, next check in %.1fs", agent_name, status, delay)
+                    time.sleep(delay)
+                    status = None
                     
             print(f"⚠️ {agent_name} not prepared after {max_wait} seconds")
             return False
@@ -91,6 +276,7 @@ class IncrementalAgentDeployer:
             
             agent_id = response['agent']['agentId']
             print(f"✅ {agent_config['name']} created with ID: {agent_id}")
+            self.invalidate_agents_cache()
             
             return agent_id
             
@@ -98,17 +284,41 @@ class IncrementalAgentDeployer:
             print(f"❌ Failed to create {agent_config['name']}: {e}")
             return None
     
-    def create_agent_alias(self, agent_id: str, agent_name: str) -> str:
-        """Create alias for a prepared agent"""
+    def find_agent_alias(self, agent_id: str, alias_name: str):
+        """Return the ID of an existing alias with this name, or None"""
+        paginator = self.agent_client.get_paginator('list_agent_aliases')
+        for page in paginator.paginate(agentId=agent_id):
+            for alias in page.get('agentAliasSummaries', []):
+                if alias['agentAliasName'] == alias_name:
+                    return alias['agentAliasId']
+        return None
+    
+    def create_agent_alias(self, agent_id: str, agent_name: str, check_existing: bool = True) -> str:
+        """
+        Create alias for a prepared agent
+        
+        Args:
+            agent_id: Prepared agent to alias
+            agent_name: Agent name (alias is named agent_name + "-live")
+            check_existing: Look for an existing live alias first. Re-runs hit this
+                            for every agent, and creating a duplicate alias only
+                            fails with a ConflictException after a full round-trip.
+                            Freshly created agents can skip the lookup.
+        """
+        alias_name = agent_name + _ALIAS_SUFFIX
         try:
+            if check_existing:
+                alias_id = self.find_agent_alias(agent_id, alias_name)
+                if alias_id:
+                    print(f"✅ Alias for {agent_name} already exists: {alias_id}")
+                    return alias_id
+            
             response = self.agent_client.create_agent_alias(
                 agentId=agent_id,
-                agentAliasName=f"{agent_name}-live",
+                agentAliasName=alias_name,
+                clientToken=alias_client_token(agent_id, alias_name),
                 description=f"Live production alias for {agent_name}",
-                tags={
-                    'Environment': 'Production',
-                    'AgentName': agent_name
-                }
+                tags={**_BASE_ALIAS_TAGS, 'AgentName': agent_name}
             )
             
             alias_id = response['agentAlias']['agentAliasId']
@@ -120,180 +330,169 @@ class IncrementalAgentDeployer:
             print(f"❌ Failed to create alias for {agent_name}: {e}")
             return None
     
-    def get_agent_configs(self) -> list:
+    def get_agent_configs(self) -> tuple:
         """Get all agent configurations"""
-        return [
-            {
-                'name': 'fantasy-data-collector',
-                'description': 'Collects and aggregates fantasy football data from multiple sources',
-                'instruction': '''You are a Fantasy Football Data Collector Agent. Your role is to:
-
-1. Gather player data from multiple sources (FantasyPros, Yahoo, ESPN)
-2. Collect real-time injury reports and news
-3. Aggregate ADP (Average Draft Position) data
-4. Compile player rankings across different scoring formats
-5. Collect weather and game conditions
-6. Format data for analysis agents
-
-Always return structured JSON data. Focus on accuracy and completeness.
-Handle API failures gracefully with fallback data sources.''',
-                'tags': {
-                    'Project': 'FantasyDraftAssistant',
-                    'AgentType': 'DataCollector',
-                    'Environment': 'Production'
-                }
-            },
-            {
-                'name': 'fantasy-analysis-agent',
-                'description': 'Analyzes player data and provides statistical insights',
-                'instruction': '''You are a Fantasy Football Analysis Agent. Your role is to:
-
-1. Analyze player performance trends and patterns
-2. Evaluate matchup advantages and disadvantages  
-3. Calculate value-based rankings and positional scarcity
-4. Assess injury impact and return timelines
-5. Analyze target share, snap counts, and usage patterns
-6. Provide statistical projections and confidence intervals
-
-Use advanced analytics and historical data patterns.
-Consider league scoring format (SUPERFLEX prioritizes QBs).
-Provide clear reasoning for all analysis conclusions.''',
-                'tags': {
-                    'Project': 'FantasyDraftAssistant',
-                    'AgentType': 'Analysis',
-                    'Environment': 'Production'
-                }
-            },
-            {
-                'name': 'fantasy-strategy-agent',
-                'description': 'Develops optimal draft strategies and contingency plans',
-                'instruction': '''You are a Fantasy Football Strategy Agent. Your role is to:
-
-1. Develop draft strategies based on league settings and format
-2. Calculate optimal draft position approaches (early QB in SUPERFLEX)
-3. Identify value picks and sleepers at each draft position
-4. Plan contingency strategies for different draft flows
-5. Balance risk vs reward for each draft choice
-6. Adapt strategy based on other managers' selections
-
-Consider SUPERFLEX format where QBs have premium value.
-Account for positional scarcity and bye week considerations.
-Provide multiple strategic options with clear trade-offs.''',
-                'tags': {
-                    'Project': 'FantasyDraftAssistant',
-                    'AgentType': 'Strategy',
-                    'Environment': 'Production'
-                }
-            },
-            {
-                'name': 'fantasy-draft-advisor',
-                'description': 'Provides real-time draft recommendations and advice',
-                'instruction': '''You are a Fantasy Football Draft Advisor Agent. Your role is to:
-
-1. Provide real-time draft pick recommendations
-2. Synthesize input from data, analysis, and strategy agents  
-3. Communicate clearly with fantasy managers during live drafts
-4. Explain reasoning behind each recommendation
-5. Adapt advice based on draft flow and available players
-6. Handle time pressure of live draft situations
-
-Be concise but thorough in explanations.
-Prioritize actionable advice over complex analysis.
-Always provide backup options in case primary pick is taken.
-Consider the human manager's preferences and risk tolerance.''',
-                'tags': {
-                    'Project': 'FantasyDraftAssistant',
-                    'AgentType': 'Advisor',
-                    'Environment': 'Production'
-                }
-            }
-        ]
+        return AGENT_CONFIGS
     
-    def deploy_step_by_step(self):
-        """Deploy agents step by step with status checking"""
+    def deploy_single_agent(self, config: dict, existing_agents: dict):
+        """
+        Run the create → prepare → alias pipeline for one agent, with retries
         
-        print("🚀 INCREMENTAL AGENTCORE DEPLOYMENT")
-        print("=" * 50)
+        Agents are independent, so one failing doesn't stop the others, and a
+        retry (or a later re-run) picks up an agent that was already created
+        via check_existing_agents instead of creating it again.
         
-        # Check existing agents
-        existing_agents = self.check_existing_agents()
+        Args:
+            config: Entry from get_agent_configs()
+            existing_agents: Result of check_existing_agents()
+            
+        Returns:
+            AgentRecord for the agent, or None if every attempt failed
+        """
+        agent_name = config['name']
         
-        # Get agent configs
-        agent_configs = self.get_agent_configs()
+        for attempt in range(1, DEPLOY_MAX_RETRIES + 1):
+            record = self._run_agent_pipeline(config, existing_agents)
+            if record:
+                return record
+            
+            if attempt < DEPLOY_MAX_RETRIES:
+                print(f"🔁 {agent_name} not ready (attempt {attempt}/{DEPLOY_MAX_RETRIES}), "
+                      f"retrying in {DEPLOY_RETRY_DELAY}s...")
+                time.sleep(DEPLOY_RETRY_DELAY)
+                # The memoized/disk agent list still shows the status that made
+                # this attempt fail - drop it so the re-check sees fresh statuses
+                self.invalidate_agents_cache()
+                existing_agents = self.check_existing_agents()
         
-        deployment_status = {}
+        print(f"❌ {agent_name} failed after {DEPLOY_MAX_RETRIES} attempts")
+        return None
+    
+    def _run_agent_pipeline(self, config: dict, existing_agents: dict):
+        """Single attempt at create → prepare → alias for one agent"""
+        agent_name = config['name']
         
-        for config in agent_configs:
-            agent_name = config['name']
+        if agent_name in existing_agents:
+            # Agent exists, check status
+            existing_info = existing_agents[agent_name]
+            agent_id = existing_info['id']
+            status = existing_info['status']
             
-            if agent_name in existing_agents:
-                # Agent exists, check status
-                existing_info = existing_agents[agent_name]
-                agent_id = existing_info['id']
-                status = existing_info['status']
-                
-                print(f"\n🔍 {agent_name} already exists (Status: {status})")
-                
-                if status == 'NOT_PREPARED':
-                    # Prepare the agent
-                    if self.prepare_agent(agent_id, agent_name):
-                        deployment_status[agent_name] = {
-                            'id': agent_id,
-                            'status': 'PREPARED'
-                        }
-                elif status == 'PREPARED':
-                    print(f"✅ {agent_name} already prepared")
-                    deployment_status[agent_name] = {
-                        'id': agent_id,
-                        'status': 'PREPARED'
-                    }
+            print(f"\n🔍 {agent_name} already exists (Status: {status})")
+            
+            if status == 'NOT_PREPARED':
+                # Prepare the agent
+                if not self.prepare_agent(agent_id, agent_name):
+                    return None
+            elif status == 'PREPARED':
+                print(f"✅ {agent_name} already prepared")
             else:
-                # Create new agent
-                print(f"\n🆕 Creating new agent: {agent_name}")
-                agent_id = self.create_single_agent(config)
-                
-                if agent_id:
-                    # Prepare the newly created agent
-                    if self.prepare_agent(agent_id, agent_name):
-                        deployment_status[agent_name] = {
-                            'id': agent_id,
-                            'status': 'PREPARED'
-                        }
+                return None
+        else:
+            # Create new agent
+            print(f"\n🆕 Creating new agent: {agent_name}")
+            agent_id = self.create_single_agent(config)
+            
+            # Prepare the newly created agent
+            if not agent_id or not self.prepare_agent(agent_id, agent_name):
+                return None
         
-        # Create aliases for prepared agents
-        aliases = {}
-        for agent_name, info in deployment_status.items():
-            if info['status'] == 'PREPARED':
-                alias_id = self.create_agent_alias(info['id'], agent_name)
-                if alias_id:
-                    aliases[agent_name] = alias_id
+        return AgentRecord(
+            id=agent_id,
+            status='PREPARED',
+            alias_id=self.create_agent_alias(
+                agent_id, agent_name, check_existing=agent_name in existing_agents
+            )
+        )
+    
+    def get_account_id(self):
+        """AWS account ID for alias ARNs - one STS call per deployer, None if unavailable"""
+        if self._account_id is None:
+            try:
+                self._account_id = get_client('sts', self.region_name).get_caller_identity()['Account']
+            except ClientError as e:
+                print(f"⚠️ Could not look up AWS account ID: {e}")
+        return self._account_id
+    
+    def _save_deployment(self, deployment_status: Dict[str, AgentRecord]) -> dict:
+        """Write agentcore_deployment.json from the agents processed so far"""
+        aliases = {
+            name: record.alias_id
+            for name, record in deployment_status.items()
+            if record.alias_id
+        }
+        
+        # Full alias ARNs are precomputed here so consumers don't need their own
+        # STS lookup (or string building) to address an agent alias
+        account_id = self.get_account_id()
+        alias_arns = {
+            name: f"arn:aws:bedrock:{self.region_name}:{account_id}:agent-alias/{deployment_status[name].id}/{alias_id}"
+            for name, alias_id in aliases.items()
+        } if account_id else {}
         
-        # Save deployment info
         final_deployment = {
-            'agent_ids': {name: info['id'] for name, info in deployment_status.items()},
+            'agent_ids': {name: record.id for name, record in deployment_status.items()},
             'aliases': aliases,
+            'alias_arns': alias_arns,
             'deployment_time': time.time(),
             'region': self.region_name,
             'foundation_model': self.foundation_model
         }
         
-        with open('agentcore_deployment.json', 'w') as f:
-            json.dump(final_deployment, f, indent=2)
+        write_deployment_file(final_deployment)
+        
+        return final_deployment
+    
+    def deploy_step_by_step(self):
+        """Deploy agents step by step with status checking"""
+        
+        print("🚀 INCREMENTAL AGENTCORE DEPLOYMENT")
+        print("=" * 50)
+        
+        # Check existing agents
+        existing_agents = self.check_existing_agents()
+        
+        # Get agent configs
+        agent_configs = self.get_agent_configs()
+        
+        deployment_status: Dict[str, AgentRecord] = {}
+        final_deployment = None
+        
+        for config in agent_configs:
+            record = self.deploy_single_agent(config, existing_agents)
+            if record:
+                deployment_status[config['name']] = record
+                
+                # Checkpoint after every agent so a crash part-way through
+                # keeps the record of everything deployed so far
+                final_deployment = self._save_deployment(deployment_status)
+        
+        if final_deployment is None:
+            final_deployment = self._save_deployment(deployment_status)
         
         print(f"\n🎉 DEPLOYMENT COMPLETE!")
         print(f"✅ {len(deployment_status)} agents processed")
-        print(f"✅ {len(aliases)} aliases created")
+        print(f"✅ {len(final_deployment['aliases'])} aliases created")
         print(f"📁 Deployment saved to: agentcore_deployment.json")
         
         return final_deployment
 
 def main():
+    logging.basicConfig(level=logging.DEBUG if os.getenv('AGENTCORE_DEBUG') else logging.WARNING)
+    
     deployer = IncrementalAgentDeployer()
     deployment = deployer.deploy_step_by_step()
     
-    if deployment:
+    if deployment and '--run-client' in sys.argv[1:]:
+        # Run the client in this process - reuses the already-imported SDK
+        from agentcore_fantasy_client import FantasyAgentCoreClient
+        
+        client = FantasyAgentCoreClient()
+        client.list_deployed_agents()
+        client.run_complete_draft_analysis()
+    elif deployment:
         print("\n🎯 Next Steps:")
-        print("1. Run: python3 agentcore_fantasy_client.py")
+        print("1. Run: python3 agentcore_fantasy_client.py (or re-run this with --run-client)")
         print("2. Test agent invocations via AgentCore runtime")
         print("3. Integrate with web UI for live draft assistance")
 
@@ -4,219 +4,212 @@ Deploy Fantasy Draft Agents to Bedrock AgentCore Runtime
 CORRECT APPROACH: Deploy agents TO AgentCore, then invoke via runtime
 """
 
-import boto3
-import json
+import asyncio
+import logging
+import os
+import random
+import sys
 import time
 from typing import Dict, List, Optional
-from botocore.exceptions import ClientError
 
-class FantasyAgentCoreDeployer:
-    def __init__(self, region_name: str = 'us-east-1'):
-        self.region_name = region_name
-        self.agent_client = boto3.client('bedrock-agent', region_name=region_name)
-        self.runtime_client = boto3.client('bedrock-agent-runtime', region_name=region_name)
-        
-        # Foundation model for agents (AgentCore manages this internally)
-        self.foundation_model = 'anthropic.claude-3-5-sonnet-20240620-v1:0'
-        
-    def create_data_collector_agent(self) -> Optional[str]:
-        """Create Data Collector Agent in AgentCore"""
-        
-        print("🏗️ Creating Data Collector Agent...")
-        
-        agent_instruction = """You are a Fantasy Football Data Collector Agent. Your role is to:
+from _bedrock_config import BEDROCK_RETRIES, MODEL_ID_PROD, REGION
+from _deployment import alias_client_token, write_deployment_file
+from _instructions import DATA_COLLECTOR, ANALYSIS, STRATEGY, ADVISOR
 
-1. Gather player data from multiple sources (FantasyPros, Yahoo, ESPN)
-2. Collect real-time injury reports and news
-3. Aggregate ADP (Average Draft Position) data
-4. Compile player rankings across different scoring formats
-5. Collect weather and game conditions
-6. Format data for analysis agents
+# Per-poll detail goes to the logger (set AGENTCORE_DEBUG=1 to see it); stdout
+# only gets a line when an agent's status actually changes
+logger = logging.getLogger(__name__)
 
-Always return structured JSON data. Focus on accuracy and completeness.
-Handle API failures gracefully with fallback data sources.
-"""
-        
-        try:
-            response = self.agent_client.create_agent(
-                agentName='fantasy-data-collector',
-                description='Collects and aggregates fantasy football data from multiple sources',
-                foundationModel=self.foundation_model,
-                instruction=agent_instruction,
-                idleSessionTTLInSeconds=1800,  # 30 minutes
-                tags={
-                    'Project': 'FantasyDraftAssistant',
-                    'AgentType': 'DataCollector',
-                    'Environment': 'Production'
-                }
-            )
-            
-            agent_id = response['agent']['agentId']
-            print(f"✅ Data Collector Agent created: {agent_id}")
-            
-            # Wait for agent to be ready
-            self._wait_for_agent_ready(agent_id)
-            
-            return agent_id
-            
-        except ClientError as e:
-            print(f"❌ Failed to create Data Collector Agent: {e}")
-            return None
+# aioboto3/botocore are imported on first use (see _ensure_aioboto3) so importing
+# AGENT_CONFIGS from this module doesn't pay for the AWS SDK import chain
+ClientError = None
+BOTO_CONFIG = None
+_SESSION = None
+
+def _ensure_aioboto3():
+    """
+    Import aioboto3 and build the shared session/config on first call
     
-    def create_analysis_agent(self) -> Optional[str]:
-        """Create Analysis Agent in AgentCore"""
-        
-        print("🏗️ Creating Analysis Agent...")
-        
-        agent_instruction = """You are a Fantasy Football Analysis Agent. Your role is to:
+    Shared by every deployer in the process - pooled keep-alive connections and
+    adaptive retries so concurrent create/alias/invoke calls back off on throttling.
+    """
+    global ClientError, BOTO_CONFIG, _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    
+    import aioboto3
+    from aiobotocore.config import AioConfig
+    from botocore.exceptions import ClientError
+    
+    BOTO_CONFIG = AioConfig(
+        max_pool_connections=20,
+        retries=BEDROCK_RETRIES
+    )
+    _SESSION = aioboto3.Session()
+    return _SESSION
 
-1. Analyze player performance trends and patterns
-2. Evaluate matchup advantages and disadvantages  
-3. Calculate value-based rankings and positional scarcity
-4. Assess injury impact and return timelines
-5. Analyze target share, snap counts, and usage patterns
-6. Provide statistical projections and confidence intervals
+# One entry per agent - drives _create_agent so the four agents share one code path
+AGENT_CONFIGS = (
+    {
+        'key': 'data-collector',
+        'label': 'Data Collector Agent',
+        'name': 'fantasy-data-collector',
+        'description': 'Collects and aggregates fantasy football data from multiple sources',
+        'instruction': DATA_COLLECTOR,
+        'tags': {
+            'Project': 'FantasyDraftAssistant',
+            'AgentType': 'DataCollector',
+            'Environment': 'Production'
+        }
+    },
+    {
+        'key': 'analysis',
+        'label': 'Analysis Agent',
+        'name': 'fantasy-analysis-agent',
+        'description': 'Analyzes player data and provides statistical insights',
+        'instruction': ANALYSIS,
+        'tags': {
+            'Project': 'FantasyDraftAssistant',
+            'AgentType': 'Analysis',
+            'Environment': 'Production'
+        }
+    },
+    {
+        'key': 'strategy',
+        'label': 'Strategy Agent',
+        'name': 'fantasy-strategy-agent',
+        'description': 'Develops optimal draft strategies and contingency plans',
+        'instruction': STRATEGY,
+        'tags': {
+            'Project': 'FantasyDraftAssistant',
+            'AgentType': 'Strategy',
+            'Environment': 'Production'
+        }
+    },
+    {
+        'key': 'advisor',
+        'label': 'Advisor Agent',
+        'name': 'fantasy-draft-advisor',
+        'description': 'Provides real-time draft recommendations and advice',
+        'instruction': ADVISOR,
+        'tags': {
+            'Project': 'FantasyDraftAssistant',
+            'AgentType': 'Advisor',
+            'Environment': 'Production'
+        }
+    },
+)
 
-Use advanced analytics and historical data patterns.
-Consider league scoring format (SUPERFLEX prioritizes QBs).
-Provide clear reasoning for all analysis conclusions.
-"""
+_TERMINAL_STATUSES = frozenset({'FAILED', 'DELETING'})
+
+# Fixed parts of each agent's live alias - only the agent name varies per call
+_ALIAS_SUFFIX = "-live"
+_BASE_ALIAS_TAGS = {'Environment': 'Production'}
+
+class FantasyAgentCoreDeployer:
+    def __init__(self, region_name: str = REGION, max_concurrency: int = 4):
+        self.region_name = region_name
         
-        try:
-            response = self.agent_client.create_agent(
-                agentName='fantasy-analysis-agent',
-                description='Analyzes player data and provides statistical insights',
-                foundationModel=self.foundation_model,
-                instruction=agent_instruction,
-                idleSessionTTLInSeconds=1800,
-                tags={
-                    'Project': 'FantasyDraftAssistant',
-                    'AgentType': 'Analysis',
-                    'Environment': 'Production'
-                }
-            )
-            
-            agent_id = response['agent']['agentId']
-            print(f"✅ Analysis Agent created: {agent_id}")
-            
-            self._wait_for_agent_ready(agent_id)
-            
-            return agent_id
-            
-        except ClientError as e:
-            print(f"❌ Failed to create Analysis Agent: {e}")
-            return None
-    
-    def create_strategy_agent(self) -> Optional[str]:
-        """Create Strategy Agent in AgentCore"""
+        # aioboto3 clients are async context managers - they're opened for the
+        # duration of deploy_all_agents so all agents can be created concurrently
+        self.session = _ensure_aioboto3()
+        self.agent_client = None
+        self.runtime_client = None
         
-        print("🏗️ Creating Strategy Agent...")
+        # Cap concurrent create_agent calls to stay inside Bedrock rate limits
+        self.create_semaphore = asyncio.Semaphore(max_concurrency)
         
-        agent_instruction = """You are a Fantasy Football Strategy Agent. Your role is to:
-
-1. Develop draft strategies based on league settings and format
-2. Calculate optimal draft position approaches (early QB in SUPERFLEX)
-3. Identify value picks and sleepers at each draft position
-4. Plan contingency strategies for different draft flows
-5. Balance risk vs reward for each draft choice
-6. Adapt strategy based on other managers' selections
-
-Consider SUPERFLEX format where QBs have premium value.
-Account for positional scarcity and bye week considerations.
-Provide multiple strategic options with clear trade-offs.
-"""
+        # Foundation model for agents (AgentCore manages this internally)
+        self.foundation_model = MODEL_ID_PROD
         
-        try:
-            response = self.agent_client.create_agent(
-                agentName='fantasy-strategy-agent',
-                description='Develops optimal draft strategies and contingency plans',
-                foundationModel=self.foundation_model,
-                instruction=agent_instruction,
-                idleSessionTTLInSeconds=1800,
-                tags={
-                    'Project': 'FantasyDraftAssistant',
-                    'AgentType': 'Strategy', 
-                    'Environment': 'Production'
-                }
-            )
-            
-            agent_id = response['agent']['agentId']
-            print(f"✅ Strategy Agent created: {agent_id}")
-            
-            self._wait_for_agent_ready(agent_id)
-            
-            return agent_id
-            
-        except ClientError as e:
-            print(f"❌ Failed to create Strategy Agent: {e}")
-            return None
-    
-    def create_advisor_agent(self) -> Optional[str]:
-        """Create Advisor Agent in AgentCore"""
+    async def _create_agent(self, config: dict) -> Optional[str]:
+        """
+        Create one agent in AgentCore and wait for it to be ready
         
-        print("🏗️ Creating Advisor Agent...")
+        Args:
+            config: Entry from AGENT_CONFIGS
+            
+        Returns:
+            Agent ID, or None if creation failed
+        """
         
-        agent_instruction = """You are a Fantasy Football Draft Advisor Agent. Your role is to:
-
-1. Provide real-time draft pick recommendations
-2. Synthesize input from data, analysis, and strategy agents  
-3. Communicate clearly with fantasy managers during live drafts
-4. Explain reasoning behind each recommendation
-5. Adapt advice based on draft flow and available players
-6. Handle time pressure of live draft situations
-
-Be concise but thorough in explanations.
-Prioritize actionable advice over complex analysis.
-Always provide backup options in case primary pick is taken.
-Consider the human manager's preferences and risk tolerance.
-"""
+        print(f"🏗️ Creating {config['label']}...")
         
         try:
-            response = self.agent_client.create_agent(
-                agentName='fantasy-draft-advisor',
-                description='Provides real-time draft recommendations and advice',
-                foundationModel=self.foundation_model,
-                instruction=agent_instruction,
-                idleSessionTTLInSeconds=1800,
-                tags={
-                    'Project': 'FantasyDraftAssistant',
-                    'AgentType': 'Advisor',
-                    'Environment': 'Production'
-                }
-            )
+            async with self.create_semaphore:
+                response = await self.agent_client.create_agent(
+                    agentName=config['name'],
+                    description=config['description'],
+                    foundationModel=self.foundation_model,
+                    instruction=config['instruction'],
+                    idleSessionTTLInSeconds=1800,  # 30 minutes
+                    tags=config['tags']
+                )
             
             agent_id = response['agent']['agentId']
-            print(f"✅ Advisor Agent created: {agent_id}")
+            print(f"✅ {config['label']} created: {agent_id}")
             
-            self._wait_for_agent_ready(agent_id)
+            # Wait for agent to be ready
+            await self._wait_for_agent_ready(agent_id, status=response['agent']['agentStatus'])
             
             return agent_id
             
         except ClientError as e:
-            print(f"❌ Failed to create Advisor Agent: {e}")
+            print(f"❌ Failed to create {config['label']}: {e}")
             return None
     
-    def _wait_for_agent_ready(self, agent_id: str, max_wait: int = 300):
-        """Wait for agent to be in PREPARED state"""
+    async def _wait_for_agent_ready(self, agent_id: str, max_wait: int = 300,
+                                    status: Optional[str] = None):
+        """
+        Wait for agent to be in PREPARED state
+        
+        A freshly created agent sits in NOT_PREPARED until prepare_agent is called,
+        so the moment creation finishes we submit the prepare in the same pass
+        instead of sleeping another poll tick first.
+        
+        Args:
+            agent_id: Agent to wait on
+            max_wait: Give up after this many seconds
+            status: Status already returned by the create/prepare call, if any.
+                    A terminal status here returns without a single get_agent call.
+        """
         
         print(f"⏳ Waiting for agent {agent_id} to be ready...")
         
         start_time = time.time()
+        attempt = 0
+        last_status = None
+        prepare_submitted = False
         
         while time.time() - start_time < max_wait:
             try:
-                response = self.agent_client.get_agent(agentId=agent_id)
-                status = response['agent']['agentStatus']
+                if status is None:
+                    response = await self.agent_client.get_agent(agentId=agent_id)
+                    status = response['agent']['agentStatus']
                 
                 if status == 'PREPARED':
                     print(f"✅ Agent {agent_id} is ready!")
                     return True
-                elif status in ['FAILED', 'DELETING']:
+                elif status in _TERMINAL_STATUSES:
                     print(f"❌ Agent {agent_id} failed with status: {status}")
                     return False
+                elif status == 'NOT_PREPARED' and not prepare_submitted:
+                    print(f"🔧 Preparing agent {agent_id}...")
+                    response = await self.agent_client.prepare_agent(agentId=agent_id)
+                    status = response.get('agentStatus')
+                    prepare_submitted = True
+                    attempt = 0  # restart backoff for the preparation phase
                 else:
-                    print(f"⏳ Agent status: {status}, waiting...")
-                    time.sleep(10)
+                    # Exponential backoff (1s, 2s, 4s ... capped at 30s) with jitter so
+                    # agents polled in parallel don't hit get_agent in lockstep
+                    delay = min(30, 2 ** attempt) + random.uniform(0, 1)
+                    attempt += 1
+                    if status != last_status:
+                        print(f"⏳ Agent {agent_id} status: {status}, waiting...")
+                        last_status = status
+                    logger.debug("%s status %s, next check in %.1fs", agent_id, status, delay)
+                    await asyncio.sleep(delay)
+                    status = None
                     
             except ClientError as e:
                 print(f"❌ Error checking agent status: {e}")
@@ -225,44 +218,51 @@ Consider the human manager's preferences and risk tolerance.
         print(f"⚠️ Agent {agent_id} not ready after {max_wait} seconds")
         return False
     
-    def create_agent_aliases(self, agent_ids: Dict[str, str]) -> Dict[str, str]:
+    async def create_agent_aliases(self, agent_ids: Dict[str, str]) -> Dict[str, str]:
         """Create aliases for all agents"""
         
         print("🔗 Creating agent aliases...")
-        aliases = {}
         
-        for agent_name, agent_id in agent_ids.items():
-            if not agent_id:
-                continue
-                
-            try:
-                response = self.agent_client.create_agent_alias(
-                    agentId=agent_id,
-                    agentAliasName=f"{agent_name}-live",
-                    description=f"Live production alias for {agent_name}",
-                    tags={
-                        'Environment': 'Production',
-                        'AgentName': agent_name
-                    }
-                )
-                
-                alias_id = response['agentAlias']['agentAliasId']
-                aliases[agent_name] = alias_id
-                print(f"✅ Created alias for {agent_name}: {alias_id}")
-                
-            except ClientError as e:
-                print(f"❌ Failed to create alias for {agent_name}: {e}")
+        # Each alias is an independent round-trip - fan them out together
+        names = [agent_name for agent_name, agent_id in agent_ids.items() if agent_id]
+        alias_ids = await asyncio.gather(
+            *[self._create_one_alias(agent_name, agent_ids[agent_name]) for agent_name in names]
+        )
         
-        return aliases
+        return {
+            agent_name: alias_id
+            for agent_name, alias_id in zip(names, alias_ids)
+            if alias_id
+        }
+    
+    async def _create_one_alias(self, agent_name: str, agent_id: str) -> Optional[str]:
+        """Create the live alias for a single agent"""
+        
+        try:
+            response = await self.agent_client.create_agent_alias(
+                agentId=agent_id,
+                agentAliasName=agent_name + _ALIAS_SUFFIX,
+                clientToken=alias_client_token(agent_id, agent_name + _ALIAS_SUFFIX),
+                description=f"Live production alias for {agent_name}",
+                tags={**_BASE_ALIAS_TAGS, 'AgentName': agent_name}
+            )
+            
+            alias_id = response['agentAlias']['agentAliasId']
+            print(f"✅ Created alias for {agent_name}: {alias_id}")
+            return alias_id
+            
+        except ClientError as e:
+            print(f"❌ Failed to create alias for {agent_name}: {e}")
+            return None
     
-    def test_agent_invocation(self, agent_id: str, alias_id: str, agent_name: str):
+    async def test_agent_invocation(self, agent_id: str, alias_id: str, agent_name: str):
         """Test invoking an agent through AgentCore runtime"""
         
         print(f"🧪 Testing {agent_name} invocation...")
         
         try:
             # This is the CORRECT way - invoke via AgentCore runtime
-            response = self.runtime_client.invoke_agent(
+            response = await self.runtime_client.invoke_agent(
                 agentId=agent_id,
                 agentAliasId=alias_id,
                 sessionId=f"test-session-{int(time.time())}",
@@ -272,12 +272,14 @@ Consider the human manager's preferences and risk tolerance.
             # AgentCore returns streaming response
             event_stream = response['completion']
             
-            full_response = ""
-            for event in event_stream:
-                if 'chunk' in event:
-                    chunk = event['chunk']
-                    if 'bytes' in chunk:
-                        full_response += chunk['bytes'].decode('utf-8')
+            # Collect raw bytes and decode once at the end - avoids quadratic string
+            # concatenation and never splits a multi-byte character across chunks
+            buf = bytearray()
+            async for event in event_stream:
+                chunk = event.get('chunk')
+                if chunk and 'bytes' in chunk:
+                    buf += chunk['bytes']
+            full_response = buf.decode('utf-8', errors='replace')
             
             print(f"✅ {agent_name} response received: {full_response[:100]}...")
             return True
@@ -286,63 +288,76 @@ Consider the human manager's preferences and risk tolerance.
             print(f"❌ Failed to invoke {agent_name}: {e}")
             return False
     
-    def deploy_all_agents(self) -> Dict[str, str]:
+    async def _get_account_id(self) -> Optional[str]:
+        """AWS account ID for alias ARNs, or None if STS is unavailable"""
+        try:
+            async with self.session.client('sts', region_name=self.region_name, config=BOTO_CONFIG) as sts:
+                return (await sts.get_caller_identity())['Account']
+        except ClientError as e:
+            print(f"⚠️ Could not look up AWS account ID: {e}")
+            return None
+    
+    async def deploy_all_agents(self) -> Dict[str, str]:
         """Deploy all fantasy draft agents to AgentCore"""
         
+        async with self.session.client('bedrock-agent', region_name=self.region_name, config=BOTO_CONFIG) as self.agent_client, \
+                self.session.client('bedrock-agent-runtime', region_name=self.region_name, config=BOTO_CONFIG) as self.runtime_client:
+            return await self._deploy_all_agents()
+    
+    async def _deploy_all_agents(self) -> Dict[str, str]:
+        """Create, alias and test all agents (clients must already be open)"""
+        
         print("🚀 DEPLOYING FANTASY DRAFT AGENTS TO BEDROCK AGENTCORE")
         print("=" * 60)
         print("Using CORRECT approach: Deploying TO AgentCore runtime")
         print()
         
-        # Create all agents
-        agent_ids = {}
-        
-        # Data Collector
-        data_collector_id = self.create_data_collector_agent()
-        if data_collector_id:
-            agent_ids['data-collector'] = data_collector_id
-        
-        # Analysis Agent
-        analysis_id = self.create_analysis_agent()
-        if analysis_id:
-            agent_ids['analysis'] = analysis_id
-        
-        # Strategy Agent
-        strategy_id = self.create_strategy_agent()
-        if strategy_id:
-            agent_ids['strategy'] = strategy_id
+        # Create all agents concurrently - each create + readiness poll is
+        # independent, so wall time is the slowest agent instead of the sum
+        results = await asyncio.gather(*[self._create_agent(config) for config in AGENT_CONFIGS])
         
-        # Advisor Agent
-        advisor_id = self.create_advisor_agent()
-        if advisor_id:
-            agent_ids['advisor'] = advisor_id
+        agent_ids = {
+            config['key']: agent_id
+            for config, agent_id in zip(AGENT_CONFIGS, results)
+            if agent_id
+        }
         
         print(f"\n📋 Created {len(agent_ids)} agents successfully")
         
         # Create aliases
-        aliases = self.create_agent_aliases(agent_ids)
+        aliases = await self.create_agent_aliases(agent_ids)
         
         # Test invocations
         print("\n🧪 Testing agent invocations...")
-        for agent_name in agent_ids:
-            if agent_name in aliases:
-                self.test_agent_invocation(
-                    agent_ids[agent_name],
-                    aliases[agent_name], 
-                    agent_name
-                )
+        await asyncio.gather(*[
+            self.test_agent_invocation(
+                agent_ids[agent_name],
+                aliases[agent_name], 
+                agent_name
+            )
+            for agent_name in agent_ids
+            if agent_name in aliases
+        ])
+        
+        # Precompute full alias ARNs (one STS call) so consumers can address
+        # each alias without their own account lookup
+        account_id = await self._get_account_id()
+        alias_arns = {
+            name: f"arn:aws:bedrock:{self.region_name}:{account_id}:agent-alias/{agent_ids[name]}/{alias_id}"
+            for name, alias_id in aliases.items()
+        } if account_id else {}
         
         # Save deployment info
         deployment_info = {
             'agent_ids': agent_ids,
             'aliases': aliases,
+            'alias_arns': alias_arns,
             'deployment_time': time.time(),
             'region': self.region_name,
             'foundation_model': self.foundation_model
         }
         
-        with open('agentcore_deployment.json', 'w') as f:
-            json.dump(deployment_info, f, indent=2)
+        write_deployment_file(deployment_info)
         
         print(f"\n✅ AGENTCORE DEPLOYMENT COMPLETE!")
         print(f"📁 Deployment info saved to: agentcore_deployment.json")
@@ -350,11 +365,36 @@ Consider the human manager's preferences and risk tolerance.
         
         return agent_ids
 
-def main():
-    """Deploy Fantasy Draft Assistant to AgentCore"""
+async def deploy_and_run_client() -> Dict[str, str]:
+    """
+    Deploy all agents, then run the AgentCore client's draft analysis
     
+    Runs both phases in one process and one event loop, instead of deploying
+    and then starting a second interpreter for agentcore_fantasy_client.py.
+    """
     deployer = FantasyAgentCoreDeployer()
-    agent_ids = deployer.deploy_all_agents()
+    agent_ids = await deployer.deploy_all_agents()
+    
+    if agent_ids:
+        # Imported here so plain deploys never load the client module
+        from agentcore_fantasy_client import FantasyAgentCoreClient
+        
+        client = FantasyAgentCoreClient()
+        client.list_deployed_agents()
+        await asyncio.to_thread(client.run_complete_draft_analysis)
+    
+    return agent_ids
+
+def main():
+    """Deploy Fantasy Draft Assistant to AgentCore (--run-client to also run the client)"""
+    
+    logging.basicConfig(level=logging.DEBUG if os.getenv('AGENTCORE_DEBUG') else logging.WARNING)
+    
+    if '--run-client' in sys.argv[1:]:
+        agent_ids = asyncio.run(deploy_and_run_client())
+    else:
+        deployer = FantasyAgentCoreDeployer()
+        agent_ids = asyncio.run(deployer.deploy_all_agents())
     
     if agent_ids:
         print("\n🎉 SUCCESS: Fantasy Draft Assistant deployed to AgentCore!")
@@ -364,4 +404,4 @@ def main():
         print("\n❌ DEPLOYMENT FAILED: Check permissions and try again")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,23 +4,92 @@ Deploy AgentCore agents with proper service role
 """
 
 import boto3
+import functools
 import json
 import time
-from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError, WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
+
+from _bedrock_config import BEDROCK_CFG, MODEL_ID_PROD, REGION
+from _deployment import write_deployment_file
+from _stream_echo import StreamEcho
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Agent status values the waiters below key off
+_TERMINAL_STATUSES = frozenset({'FAILED', 'DELETING'})
+_READY_STATUS = 'PREPARED'
+_CREATED_STATUS = 'NOT_PREPARED'
+
+def _status_acceptor(state: str, status: str) -> dict:
+    return {'state': state, 'matcher': 'path', 'argument': 'agent.agentStatus', 'expected': status}
+
+# bedrock-agent ships no waiters, so define GetAgent-based ones. Any status not
+# listed (CREATING, PREPARING, UPDATING...) keeps the waiter polling.
+AGENT_WAITER_MODEL = WaiterModel({
+    'version': 2,
+    'waiters': {
+        'AgentCreated': {
+            'operation': 'GetAgent',
+            'delay': 3,
+            'maxAttempts': 100,
+            'acceptors': [_status_acceptor('success', _CREATED_STATUS)] + [
+                _status_acceptor('failure', status) for status in sorted(_TERMINAL_STATUSES)
+            ]
+        },
+        'AgentDeleted': {
+            'operation': 'GetAgent',
+            'delay': 2,
+            'maxAttempts': 30,
+            'acceptors': [
+                {'state': 'success', 'matcher': 'error', 'expected': 'ResourceNotFoundException'},
+            ]
+        },
+        'AgentPrepared': {
+            'operation': 'GetAgent',
+            'delay': 3,
+            'maxAttempts': 100,
+            'acceptors': [
+                _status_acceptor('success', _READY_STATUS),
+                _status_acceptor('failure', 'FAILED'),
+            ]
+        }
+    }
+})
+AGENT_WAITER_CONFIG = {'Delay': 3, 'MaxAttempts': 100}  # up to 5 minutes per phase
+DELETE_WAITER_CONFIG = {'Delay': 2, 'MaxAttempts': 30}  # up to 1 minute
+
+@functools.lru_cache(maxsize=1)
+def load_service_role(path: str = 'agentcore_role.json') -> dict:
+    """Read the service role file once per process"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
 
 class AgentCoreRoleDeployer:
-    def __init__(self, region_name: str = 'us-east-1'):
+    def __init__(self, region_name: str = REGION):
         self.region_name = region_name
-        self.agent_client = boto3.client('bedrock-agent', region_name=region_name)
-        self.runtime_client = boto3.client('bedrock-agent-runtime', region_name=region_name)
-        self.foundation_model = 'anthropic.claude-3-5-sonnet-20240620-v1:0'
+        self.agent_client = boto3.client('bedrock-agent', region_name=region_name, config=BEDROCK_CFG)
+        self.runtime_client = boto3.client('bedrock-agent-runtime', region_name=region_name, config=BEDROCK_CFG)
+        self.foundation_model = MODEL_ID_PROD
+        
+        # Target status -> waiter, so every status wait goes through _wait_for_status
+        self.status_waiters = {
+            _CREATED_STATUS: create_waiter_with_client('AgentCreated', AGENT_WAITER_MODEL, self.agent_client),
+            _READY_STATUS: create_waiter_with_client('AgentPrepared', AGENT_WAITER_MODEL, self.agent_client),
+        }
+        self.agent_deleted_waiter = create_waiter_with_client('AgentDeleted', AGENT_WAITER_MODEL, self.agent_client)
         
         # Load service role
         try:
-            with open('agentcore_role.json', 'r') as f:
-                role_info = json.load(f)
-                self.service_role_arn = role_info['role_arn']
-                print(f"🔑 Using service role: {self.service_role_arn}")
+            self.service_role_arn = load_service_role()['role_arn']
+            print(f"🔑 Using service role: {self.service_role_arn}")
         except FileNotFoundError:
             raise FileNotFoundError("Service role not found. Run create_agentcore_service_role.py first.")
         
@@ -29,28 +98,54 @@ class AgentCoreRoleDeployer:
         try:
             print("🧹 Cleaning up existing agents...")
             
-            response = self.agent_client.list_agents()
+            # Page through every agent - a single list_agents call only sees the
+            # first page, leaving later fantasy-* agents behind
             agents_to_delete = []
+            paginator = self.agent_client.get_paginator('list_agents')
+            for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+                for agent in page.get('agentSummaries', ()):
+                    if agent['agentName'].startswith('fantasy-'):
+                        agents_to_delete.append((agent['agentId'], agent['agentName']))
             
-            for agent in response.get('agentSummaries', []):
-                if agent['agentName'].startswith('fantasy-'):
-                    agents_to_delete.append((agent['agentId'], agent['agentName']))
+            if not agents_to_delete:
+                return
             
-            for agent_id, agent_name in agents_to_delete:
-                try:
-                    print(f"🗑️ Deleting {agent_name}...")
-                    self.agent_client.delete_agent(agentId=agent_id)
-                    print(f"✅ Deleted {agent_name}")
-                except ClientError as e:
-                    print(f"⚠️ Could not delete {agent_name}: {e}")
-                    
-            if agents_to_delete:
-                print("⏳ Waiting for deletions to complete...")
-                time.sleep(30)
+            # Deletes are independent, so issue them together, then wait for each
+            # agent to actually disappear instead of sleeping a fixed 30s
+            with ThreadPoolExecutor(max_workers=min(8, len(agents_to_delete))) as executor:
+                deleted = [
+                    agent for agent, ok in zip(agents_to_delete, executor.map(self._delete_agent, agents_to_delete))
+                    if ok
+                ]
+                
+                if deleted:
+                    print("⏳ Waiting for deletions to complete...")
+                    list(executor.map(self._wait_for_deletion, deleted))
             
         except Exception as e:
             print(f"⚠️ Error during cleanup: {e}")
     
+    def _delete_agent(self, agent) -> bool:
+        """Delete one (agent_id, agent_name); True if the delete was accepted"""
+        agent_id, agent_name = agent
+        try:
+            print(f"🗑️ Deleting {agent_name}...")
+            self.agent_client.delete_agent(agentId=agent_id)
+            print(f"✅ Deleted {agent_name}")
+            return True
+        except ClientError as e:
+            print(f"⚠️ Could not delete {agent_name}: {e}")
+            return False
+    
+    def _wait_for_deletion(self, agent):
+        """Block until GetAgent reports the agent gone"""
+        agent_id, agent_name = agent
+        try:
+            # Deletes usually finish in a couple of seconds - check on a short interval
+            self.agent_deleted_waiter.wait(agentId=agent_id, WaiterConfig=DELETE_WAITER_CONFIG)
+        except WaiterError as e:
+            print(f"⚠️ {agent_name} still present after waiting: {e}")
+    
     def create_data_collector(self) -> str:
         """Create the data collector agent"""
         
@@ -74,61 +169,67 @@ ADP data, injury reports, and news from available sources. Return structured dat
             print(f"❌ Failed to create Data Collector: {e}")
             return None
     
+    def _wait_for_status(self, agent_id: str, target: str, agent_name: str) -> bool:
+        """Wait until the agent reaches target status
+        
+        Args:
+            agent_id: Agent to poll
+            target: Status key in self.status_waiters (NOT_PREPARED or PREPARED)
+            agent_name: Name used in log output
+            
+        Returns:
+            True once the status is reached, False on a failure status or timeout
+        """
+        try:
+            self.status_waiters[target].wait(agentId=agent_id, WaiterConfig=AGENT_WAITER_CONFIG)
+            return True
+        except WaiterError as e:
+            # Raised for both a failure status and running out of attempts
+            print(f"❌ {agent_name} did not reach {target}: {e}")
+            return False
+    
     def prepare_agent(self, agent_id: str, agent_name: str) -> bool:
         """Prepare agent for use"""
+        print(f"⏳ Waiting for {agent_name} to finish creating...")
+        if not self._wait_for_status(agent_id, _CREATED_STATUS, agent_name):
+            return False
+        
+        print(f"🔧 Preparing {agent_name}...")
         try:
-            # First wait for agent to finish creating
-            print(f"⏳ Waiting for {agent_name} to finish creating...")
-            
-            max_wait = 300  # 5 minutes
-            start_time = time.time()
-            
-            while time.time() - start_time < max_wait:
-                response = self.agent_client.get_agent(agentId=agent_id)
-                status = response['agent']['agentStatus']
-                
-                print(f"⏳ {agent_name} status: {status}")
-                
-                if status == 'NOT_PREPARED':
-                    print(f"✅ {agent_name} finished creating, now preparing...")
-                    break
-                elif status in ['FAILED', 'DELETING']:
-                    print(f"❌ {agent_name} creation failed with status: {status}")
-                    return False
-                
-                time.sleep(20)
-            else:
-                print(f"⚠️ {agent_name} creation timed out")
-                return False
-            
-            # Now prepare the agent
-            print(f"🔧 Preparing {agent_name}...")
             self.agent_client.prepare_agent(agentId=agent_id)
-            
-            # Wait for preparation to complete
-            start_time = time.time()
-            
-            while time.time() - start_time < max_wait:
-                response = self.agent_client.get_agent(agentId=agent_id)
-                status = response['agent']['agentStatus']
-                
-                print(f"⏳ {agent_name} preparation status: {status}")
-                
-                if status == 'PREPARED':
-                    print(f"✅ {agent_name} is ready!")
-                    return True
-                elif status in ['FAILED']:
-                    print(f"❌ {agent_name} preparation failed")
-                    return False
-                
-                time.sleep(30)
-            
-            print(f"⚠️ {agent_name} preparation timed out")
-            return False
-            
         except ClientError as e:
             print(f"❌ Error preparing {agent_name}: {e}")
             return False
+        
+        if not self._wait_for_status(agent_id, _READY_STATUS, agent_name):
+            return False
+        print(f"✅ {agent_name} is ready!")
+        return True
+    
+    def _test_invocation(self, agent_id: str, alias_id: str) -> str:
+        """Send a short test prompt and echo the streamed reply"""
+        response = self.runtime_client.invoke_agent(
+            agentId=agent_id,
+            agentAliasId=alias_id,
+            sessionId=f"test-{int(time.time())}",
+            inputText="Hello, provide a brief test response."
+        )
+        
+        # Process response - echo raw bytes, decode the whole reply once
+        buf = bytearray()
+        echo = StreamEcho()
+        for event in response.get('completion') or ():
+            chunk = event.get('chunk')
+            if not chunk:
+                continue  # trace and other non-text events
+            data = chunk.get('bytes')
+            if not data:
+                continue
+            buf.extend(data)
+            echo.write(data)
+        echo.flush()
+        
+        return buf.decode('utf-8', errors='replace')
     
     def create_simple_test_agent(self):
         """Create a single test agent to verify the setup"""
@@ -159,27 +260,6 @@ ADP data, injury reports, and news from available sources. Return structured dat
                 alias_id = alias_response['agentAlias']['agentAliasId']
                 print(f"✅ Alias created: {alias_id}")
                 
-                # Test invocation
-                print("🧪 Testing agent invocation...")
-                
-                response = self.runtime_client.invoke_agent(
-                    agentId=agent_id,
-                    agentAliasId=alias_id,
-                    sessionId=f"test-{int(time.time())}",
-                    inputText="Hello, provide a brief test response."
-                )
-                
-                # Process response
-                full_response = ""
-                for event in response['completion']:
-                    if 'chunk' in event and 'bytes' in event['chunk']:
-                        chunk_text = event['chunk']['bytes'].decode('utf-8')
-                        full_response += chunk_text
-                        print(chunk_text, end='', flush=True)
-                
-                print(f"\n🎉 SUCCESS! Agent responded correctly.")
-                
-                # Save deployment info
                 deployment = {
                     'agent_ids': {'data-collector': agent_id},
                     'aliases': {'data-collector': alias_id},
@@ -188,13 +268,19 @@ ADP data, injury reports, and news from available sources. Return structured dat
                     'deployment_time': time.time()
                 }
                 
-                with open('agentcore_deployment.json', 'w') as f:
-                    json.dump(deployment, f, indent=2)
-                
+                # Saved before the test invocation so it's kept even if that fails
+                write_deployment_file(deployment)
                 print(f"💾 Deployment saved to agentcore_deployment.json")
                 
+                print("🧪 Testing agent invocation...")
+                self._test_invocation(agent_id, alias_id)
+                print(f"\n🎉 SUCCESS! Agent responded correctly.")
+                
             except ClientError as e:
                 print(f"❌ Failed to create alias or test: {e}")
+                request_id = e.response.get('ResponseMetadata', {}).get('RequestId')
+                if request_id:
+                    print(f"   🔎 Request ID: {request_id}")
         else:
             print("❌ Agent preparation failed")
 
@@ -3,74 +3,124 @@
 Test Bedrock with correct model ID
 """
 
+import functools
 import json
-import boto3
-from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+
+from _bedrock_config import MODEL_ID_PROD, MODEL_ID_SMOKE, REGION
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+@functools.lru_cache(maxsize=None)
+def get_client(service: str, region: str = REGION):
+    """
+    One boto3 client per service/region for the whole run
+    
+    boto3 is imported on first use rather than at module level - loading it
+    and its service models costs a few hundred ms that imports of this module
+    shouldn't pay.
+    """
+    import boto3
+    from _bedrock_config import BEDROCK_CFG
+    
+    return boto3.client(service, region_name=region, config=BEDROCK_CFG)
+
+# Model probes in flight at once - small, so finding a working model early
+# leaves the rest queued (and cancellable) instead of already invoked
+PROBE_WORKERS = 2
+
+# Every probe sends the same request, so encode it once (invoke_model takes bytes)
+_PROBE_REQUEST = {
+    "anthropic_version": "bedrock-2023-05-31",
+    "max_tokens": 50,
+    "messages": [{"role": "user", "content": "Say 'Working!' in 3 words."}]
+}
+_PROBE_BODY = orjson.dumps(_PROBE_REQUEST) if HAS_ORJSON else json.dumps(_PROBE_REQUEST).encode('utf-8')
+
+def _probe_model(bedrock_runtime, model_id: str):
+    """Invoke one model ID; returns the ID if it answered, else None"""
+    from botocore.exceptions import ClientError
+    
+    try:
+        response = bedrock_runtime.invoke_model(
+            modelId=model_id,
+            body=_PROBE_BODY
+        )
+        
+        result = _json_loads(response['body'].read())
+        message = result['content'][0]['text']
+        
+        print(f"   ✅ {model_id}: {message.strip()}")
+        return model_id
+        
+    except ClientError as e:
+        error_code = e.response['Error']['Code']
+        error_msg = e.response['Error']['Message'][:100]
+        print(f"   ❌ {model_id}: {error_code} - {error_msg}...")
+    
+    except Exception as e:
+        print(f"   ❌ {model_id}: {str(e)[:100]}...")
+    
+    return None
 
 def test_bedrock_models():
     """Test different Bedrock model IDs to find working one"""
     
-    bedrock_runtime = boto3.client('bedrock-runtime', region_name='us-east-1')
+    bedrock_runtime = get_client('bedrock-runtime')
     
     # Try different model IDs
     model_ids_to_try = [
         'anthropic.claude-3-5-sonnet-20241022-v2:0',  # Original
-        'anthropic.claude-3-5-sonnet-20240620-v1:0',   # Alternative
+        MODEL_ID_PROD,                                 # Alternative (what the agents deploy with)
         'anthropic.claude-3-sonnet-20240229-v1:0',     # Older version
-        'anthropic.claude-3-haiku-20240307-v1:0',      # Haiku (cheaper/faster)
+        MODEL_ID_SMOKE,                                # Haiku (cheaper/faster)
         'us.anthropic.claude-3-5-sonnet-20241022-v2:0', # With region prefix
     ]
     
     print("🔍 Testing Bedrock Model IDs...")
     print("=" * 50)
     
-    for model_id in model_ids_to_try:
-        try:
-            print(f"\n🧪 Testing: {model_id}")
-            
-            body = json.dumps({
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 50,
-                "messages": [{"role": "user", "content": "Say 'Working!' in 3 words."}]
-            })
-            
-            response = bedrock_runtime.invoke_model(
-                modelId=model_id,
-                body=body
-            )
-            
-            result = json.loads(response['body'].read())
-            message = result['content'][0]['text']
-            
-            print(f"   ✅ SUCCESS: {message.strip()}")
-            print(f"   🎯 WORKING MODEL: {model_id}")
-            return model_id
-            
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            error_msg = e.response['Error']['Message'][:100]
-            print(f"   ❌ FAILED: {error_code} - {error_msg}...")
+    # Probes run in preference order, PROBE_WORKERS at a time (boto3 clients are
+    # thread-safe), and results are taken in list order so the preferred working
+    # model wins. Probes still queued when it's found are cancelled, so a run
+    # bills at most PROBE_WORKERS - 1 invocations beyond the baseline's.
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+        futures = [executor.submit(_probe_model, bedrock_runtime, m) for m in model_ids_to_try]
         
-        except Exception as e:
-            print(f"   ❌ ERROR: {str(e)[:100]}...")
+        for future in futures:
+            model_id = future.result()
+            if model_id:
+                for pending in futures:
+                    pending.cancel()
+                print(f"   🎯 WORKING MODEL: {model_id}")
+                return model_id
     
     print(f"\n❌ No working model found")
     return None
 
+def list_claude_models(region: str = REGION) -> list:
+    """Claude foundation models available in a region"""
+    bedrock = get_client('bedrock', region)
+    response = bedrock.list_foundation_models()
+    
+    return [
+        model for model in response['modelSummaries']
+        if 'claude' in model['modelId'].lower()
+    ]
+
 def test_bedrock_list_models():
     """List available models"""
     try:
-        bedrock = boto3.client('bedrock', region_name='us-east-1')
-        
         print("\n🔍 Listing Available Foundation Models...")
         print("=" * 50)
         
-        response = bedrock.list_foundation_models()
-        
-        claude_models = []
-        for model in response['modelSummaries']:
-            if 'claude' in model['modelId'].lower():
-                claude_models.append(model)
+        claude_models = list_claude_models(REGION)
         
         print(f"Found {len(claude_models)} Claude models:")
         for model in claude_models[:10]:  # Show first 10
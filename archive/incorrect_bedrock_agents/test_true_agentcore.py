@@ -4,9 +4,23 @@ Test TRUE Bedrock AgentCore Runtime
 Uses the AgentCore APIs, not direct Bedrock model calls
 """
 
-import boto3
+import functools
 import json
-from botocore.exceptions import ClientError
+
+from _bedrock_config import REGION
+
+@functools.lru_cache(maxsize=None)
+def get_client(service: str, region: str = REGION):
+    """
+    One boto3 client per service/region for the whole run
+    
+    boto3 is imported here, not at the top of the file: it takes a few
+    hundred ms to load and show_agentcore_architecture() never touches AWS.
+    """
+    import boto3
+    from _bedrock_config import BEDROCK_CFG
+    
+    return boto3.client(service, region_name=region, config=BEDROCK_CFG)
 
 def test_agentcore_runtime():
     """Test AgentCore runtime APIs"""
@@ -20,24 +34,30 @@ def test_agentcore_runtime():
         print("🔍 Testing AgentCore Runtime Client...")
         
         # This should be the AgentCore runtime client, not bedrock-runtime
-        agentcore_client = boto3.client('bedrock-agent-runtime', region_name='us-east-1')
+        agentcore_client = get_client('bedrock-agent-runtime')
         
         print("✅ AgentCore Runtime client created successfully")
         
         # Test AgentCore agent client  
         print("\n🔍 Testing AgentCore Agent Management...")
         
-        agent_client = boto3.client('bedrock-agent', region_name='us-east-1')
+        agent_client = get_client('bedrock-agent')
         
         print("✅ AgentCore Agent client created successfully")
         
         # List existing AgentCore agents (if any)
         try:
-            response = agent_client.list_agents()
-            agents = response.get('agentSummaries', [])
-            print(f"📋 Found {len(agents)} existing AgentCore agents")
+            # list_agents is paged - count every page but only keep the first 3 to show
+            agent_count = 0
+            sample = []
+            for page in agent_client.get_paginator('list_agents').paginate(PaginationConfig={'PageSize': 100}):
+                for agent in page.get('agentSummaries', ()):
+                    agent_count += 1
+                    if len(sample) < 3:
+                        sample.append(agent)
+            print(f"📋 Found {agent_count} existing AgentCore agents")
             
-            for agent in agents[:3]:  # Show first 3
+            for agent in sample:  # Show first 3
                 print(f"   📤 {agent.get('agentName', 'Unknown')} ({agent.get('agentStatus', 'Unknown')})")
         
         except Exception as e:
@@ -69,7 +89,7 @@ def test_agentcore_deployment_options():
     print("=" * 50)
     
     try:
-        agent_client = boto3.client('bedrock-agent', region_name='us-east-1')
+        agent_client = get_client('bedrock-agent')
         
         # Check if we can create an agent
         print("🧪 Testing agent creation capabilities...")
@@ -86,9 +106,9 @@ def test_agentcore_deployment_options():
         
         # Test knowledge base capabilities
         try:
-            kb_response = agent_client.list_knowledge_bases()
-            knowledge_bases = kb_response.get('knowledgeBaseSummaries', [])
-            print(f"📚 Found {len(knowledge_bases)} knowledge bases available")
+            kb_pages = agent_client.get_paginator('list_knowledge_bases').paginate(PaginationConfig={'PageSize': 100})
+            kb_count = sum(len(page.get('knowledgeBaseSummaries', ())) for page in kb_pages)
+            print(f"📚 Found {kb_count} knowledge bases available")
         except:
             print("⚠️ Knowledge base listing not available")
         
@@ -3,20 +3,77 @@
 Test the working AgentCore agent - CORRECT APPROACH
 """
 
+import aioboto3
+import asyncio
 import boto3
+import functools
 import json
 import time
 import uuid
+from aiobotocore.config import AioConfig
+from botocore.exceptions import ClientError
 
-def test_agentcore_invocation():
+from _bedrock_config import BEDROCK_CFG, BEDROCK_RETRIES, REGION
+from _stream_echo import StreamEcho
+
+@functools.lru_cache(maxsize=None)
+def get_client(service: str, region: str = REGION):
+    """One boto3 client per service/region for the whole run"""
+    return boto3.client(service, region_name=region, config=BEDROCK_CFG)
+
+_ALIAS_READY_STATUSES = frozenset({'PREPARED', 'READY'})
+
+_AIO_BEDROCK_CFG = AioConfig(
+    retries=BEDROCK_RETRIES,
+    connect_timeout=5,
+    read_timeout=300
+)
+
+def _request_id(error):
+    """AWS request ID from a botocore ClientError, if there is one"""
+    response = getattr(error, 'response', None) or {}
+    return response.get('ResponseMetadata', {}).get('RequestId')
+
+async def invoke_agent_text(runtime_client, agent_id: str, alias_id: str,
+                            session_id: str, input_text: str) -> str:
+    """Invoke one agent and stream its reply to the terminal"""
+    response = await runtime_client.invoke_agent(
+        agentId=agent_id,
+        agentAliasId=alias_id,
+        sessionId=session_id,
+        inputText=input_text
+    )
+    
+    # Raw bytes go straight to the terminal and into one buffer that's decoded
+    # once (no per-chunk str building, and multi-byte characters split across
+    # chunks decode correctly)
+    # Trace/other events carry no chunk, and a chunk may carry no bytes - skip
+    # those rather than letting one bad event abort the whole reply
+    buf = bytearray()
+    completion = response.get('completion')
+    if completion is None:
+        return ''
+    
+    echo = StreamEcho()
+    async for event in completion:
+        chunk = event.get('chunk')
+        if not chunk:
+            continue
+        data = chunk.get('bytes')
+        if not data:
+            continue
+        buf.extend(data)
+        echo.write(data)
+    echo.flush()
+    
+    return buf.decode('utf-8', errors='replace')
+
+async def test_agentcore_invocation():
     """Test invoking our deployed AgentCore agent"""
     
     print("🚀 TESTING WORKING BEDROCK AGENTCORE AGENT")
     print("=" * 50)
     
-    # AgentCore runtime client (CORRECT way)
-    runtime_client = boto3.client('bedrock-agent-runtime', region_name='us-east-1')
-    
     # Our deployed agent details
     agent_id = "QIXL7HZUKS"
     alias_id = "GJMBWBB1T7" 
@@ -28,56 +85,49 @@ def test_agentcore_invocation():
     print()
     
     try:
-        # Test basic invocation
-        print("📤 Invoking AgentCore agent...")
-        print("💬 Input: Hello, provide the top 3 QBs for fantasy football.")
-        
-        response = runtime_client.invoke_agent(
-            agentId=agent_id,
-            agentAliasId=alias_id,
-            sessionId=session_id,
-            inputText="Hello, provide the top 3 QBs for fantasy football this season with brief reasoning."
-        )
-        
-        print("\n📨 AgentCore Response:")
-        print("-" * 30)
-        
-        # Process streaming response
-        full_response = ""
-        event_stream = response['completion']
-        
-        for event in event_stream:
-            if 'chunk' in event:
-                chunk = event['chunk']
-                if 'bytes' in chunk:
-                    chunk_text = chunk['bytes'].decode('utf-8')
-                    full_response += chunk_text
-                    print(chunk_text, end='', flush=True)
-        
-        print(f"\n{'-' * 30}")
-        print(f"📝 Complete Response Length: {len(full_response)} characters")
-        
-        # Test follow-up in same session  
-        print(f"\n🔄 Testing session continuity...")
-        
-        followup_response = runtime_client.invoke_agent(
-            agentId=agent_id,
-            agentAliasId=alias_id,
-            sessionId=session_id,  # Same session
-            inputText="What about running backs? Give me top 3 RBs."
-        )
-        
-        print("📨 Follow-up Response:")
-        print("-" * 30)
-        
-        followup_text = ""
-        for event in followup_response['completion']:
-            if 'chunk' in event and 'bytes' in event['chunk']:
-                chunk_text = event['chunk']['bytes'].decode('utf-8')
-                followup_text += chunk_text
-                print(chunk_text, end='', flush=True)
-        
-        print(f"\n{'-' * 30}")
+        # AgentCore runtime client (CORRECT way)
+        async with aioboto3.Session().client('bedrock-agent-runtime', region_name=REGION,
+                                             config=_AIO_BEDROCK_CFG) as runtime_client:
+            # Test basic invocation
+            print("📤 Invoking AgentCore agent...")
+            print("💬 Input: Hello, provide the top 3 QBs for fantasy football.")
+            
+            print("\n📨 AgentCore Response:")
+            print("-" * 30)
+            
+            first_input = "Hello, provide the top 3 QBs for fantasy football this season with brief reasoning."
+            try:
+                full_response = await invoke_agent_text(
+                    runtime_client, agent_id, alias_id, session_id, first_input
+                )
+            except ClientError as e:
+                # Invoking an agent that isn't PREPARED fails fast - only then
+                # wait for it, instead of pre-checking status on every run
+                if e.response['Error']['Code'] != 'ValidationException':
+                    raise
+                print(f"\n⏳ Agent not ready yet ({e.response['Error']['Message']}), waiting...")
+                await asyncio.to_thread(wait_for_agent_prepared, agent_id)
+                full_response = await invoke_agent_text(
+                    runtime_client, agent_id, alias_id, session_id, first_input
+                )
+            
+            print(f"\n{'-' * 30}")
+            print(f"📝 Complete Response Length: {len(full_response)} characters")
+            
+            # Test follow-up in same session - has to wait for the first reply,
+            # since it's checking the agent remembers that conversation
+            print(f"\n🔄 Testing session continuity...")
+            
+            print("📨 Follow-up Response:")
+            print("-" * 30)
+            
+            followup_text = await invoke_agent_text(
+                runtime_client, agent_id, alias_id, session_id,  # Same session
+                "What about running backs? Give me top 3 RBs."
+            )
+            
+            print(f"\n{'-' * 30}")
+            print(f"📝 Follow-up Response Length: {len(followup_text)} characters")
         
         print(f"\n🎉 AGENTCORE TEST SUCCESSFUL!")
         print(f"✅ Agent responded to both queries")
@@ -89,15 +139,26 @@ def test_agentcore_invocation():
         
     except Exception as e:
         print(f"\n❌ AgentCore invocation failed: {e}")
+        request_id = _request_id(e)
+        if request_id:
+            print(f"   🔎 Request ID: {request_id}")
         return False
 
+def wait_for_agent_prepared(agent_id: str):
+    """Block until the agent reports PREPARED (raises WaiterError on failure/timeout)"""
+    from botocore.waiter import create_waiter_with_client
+    from deploy_with_role import AGENT_WAITER_MODEL
+    
+    waiter = create_waiter_with_client('AgentPrepared', AGENT_WAITER_MODEL, get_client('bedrock-agent'))
+    waiter.wait(agentId=agent_id, WaiterConfig={'Delay': 3, 'MaxAttempts': 20})
+
 def test_agent_status():
     """Check agent and alias status"""
     
     print(f"\n🔍 CHECKING AGENT STATUS")
     print("=" * 30)
     
-    agent_client = boto3.client('bedrock-agent', region_name='us-east-1')
+    agent_client = get_client('bedrock-agent')
     
     try:
         # Check agent status
@@ -113,7 +174,7 @@ def test_agent_status():
         alias_status = alias_response['agentAlias']['agentAliasStatus']
         print(f"🔗 Alias Status: {alias_status}")
         
-        if agent_status == 'PREPARED' and alias_status in ['PREPARED', 'READY']:
+        if agent_status == 'PREPARED' and alias_status in _ALIAS_READY_STATUSES:
             print(f"✅ Both agent and alias are ready for invocation")
             return True
         else:
@@ -132,27 +193,21 @@ def main():
     print("Testing CORRECT AgentCore approach: invoke agents via runtime")
     print()
     
-    # Check status first
-    if test_agent_status():
-        time.sleep(5)  # Brief pause
-        
-        # Test invocation
-        success = test_agentcore_invocation()
+    # Test invocation - waits for the agent itself if it isn't prepared yet
+    success = asyncio.run(test_agentcore_invocation())
+    
+    if success:
+        print(f"\n🎯 NEXT STEPS:")
+        print(f"1. ✅ AgentCore agent is working correctly")
+        print(f"2. 🚀 Deploy remaining agents (Analysis, Strategy, Advisor)")
+        print(f"3. 🔗 Integrate with web UI for live draft assistance")
+        print(f"4. 🧪 Test with Sleeper Mock Draft as requested")
         
-        if success:
-            print(f"\n🎯 NEXT STEPS:")
-            print(f"1. ✅ AgentCore agent is working correctly")
-            print(f"2. 🚀 Deploy remaining agents (Analysis, Strategy, Advisor)")
-            print(f"3. 🔗 Integrate with web UI for live draft assistance")
-            print(f"4. 🧪 Test with Sleeper Mock Draft as requested")
-            
-        else:
-            print(f"\n⚠️ TROUBLESHOOTING:")
-            print(f"1. Check AWS permissions for bedrock-agent-runtime")
-            print(f"2. Verify agent and alias are in PREPARED status")
-            print(f"3. Ensure service role has proper Bedrock permissions")
     else:
-        print(f"\n⏳ Agent/alias still preparing. Wait 1-2 minutes and retry.")
+        print(f"\n⚠️ TROUBLESHOOTING:")
+        print(f"1. Check AWS permissions for bedrock-agent-runtime")
+        print(f"2. Verify agent and alias are in PREPARED status (run test_agent_status())")
+        print(f"3. Ensure service role has proper Bedrock permissions")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
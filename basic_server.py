@@ -1,19 +1,32 @@
 #!/usr/bin/env python3
 """
 Basic HTTP Server for Fantasy Draft Assistant
-Using Python's built-in HTTP server to avoid dependency issues
+aiohttp server on one asyncio (uvloop when available) event loop - chat requests
+are awaited concurrently instead of being served one at a time
 """
 
+import gzip
+import hashlib
 import json
-import os
-import asyncio
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
-from pathlib import Path
-from dotenv import load_dotenv
+from aiohttp import web
 
-# Load environment variables
-load_dotenv('.env.local')
+from api.sleeper_client import install_uvloop
+from config import get_config
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Optional HTML/CSS/JS minifier for the landing page
+try:
+    import minify_html
+    HAS_MINIFY_HTML = True
+except ImportError:
+    HAS_MINIFY_HTML = False
 
 # Global variables
 draft_crew = None
@@ -25,7 +38,7 @@ def init_agents():
     print("🚀 Starting Fantasy Draft Assistant - Basic HTTP Server")
     print("📡 Initializing CrewAI agents...")
     
-    api_key = os.getenv('ANTHROPIC_API_KEY')
+    api_key = get_config().anthropic_api_key
     if api_key:
         try:
             from agents.draft_crew import FantasyDraftCrew
@@ -40,136 +53,237 @@ def init_agents():
         print("⚠️ No ANTHROPIC_API_KEY found - AI features disabled")
         return False
 
-class FantasyHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/':
-            self.send_html()
-        elif self.path == '/api/status':
-            self.send_status()
-        else:
-            self.send_response(404)
-            self.end_headers()
+# Landing page stylesheet and script, served from content-hashed /static/ URLs
+# so browsers cache them for good and only the small HTML shell is re-fetched
+APP_CSS = '''body { 
+    font-family: -apple-system, BlinkMacSystemFont, sans-serif; 
+    padding: 20px; 
+    background: #0f172a; 
+    color: white; 
+    margin: 0;
+}
+.container { max-width: 800px; margin: 0 auto; }
+.header {
+    background: linear-gradient(90deg, #8b5cf6, #2563eb);
+    padding: 1.5rem;
+    border-radius: 8px;
+    margin-bottom: 2rem;
+    text-align: center;
+}
+.chat-area {
+    background: #1e293b;
+    border-radius: 8px;
+    padding: 20px;
+    margin-bottom: 20px;
+}
+#messages {
+    height: 400px;
+    overflow-y: auto;
+    margin-bottom: 20px;
+    padding: 15px;
+    background: #0f172a;
+    border-radius: 4px;
+    border: 1px solid #475569;
+}
+.message {
+    margin-bottom: 15px;
+    padding: 12px;
+    border-radius: 8px;
+    line-height: 1.5;
+}
+.user-message {
+    background: #2563eb;
+    text-align: right;
+}
+.ai-message {
+    background: #059669;
+    white-space: pre-wrap;
+}
+.system-message {
+    background: #7c2d12;
+    font-style: italic;
+}
+.input-area {
+    display: flex;
+    gap: 10px;
+}
+input[type="text"] { 
+    flex: 1;
+    padding: 12px; 
+    border: 1px solid #475569;
+    background: #334155;
+    color: white;
+    border-radius: 4px;
+    font-size: 16px;
+}
+input[type="text"]:focus {
+    outline: none;
+    border-color: #2563eb;
+}
+button { 
+    padding: 12px 20px; 
+    background: #10b981; 
+    color: white; 
+    border: none; 
+    cursor: pointer;
+    border-radius: 4px;
+    font-weight: 600;
+}
+button:hover { background: #059669; }
+button:disabled {
+    background: #6b7280;
+    cursor: not-allowed;
+}
+.examples {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+    gap: 10px;
+    margin-top: 20px;
+}
+.example-btn {
+    padding: 10px;
+    background: #475569;
+    border: 1px solid #64748b;
+    color: white;
+    cursor: pointer;
+    border-radius: 4px;
+    font-size: 14px;
+    transition: background 0.2s;
+}
+.example-btn:hover {
+    background: #64748b;
+}
+.status { 
+    text-align: center; 
+    margin-bottom: 20px;
+    padding: 10px;
+    background: #1e293b;
+    border-radius: 4px;
+}
+'''
+
+APP_JS = '''let isProcessing = false;
+
+// Check status on load
+checkStatus();
+
+async function checkStatus() {
+    try {
+        const response = await fetch('/api/status');
+        const data = await response.json();
+
+        const statusEl = document.getElementById('statusText');
+
+        if (data.agents_loaded) {
+            statusEl.innerHTML = '✅ AI Agents Ready | Server: localhost:3000';
+            statusEl.style.color = '#10b981';
+        } else {
+            statusEl.innerHTML = '❌ AI Agents Failed to Load | Check Console';
+            statusEl.style.color = '#ef4444';
+        }
+    } catch (error) {
+        document.getElementById('statusText').innerHTML = '❌ Server Connection Error';
+        document.getElementById('statusText').style.color = '#ef4444';
+    }
+}
+
+async function askQuestion() {
+    const input = document.getElementById('questionInput');
+    const question = input.value.trim();
+
+    if (!question || isProcessing) return;
+
+    isProcessing = true;
+    const button = document.getElementById('askButton');
+    button.disabled = true;
+    button.textContent = 'Thinking...';
+
+    // Add user message
+    addMessage('user', question);
+    input.value = '';
+
+    try {
+        const response = await fetch('/api/chat', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({message: question})
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            addMessage('ai', data.response);
+        } else {
+            addMessage('system', '❌ Error: ' + data.error);
+        }
+    } catch (error) {
+        addMessage('system', '❌ Connection error: ' + error.message);
+    } finally {
+        isProcessing = false;
+        button.disabled = false;
+        button.textContent = 'Ask AI';
+    }
+}
+
+function askExample(question) {
+    document.getElementById('questionInput').value = question;
+    askQuestion();
+}
+
+function addMessage(type, message) {
+    const messagesDiv = document.getElementById('messages');
+    const messageDiv = document.createElement('div');
+    messageDiv.className = 'message ' + type + '-message';
+
+    const prefix = type === 'user' ? '👤 You: ' : 
+                  type === 'ai' ? '🤖 AI: ' : '🔔 System: ';
+
+    messageDiv.textContent = prefix + message;
+    messagesDiv.appendChild(messageDiv);
+    messagesDiv.scrollTop = messagesDiv.scrollHeight;
+}
+
+// Enter key support
+document.getElementById('questionInput').addEventListener('keypress', (e) => {
+    if (e.key === 'Enter' && !isProcessing) {
+        askQuestion();
+    }
+});
+
+// Auto-refresh status every 30 seconds
+setInterval(checkStatus, 30000);
+'''
+
+def _static_asset(name: str, text: str, content_type: str) -> tuple:
+    """
+    Encode and gzip a static asset, naming it after its content hash
     
-    def do_POST(self):
-        if self.path == '/api/chat':
-            self.handle_chat()
-        else:
-            self.send_response(404)
-            self.end_headers()
+    Args:
+        name: File name with a {} placeholder for the hash, e.g. 'app.{}.css'
+        text: Asset source
+        content_type: MIME type to serve it with
     
-    def send_html(self):
-        html_content = '''<!DOCTYPE html>
+    Returns:
+        (file name, (content type, body, gzipped body))
+    """
+    body = text.encode('utf-8')
+    filename = name.format(hashlib.blake2b(body, digest_size=8).hexdigest())
+    return filename, (content_type, body, gzip.compress(body, 6))
+
+# file name -> (content type, body, gzipped body)
+_STATIC_ASSETS = dict((
+    _static_asset('app.{}.css', APP_CSS, 'text/css'),
+    _static_asset('app.{}.js', APP_JS, 'application/javascript')
+))
+_CSS_FILENAME, _JS_FILENAME = _STATIC_ASSETS
+
+# Landing page shell - encoded (and gzipped) once at import instead of on every GET /
+_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html>
 <head>
     <title>Fantasy Draft Assistant - Basic Server</title>
     <meta charset="utf-8">
-    <style>
-        body { 
-            font-family: -apple-system, BlinkMacSystemFont, sans-serif; 
-            padding: 20px; 
-            background: #0f172a; 
-            color: white; 
-            margin: 0;
-        }
-        .container { max-width: 800px; margin: 0 auto; }
-        .header {
-            background: linear-gradient(90deg, #8b5cf6, #2563eb);
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin-bottom: 2rem;
-            text-align: center;
-        }
-        .chat-area {
-            background: #1e293b;
-            border-radius: 8px;
-            padding: 20px;
-            margin-bottom: 20px;
-        }
-        #messages {
-            height: 400px;
-            overflow-y: auto;
-            margin-bottom: 20px;
-            padding: 15px;
-            background: #0f172a;
-            border-radius: 4px;
-            border: 1px solid #475569;
-        }
-        .message {
-            margin-bottom: 15px;
-            padding: 12px;
-            border-radius: 8px;
-            line-height: 1.5;
-        }
-        .user-message {
-            background: #2563eb;
-            text-align: right;
-        }
-        .ai-message {
-            background: #059669;
-            white-space: pre-wrap;
-        }
-        .system-message {
-            background: #7c2d12;
-            font-style: italic;
-        }
-        .input-area {
-            display: flex;
-            gap: 10px;
-        }
-        input[type="text"] { 
-            flex: 1;
-            padding: 12px; 
-            border: 1px solid #475569;
-            background: #334155;
-            color: white;
-            border-radius: 4px;
-            font-size: 16px;
-        }
-        input[type="text"]:focus {
-            outline: none;
-            border-color: #2563eb;
-        }
-        button { 
-            padding: 12px 20px; 
-            background: #10b981; 
-            color: white; 
-            border: none; 
-            cursor: pointer;
-            border-radius: 4px;
-            font-weight: 600;
-        }
-        button:hover { background: #059669; }
-        button:disabled {
-            background: #6b7280;
-            cursor: not-allowed;
-        }
-        .examples {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 10px;
-            margin-top: 20px;
-        }
-        .example-btn {
-            padding: 10px;
-            background: #475569;
-            border: 1px solid #64748b;
-            color: white;
-            cursor: pointer;
-            border-radius: 4px;
-            font-size: 14px;
-            transition: background 0.2s;
-        }
-        .example-btn:hover {
-            background: #64748b;
-        }
-        .status { 
-            text-align: center; 
-            margin-bottom: 20px;
-            padding: 10px;
-            background: #1e293b;
-            border-radius: 4px;
-        }
-    </style>
+    <link rel="stylesheet" href="{css_href}">
 </head>
 <body>
     <div class="container">
@@ -204,191 +318,143 @@ class FantasyHandler(BaseHTTPRequestHandler):
         </div>
     </div>
     
-    <script>
-        let isProcessing = false;
+    <script src="{js_href}" defer></script>
+</body>
+</html>'''
+HTML = _HTML_TEMPLATE.format(
+    css_href=f'/static/{_CSS_FILENAME}',
+    js_href=f'/static/{_JS_FILENAME}'
+)
+if HAS_MINIFY_HTML:
+    _HTML_BYTES = minify_html.minify(HTML).encode('utf-8')
+else:
+    _HTML_BYTES = HTML.encode('utf-8')
+_HTML_GZ = gzip.compress(_HTML_BYTES, 6)
+
+# Strong validators, one per representation, so reloads revalidate to a bodyless 304
+_HTML_ETAG = '"%s"' % hashlib.blake2b(_HTML_BYTES, digest_size=8).hexdigest()
+_HTML_GZ_ETAG = _HTML_ETAG[:-1] + '-gz"'
+
+def _json_bytes(data: dict) -> bytes:
+    """Encode straight to bytes (orjson when installed)"""
+    return orjson.dumps(data) if HAS_ORJSON else json.dumps(data).encode('utf-8')
+
+def json_response(data: dict, status: int = 200, headers: dict = None) -> web.Response:
+    """application/json response for a dict"""
+    return web.Response(body=_json_bytes(data), status=status, content_type='application/json', headers=headers)
+
+# /api/status only ever has two possible bodies - encode both up front, keyed
+# by whether the agents are loaded
+_STATUS_BODIES = {
+    loaded: _json_bytes({"status": "running", "agents_loaded": loaded})
+    for loaded in (True, False)
+}
+
+async def send_html(request: web.Request) -> web.Response:
+    gzipped = 'gzip' in request.headers.get('Accept-Encoding', '')
+    etag = _HTML_GZ_ETAG if gzipped else _HTML_ETAG
+    headers = {
+        'Cache-Control': 'public, max-age=60',
+        'ETag': etag,
+        'Vary': 'Accept-Encoding'
+    }
+    
+    if_none_match = request.headers.get('If-None-Match', '')
+    if if_none_match == '*' or etag in (tag.strip() for tag in if_none_match.split(',')):
+        return web.Response(status=304, headers=headers)
+    
+    if gzipped:
+        headers['Content-Encoding'] = 'gzip'
+        body = _HTML_GZ
+    else:
+        body = _HTML_BYTES
+    
+    return web.Response(body=body, content_type='text/html', charset='utf-8', headers=headers)
+
+async def send_static(request: web.Request) -> web.Response:
+    asset = _STATIC_ASSETS.get(request.match_info['filename'])
+    if asset is None:
+        raise web.HTTPNotFound()
+    
+    content_type, body, body_gz = asset
+    # The hash in the name changes whenever the content does, so never revalidate
+    headers = {
+        'Cache-Control': 'public, max-age=31536000, immutable',
+        'Vary': 'Accept-Encoding'
+    }
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        headers['Content-Encoding'] = 'gzip'
+        body = body_gz
+    
+    return web.Response(body=body, content_type=content_type, charset='utf-8', headers=headers)
+
+async def send_status(request: web.Request) -> web.Response:
+    return web.Response(
+        body=_STATUS_BODIES[draft_crew is not None],
+        content_type='application/json',
+        headers={'Access-Control-Allow-Origin': '*'}
+    )
+
+async def handle_chat(request: web.Request) -> web.Response:
+    try:
+        data = _json_loads(await request.read())
         
-        // Check status on load
-        checkStatus();
+        message = data.get('message', '')
+        print(f"💬 Question: {message}")
         
-        async function checkStatus() {
-            try {
-                const response = await fetch('/api/status');
-                const data = await response.json();
-                
-                const statusEl = document.getElementById('statusText');
-                
-                if (data.agents_loaded) {
-                    statusEl.innerHTML = '✅ AI Agents Ready | Server: localhost:3000';
-                    statusEl.style.color = '#10b981';
-                } else {
-                    statusEl.innerHTML = '❌ AI Agents Failed to Load | Check Console';
-                    statusEl.style.color = '#ef4444';
-                }
-            } catch (error) {
-                document.getElementById('statusText').innerHTML = '❌ Server Connection Error';
-                document.getElementById('statusText').style.color = '#ef4444';
+        if not draft_crew:
+            response_data = {
+                "success": False,
+                "error": "AI agents not initialized - check ANTHROPIC_API_KEY in .env.local"
+            }
+        else:
+            # Context for SUPERFLEX league
+            context = {
+                "league_format": "SUPERFLEX",
+                "scoring": "Half-PPR",
+                "teams": 12,
+                "draft_position": "TBD"
             }
-        }
-        
-        async function askQuestion() {
-            const input = document.getElementById('questionInput');
-            const question = input.value.trim();
-            
-            if (!question || isProcessing) return;
-            
-            isProcessing = true;
-            const button = document.getElementById('askButton');
-            button.disabled = true;
-            button.textContent = 'Thinking...';
             
-            // Add user message
-            addMessage('user', question);
-            input.value = '';
+            print("🤖 Calling CrewAI agents...")
             
-            try {
-                const response = await fetch('/api/chat', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({message: question})
-                });
+            try:
+                # Awaited on the server's own loop - no per-request event loop
+                response = await draft_crew.analyze_draft_question(message, context)
                 
-                const data = await response.json();
+                response_data = {
+                    "success": True,
+                    "response": response,
+                    "agent_type": "CrewAI Multi-Agent System"
+                }
+                print("✅ Response generated")
                 
-                if (data.success) {
-                    addMessage('ai', data.response);
-                } else {
-                    addMessage('system', '❌ Error: ' + data.error);
+            except Exception as e:
+                print(f"❌ CrewAI error: {e}")
+                response_data = {
+                    "success": False,
+                    "error": f"AI processing error: {str(e)}"
                 }
-            } catch (error) {
-                addMessage('system', '❌ Connection error: ' + error.message);
-            } finally {
-                isProcessing = false;
-                button.disabled = false;
-                button.textContent = 'Ask AI';
-            }
-        }
         
-        function askExample(question) {
-            document.getElementById('questionInput').value = question;
-            askQuestion();
-        }
+        return json_response(response_data, headers={'Access-Control-Allow-Origin': '*'})
         
-        function addMessage(type, message) {
-            const messagesDiv = document.getElementById('messages');
-            const messageDiv = document.createElement('div');
-            messageDiv.className = 'message ' + type + '-message';
-            
-            const prefix = type === 'user' ? '👤 You: ' : 
-                          type === 'ai' ? '🤖 AI: ' : '🔔 System: ';
-            
-            messageDiv.textContent = prefix + message;
-            messagesDiv.appendChild(messageDiv);
-            messagesDiv.scrollTop = messagesDiv.scrollHeight;
+    except Exception as e:
+        print(f"❌ Chat error: {e}")
+        error_response = {
+            "success": False,
+            "error": str(e)
         }
         
-        // Enter key support
-        document.getElementById('questionInput').addEventListener('keypress', (e) => {
-            if (e.key === 'Enter' && !isProcessing) {
-                askQuestion();
-            }
-        });
-        
-        // Auto-refresh status every 30 seconds
-        setInterval(checkStatus, 30000);
-    </script>
-</body>
-</html>'''
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
-    
-    def send_status(self):
-        status_data = {
-            "status": "running",
-            "agents_loaded": draft_crew is not None,
-            "timestamp": "now"
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(status_data).encode('utf-8'))
-    
-    def handle_chat(self):
-        try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
-            
-            message = data.get('message', '')
-            print(f"💬 Question: {message}")
-            
-            if not draft_crew:
-                response_data = {
-                    "success": False,
-                    "error": "AI agents not initialized - check ANTHROPIC_API_KEY in .env.local"
-                }
-            else:
-                # Context for SUPERFLEX league
-                context = {
-                    "league_format": "SUPERFLEX",
-                    "scoring": "Half-PPR",
-                    "teams": 12,
-                    "draft_position": "TBD"
-                }
-                
-                print("🤖 Calling CrewAI agents...")
-                
-                try:
-                    # Run async function
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    response = loop.run_until_complete(
-                        draft_crew.analyze_draft_question(message, context)
-                    )
-                    loop.close()
-                    
-                    response_data = {
-                        "success": True,
-                        "response": response,
-                        "agent_type": "CrewAI Multi-Agent System"
-                    }
-                    print("✅ Response generated")
-                    
-                except Exception as e:
-                    print(f"❌ CrewAI error: {e}")
-                    response_data = {
-                        "success": False,
-                        "error": f"AI processing error: {str(e)}"
-                    }
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response_data).encode('utf-8'))
-            
-        except Exception as e:
-            print(f"❌ Chat error: {e}")
-            error_response = {
-                "success": False,
-                "error": str(e)
-            }
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
-    
-    def log_message(self, format, *args):
-        # Suppress default logging
-        return
+        return json_response(error_response, status=500)
+
+def create_app() -> web.Application:
+    """Build the aiohttp app - unknown paths get aiohttp's default 404"""
+    app = web.Application()
+    app.router.add_get('/', send_html)
+    app.router.add_get('/static/{filename}', send_static)
+    app.router.add_get('/api/status', send_status)
+    app.router.add_post('/api/chat', handle_chat)
+    return app
 
 if __name__ == '__main__':
     # Initialize agents
@@ -397,14 +463,14 @@ if __name__ == '__main__':
     if not agents_ready:
         print("⚠️  AI agents failed to load, but server will still start for testing")
     
+    # Must happen before run_app creates its loop
+    install_uvloop()
+    
     # Start server
-    server = HTTPServer(('0.0.0.0', 3000), FantasyHandler)
     print(f"🌐 Basic server running at http://localhost:3000")
     print(f"🤖 AI Agents: {'Ready' if agents_ready else 'Failed'}")
     print("Press Ctrl+C to stop")
     
-    try:
-        server.serve_forever()
-    except KeyboardInterrupt:
-        print("\n🛑 Server stopped")
-        server.server_close()
\ No newline at end of file
+    # run_app handles Ctrl+C itself and returns once the server has shut down
+    web.run_app(create_app(), host='0.0.0.0', port=3000, access_log=None, print=None)
+    print("\n🛑 Server stopped")
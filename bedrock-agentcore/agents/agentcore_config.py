@@ -0,0 +1,50 @@
+"""
+Bedrock AgentCore - Environment Configuration
+Reads .env.bedrock once per process and exposes the agent settings as a frozen object
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from dotenv import load_dotenv
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+# Earlier files win - load_dotenv never overrides a variable that's already set.
+# scripts/setup_environment.sh writes ../.env.bedrock relative to where it's run,
+# which is either this package or the directory above it
+ENV_FILES = (
+    PACKAGE_ROOT / '.env.bedrock',
+    PACKAGE_ROOT.parent / '.env.bedrock',
+)
+
+
+@dataclass(frozen=True)
+class AgentCoreConfig:
+    """Settings used by the Bedrock agents"""
+    region: str
+    model_id: str
+    embedding_model_id: str
+    agent_runtime_role_arn: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def get_config() -> AgentCoreConfig:
+    """
+    Load the .env files and build the config on first call
+
+    Returns:
+        The same AgentCoreConfig for every later call in the process
+    """
+    for env_file in ENV_FILES:
+        load_dotenv(env_file)
+
+    return AgentCoreConfig(
+        region=os.getenv('AWS_REGION', 'us-east-1'),
+        model_id=os.getenv('BEDROCK_MODEL_ID', 'anthropic.claude-3-5-sonnet-20241022-v2:0'),
+        embedding_model_id=os.getenv('BEDROCK_EMBEDDING_MODEL_ID', 'amazon.titan-embed-text-v2:0'),
+        agent_runtime_role_arn=os.getenv('AGENT_RUNTIME_ROLE_ARN')
+    )
@@ -3,17 +3,150 @@ Amazon Bedrock AgentCore - Fantasy Draft Recommendation Agent
 Proof of Concept: Single agent migration from CrewAI to Bedrock
 """
 
+import functools
+import hashlib
 import json
-import os
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import operator
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import asyncio
-from dotenv import load_dotenv
 
-# Load Bedrock environment
-load_dotenv('../.env.bedrock')
+from agentcore_config import get_config
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+_json_dumps = orjson.dumps if HAS_ORJSON else (lambda obj: json.dumps(obj).encode('utf-8'))
+
+# Optional fast non-cryptographic hash for cache keys (blake2b otherwise)
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+# Bigger keep-alive pool than botocore's default 10 so concurrent recommendations
+# reuse warm TLS connections instead of queueing or re-handshaking
+BEDROCK_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=60
+)
+
+# ThrottlingException retries on top of botocore's own - bounded, with
+# exponential backoff (0.5s, 1s, 2s, ... capped at 10s) and full jitter
+THROTTLE_MAX_RETRIES = 4
+THROTTLE_BACKOFF_BASE = 0.5  # seconds
+THROTTLE_BACKOFF_CAP = 10  # seconds
+
+# {agent name: agent ID} from earlier runs, so an existing agent is found with
+# one get_agent call instead of paging through list_agents
+AGENT_ID_CACHE_FILE = Path(__file__).resolve().parent / '.agent_cache.json'
+
+# Recommendation prompt - filled in by _build_prompt with str.format
+PROMPT_TEMPLATE = """CONTEXT:
+- League Format: SUPERFLEX Half-PPR, 12 teams
+- Current Pick: #{current_pick}
+- Your Current Roster: {roster}
+
+TOP AVAILABLE PLAYERS:
+{players}
+
+USER QUESTION: {question}
+
+Provide a clear recommendation with:
+1. Top 3 player suggestions
+2. Brief reasoning for each (1-2 sentences)
+3. Consider SUPERFLEX premium on QBs
+
+Keep response under 200 words for quick decision making.
+"""
+
+# Canned advice when Bedrock is unavailable, by pick tier (1-4, 5-8, 9+)
+FALLBACK_RECOMMENDATIONS = (
+    """🎯 **Quick Recommendation** (Fallback):
+
+**Top 3 Options:**
+1. **Elite QB** (Josh Allen/Lamar Jackson) - SUPERFLEX premium makes them worth early picks
+2. **Elite RB** (Christian McCaffrey/Breece Hall) - Workhorse backs are scarce
+3. **Elite WR** (Tyreek Hill/CeeDee Lamb) - Consistent high-floor producers
+
+In SUPERFLEX, don't be afraid to take a QB early - they score more and are more consistent than other positions.""",
+    """🎯 **Quick Recommendation** (Fallback):
+
+**Top 3 Options:**
+1. **Tier 2 QB** (Dak Prescott/Jalen Hurts) - Still elite in SUPERFLEX format
+2. **Top RB** (Bijan Robinson/Jonathan Taylor) - Volume-based RB1s
+3. **Elite WR** (Justin Jefferson/Ja'Marr Chase) - Target monsters
+
+Focus on securing at least one QB in the first 3 rounds for SUPERFLEX advantage.""",
+    """🎯 **Quick Recommendation** (Fallback):
+
+**Top 3 Options:**
+1. **Value QB** (Trevor Lawrence/Tua) - Don't wait too long on QB2
+2. **Upside RB** (James Cook/Rachaad White) - PPR value backs
+3. **Target WR** (Chris Olave/DK Metcalf) - High-upside WR2s
+
+From late position, consider going RB-heavy early then grabbing QBs in rounds 3-5.""",
+)
+
+# Prefix of every model-generated recommendation
+RECOMMENDATION_HEADER = "🎯 **AI Recommendation**:\n\n"
+# Last piece of a streamed recommendation that broke off part way
+STREAM_INTERRUPTED_NOTICE = "\n\n⚠️ *Response interrupted - this answer is incomplete.*"
+
+# Semantic cache (opt-in): a question whose embedding is this close (cosine) to an
+# already-answered one for the same draft context and the same named entities
+# reuses that answer. "Should I draft Josh Allen?" and "...Jalen Hurts?" embed
+# above 0.93, so entities must match exactly; 0.97 then only admits rewordings
+# that are near-verbatim, where serving another phrasing's answer is safe
+SEMANTIC_CACHE_THRESHOLD = 0.97
+EMBEDDING_DIMENSIONS = 256  # Titan v2 supports 256/512/1024; 256 is plenty for short questions
+SEMANTIC_INDEX_MAX_PER_CONTEXT = 256
+
+# Capitalized words past the start of a sentence (names, teams, QB/RB...) and numbers
+_ENTITY_PATTERN = re.compile(r'(?<![.!?]\s)(?<!^)\b[A-Z][\w\'.-]*|\b\d+\b')
+
+@functools.lru_cache(maxsize=None)
+def get_bedrock_client(service_name: str, region: str):
+    """Shared client per service/region - every agent instance uses the same pool"""
+    return boto3.client(service_name=service_name, region_name=region, config=BEDROCK_CLIENT_CONFIG)
+
+@dataclass(slots=True, frozen=True)
+class DraftContext:
+    """The parts of a request's draft context the agent actually uses"""
+    current_pick: Optional[int]  # None when unknown
+    available_players: tuple  # top 10 only - all the prompt shows
+    user_roster: tuple
+    
+    @classmethod
+    def from_dict(cls, context: Dict[str, Any]) -> 'DraftContext':
+        """Extract once per request; a non-numeric pick becomes None"""
+        try:
+            current_pick = int(context['current_pick'])
+        except (KeyError, TypeError, ValueError):
+            current_pick = None
+        return cls(
+            current_pick=current_pick,
+            available_players=tuple(context.get('available_players') or ())[:10],
+            user_roster=tuple(context.get('user_roster') or ())
+        )
 
 class BedrockRecommendationAgent:
     """
@@ -23,21 +156,25 @@ class BedrockRecommendationAgent:
     clear, actionable draft recommendations.
     """
     
-    def __init__(self):
-        """Initialize Bedrock client and configuration"""
-        self.region = os.getenv('AWS_REGION', 'us-east-1')
-        self.model_id = os.getenv('BEDROCK_MODEL_ID', 'anthropic.claude-3-5-sonnet-20241022-v2:0')
+    def __init__(self, semantic_cache: bool = False):
+        """
+        Initialize Bedrock client and configuration
         
-        # Initialize Bedrock clients
-        self.bedrock_runtime = boto3.client(
-            service_name='bedrock-runtime',
-            region_name=self.region
-        )
+        Args:
+            semantic_cache: Reuse answers for reworded questions that name the
+                same players (needs access to the Titan embeddings model, adds
+                an embedding call to every cache miss; switches itself off if
+                denied)
+        """
+        self.config = get_config()
+        self.region = self.config.region
+        self.model_id = self.config.model_id
+        self.embedding_model_id = self.config.embedding_model_id
         
-        self.bedrock_agent = boto3.client(
-            service_name='bedrock-agent-runtime',
-            region_name=self.region
-        )
+        # Initialize Bedrock clients
+        self.bedrock_runtime = get_bedrock_client('bedrock-runtime', self.region)
+        # create_agent/get_agent/list_agents live on the control-plane service
+        self.bedrock_agent = get_bedrock_client('bedrock-agent', self.region)
         
         # Agent configuration
         self.agent_config = {
@@ -63,9 +200,16 @@ class BedrockRecommendationAgent:
             "tools": self._define_tools()
         }
         
-        # Cache for performance
-        self._cache = {}
+        # Recommendation cache: key -> (expires_at, response), least recently
+        # used first so the oldest entry is evicted once it's full
+        self._cache = OrderedDict()
         self._cache_ttl = 300  # 5 minutes
+        self._cache_maxsize = 1024
+        
+        # Semantic layer over _cache: (context digest, question entities) ->
+        # [(unit vector, cache key)]
+        self._semantic_cache = semantic_cache
+        self._semantic_index = {}
     
     def _define_tools(self) -> List[Dict[str, Any]]:
         """Define tools available to the agent"""
@@ -149,129 +293,331 @@ class BedrockRecommendationAgent:
         Returns:
             Recommendation string with reasoning
         """
+        ctx = DraftContext.from_dict(context)
         try:
-            # Check cache first
-            cache_key = f"{context.get('current_pick', 0)}_{question or 'default'}"
-            if cache_key in self._cache:
-                cached_time, cached_response = self._cache[cache_key]
-                if (datetime.now() - cached_time).seconds < self._cache_ttl:
-                    return f"📍 (Cached) {cached_response}"
+            cached_response, cache_key, semantic_slot = await self._find_cached(ctx, question)
+            if cached_response is not None:
+                return f"📍 (Cached) {cached_response}"
             
             # Prepare the prompt
-            prompt = self._build_prompt(context, question)
+            prompt = self._build_prompt(ctx, question)
             
             # Invoke Bedrock model
             response = await self._invoke_bedrock(prompt)
             
             # Cache the response
-            self._cache[cache_key] = (datetime.now(), response)
+            self._remember(cache_key, semantic_slot, response)
             
             return response
             
         except Exception as e:
             print(f"❌ Bedrock agent error: {e}")
-            return self._get_fallback_recommendation(context)
+            return self._get_fallback_recommendation(ctx)
     
-    def _build_prompt(self, context: Dict[str, Any], question: Optional[str]) -> str:
-        """Build prompt for Bedrock model"""
-        current_pick = context.get('current_pick', 'Unknown')
-        available_players = context.get('available_players', [])[:10]
-        user_roster = context.get('user_roster', [])
+    async def stream_recommendation(
+        self,
+        context: Dict[str, Any],
+        question: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Same as get_recommendation, but yields the answer as the model writes it
+        
+        Cache hits (and the fallback) arrive as a single piece; otherwise the
+        first text shows up after the model's first token rather than after
+        the whole completion. If the stream breaks after text was sent, the
+        last piece is STREAM_INTERRUPTED_NOTICE and nothing is cached.
         
-        prompt = f"""
-        CONTEXT:
-        - League Format: SUPERFLEX Half-PPR, 12 teams
-        - Current Pick: #{current_pick}
-        - Your Current Roster: {', '.join(user_roster) if user_roster else 'Empty'}
+        Args:
+            context: Current draft context (pick number, available players, etc.)
+            question: Optional specific question from user
+            
+        Yields:
+            Successive pieces of the recommendation text
+        """
+        ctx = DraftContext.from_dict(context)
+        started = False
+        try:
+            cached_response, cache_key, semantic_slot = await self._find_cached(ctx, question)
+            if cached_response is not None:
+                yield f"📍 (Cached) {cached_response}"
+                return
+            
+            # Header goes out with the first delta, so a call that fails up front
+            # can still be answered with the fallback
+            pieces = [RECOMMENDATION_HEADER]
+            async with aclosing(self._stream_bedrock(self._build_prompt(ctx, question))) as stream:
+                async for piece in stream:
+                    if not started:
+                        started = True
+                        yield RECOMMENDATION_HEADER
+                    pieces.append(piece)
+                    yield piece
+            
+            self._remember(cache_key, semantic_slot, ''.join(pieces))
+            
+        except Exception as e:
+            print(f"❌ Bedrock agent error: {e}")
+            if started:
+                yield STREAM_INTERRUPTED_NOTICE
+            else:
+                yield self._get_fallback_recommendation(ctx)
+    
+    async def _find_cached(self, ctx: DraftContext, question: Optional[str]) -> tuple:
+        """
+        Look the request up in the exact cache, then the semantic cache
         
-        TOP AVAILABLE PLAYERS:
-        {chr(10).join(available_players) if available_players else 'No data available'}
+        Returns:
+            (cached response or None, exact cache key, semantic slot) - pass the
+            key and slot to _remember once a fresh answer has been generated
+        """
+        cache_key = self._cache_key(ctx, question)
+        cached_response = self._cache_get(cache_key)
+        if cached_response is not None:
+            return cached_response, cache_key, None
         
-        USER QUESTION: {question or 'Who should I draft with this pick?'}
+        # Then a reworded version of a question already answered for this context
+        if question and self._semantic_cache:
+            context_key = (self._cache_key(ctx, None), self._question_entities(ctx, question))
+            question_vec = await self._embed_question(question)
+            if question_vec is not None:
+                return self._semantic_lookup(context_key, question_vec), cache_key, (context_key, question_vec)
         
-        Provide a clear recommendation with:
-        1. Top 3 player suggestions
-        2. Brief reasoning for each (1-2 sentences)
-        3. Consider SUPERFLEX premium on QBs
+        return None, cache_key, None
+    
+    @staticmethod
+    def _question_entities(ctx: DraftContext, question: str) -> frozenset:
+        """
+        Players, teams, positions and numbers a question names
         
-        Keep response under 200 words for quick decision making.
+        Questions that differ only in these embed almost identically, so the
+        semantic cache only compares questions whose entities match. Words of
+        player names in the draft context count even when typed in lowercase.
         """
+        entities = {match.lower() for match in _ENTITY_PATTERN.findall(question.strip()) if match != 'I'}
+        name_words = {word.lower() for name in ctx.available_players + ctx.user_roster for word in str(name).split()}
+        entities.update(word for word in re.findall(r"[\w'.-]+", question.lower()) if word in name_words)
+        return frozenset(entities)
+    
+    def _remember(self, cache_key: int, semantic_slot: Optional[tuple], response: str):
+        """Cache a freshly generated response under both cache layers"""
+        self._cache_put(cache_key, response)
+        if semantic_slot is not None:
+            context_key, question_vec = semantic_slot
+            self._semantic_add(context_key, question_vec, cache_key)
+    
+    @staticmethod
+    def _cache_key(ctx: DraftContext, question: Optional[str]) -> int:
+        """
+        64-bit digest of the draft context plus question
         
-        return prompt
+        Same pick with a different roster is a miss, and the dict key is a
+        small int however long the question or player list gets.
+        """
+        key = (ctx.current_pick, ctx.available_players, ctx.user_roster, question)
+        raw = orjson.dumps(key, default=str) if HAS_ORJSON else json.dumps(key, default=str).encode('utf-8')
+        if HAS_XXHASH:
+            return xxhash.xxh3_64_intdigest(raw)
+        return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), 'big')
+    
+    def _cache_get(self, key: int) -> Optional[str]:
+        """Cached response for key, or None if missing/expired"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return response
+    
+    def _cache_put(self, key: int, response: str):
+        """Store a response, evicting the least recently used entry when full"""
+        self._cache[key] = (time.monotonic() + self._cache_ttl, response)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_maxsize:
+            self._cache.popitem(last=False)
+    
+    def _embed_sync(self, text: str) -> tuple:
+        """Blocking Titan embeddings call; returns a unit-length vector"""
+        request = {"inputText": text, "dimensions": EMBEDDING_DIMENSIONS, "normalize": True}
+        response = self.bedrock_runtime.invoke_model(
+            modelId=self.embedding_model_id,
+            body=orjson.dumps(request) if HAS_ORJSON else json.dumps(request).encode('utf-8'),
+            contentType='application/json',
+            accept='application/json'
+        )
+        return tuple(_json_loads(response['body'].read())['embedding'])
+    
+    async def _embed_question(self, question: str) -> Optional[tuple]:
+        """Embedding for a question, or None if the semantic cache can't be used"""
+        try:
+            return await asyncio.to_thread(self._embed_sync, question)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('AccessDeniedException', 'ValidationException', 'ResourceNotFoundException'):
+                # Not going to start working on the next call either
+                print(f"⚠️ Semantic cache disabled - embeddings unavailable: {e}")
+                self._semantic_cache = False
+            return None
+        except Exception as e:
+            print(f"⚠️ Embedding failed, skipping semantic cache: {e}")
+            return None
+    
+    def _semantic_lookup(self, context_key: tuple, question_vec: tuple) -> Optional[str]:
+        """Cached answer to the most similar earlier question, if similar enough"""
+        entries = self._semantic_index.get(context_key)
+        if not entries:
+            return None
+        
+        # Forget questions whose answers were evicted from _cache
+        entries[:] = [entry for entry in entries if entry[1] in self._cache]
+        
+        best_score, best_key = 0.0, None
+        for vec, key in entries:
+            # Vectors are normalized, so the dot product is the cosine similarity
+            score = sum(map(operator.mul, vec, question_vec))
+            if score > best_score:
+                best_score, best_key = score, key
+        
+        if best_key is None or best_score < SEMANTIC_CACHE_THRESHOLD:
+            return None
+        return self._cache_get(best_key)
+    
+    def _semantic_add(self, context_key: tuple, question_vec: tuple, cache_key: int):
+        """Index an answered question's embedding under its draft context and entities"""
+        entries = self._semantic_index.setdefault(context_key, [])
+        entries.append((question_vec, cache_key))
+        if len(entries) > SEMANTIC_INDEX_MAX_PER_CONTEXT:
+            del entries[0]
+    
+    def _build_prompt(self, ctx: DraftContext, question: Optional[str]) -> str:
+        """Build prompt for Bedrock model"""
+        return PROMPT_TEMPLATE.format(
+            current_pick=ctx.current_pick if ctx.current_pick is not None else 'Unknown',
+            roster=', '.join(ctx.user_roster) if ctx.user_roster else 'Empty',
+            players='\n'.join(ctx.available_players) if ctx.available_players else 'No data available',
+            question=question or 'Who should I draft with this pick?'
+        )
+    
+    def _invoke_model_sync(self, body: bytes) -> Dict[str, Any]:
+        """Blocking invoke_model call plus body read; returns the parsed reply"""
+        response = self.bedrock_runtime.invoke_model(
+            modelId=self.model_id,
+            body=body,
+            contentType='application/json',
+            accept='application/json'
+        )
+        return _json_loads(response['body'].read())
+    
+    @staticmethod
+    def _request_body(prompt: str) -> bytes:
+        """Claude messages request for a prompt (invoke_model takes bytes, so no str round-trip)"""
+        request = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 500,
+            "temperature": 0.7,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+        return orjson.dumps(request) if HAS_ORJSON else json.dumps(request).encode('utf-8')
+    
+    async def _call_with_throttle_retry(self, fn: Callable[..., Any], *args) -> Any:
+        """
+        Run a blocking Bedrock call in a worker thread, retrying ThrottlingException
+        
+        boto3 blocks for the whole call, so the event loop keeps serving other
+        requests meanwhile.
+        """
+        for attempt in range(THROTTLE_MAX_RETRIES + 1):
+            try:
+                return await asyncio.to_thread(fn, *args)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ThrottlingException' or attempt == THROTTLE_MAX_RETRIES:
+                    raise
+                # Full jitter spreads concurrent retries out instead of having
+                # them all hit Bedrock again at the same moment
+                await asyncio.sleep(random.uniform(0, min(THROTTLE_BACKOFF_CAP, THROTTLE_BACKOFF_BASE * 2 ** attempt)))
     
     async def _invoke_bedrock(self, prompt: str) -> str:
         """Invoke Bedrock model for recommendation"""
+        response_body = await self._call_with_throttle_retry(self._invoke_model_sync, self._request_body(prompt))
+        
+        recommendation = response_body.get('content', [{}])[0].get('text', '')
+        return f"{RECOMMENDATION_HEADER}{recommendation}"
+    
+    def _open_stream_sync(self, body: bytes):
+        """Blocking invoke_model_with_response_stream call; returns the event stream"""
+        response = self.bedrock_runtime.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            body=body,
+            contentType='application/json',
+            accept='application/json'
+        )
+        return response['body']
+    
+    async def _stream_bedrock(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Yield text deltas from invoke_model_with_response_stream
+        
+        Throttling is reported when the stream is opened, before any text, so
+        that step is retried like _invoke_bedrock. The boto3 event stream is a
+        blocking iterator, so a worker thread reads it and hands each delta to
+        the event loop through a queue.
+        """
+        stream = await self._call_with_throttle_retry(self._open_stream_sync, self._request_body(prompt))
+        
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        stop = threading.Event()
+        
+        def produce():
+            try:
+                for event in stream:
+                    if stop.is_set():
+                        return
+                    chunk = event.get('chunk')
+                    if not chunk:
+                        continue
+                    data = _json_loads(chunk['bytes'])
+                    if data.get('type') == 'content_block_delta':
+                        text = data.get('delta', {}).get('text')
+                        if text:
+                            loop.call_soon_threadsafe(queue.put_nowait, text)
+            except Exception as e:
+                if not stop.is_set():
+                    loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                if not stop.is_set():
+                    loop.call_soon_threadsafe(queue.put_nowait, None)
+        
+        producer = loop.run_in_executor(None, produce)
         try:
-            # Prepare the request
-            body = json.dumps({
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 500,
-                "temperature": 0.7,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            })
-            
-            # Make the API call
-            response = self.bedrock_runtime.invoke_model(
-                modelId=self.model_id,
-                body=body,
-                contentType='application/json',
-                accept='application/json'
-            )
-            
-            # Parse response
-            response_body = json.loads(response['body'].read())
-            recommendation = response_body.get('content', [{}])[0].get('text', '')
-            
-            return f"🎯 **AI Recommendation**:\n\n{recommendation}"
-            
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'ThrottlingException':
-                # Wait and retry once
-                await asyncio.sleep(1)
-                return await self._invoke_bedrock(prompt)
-            else:
-                raise e
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Also runs when the consumer stops early - stop the reader and
+            # release the connection instead of reading the rest of the answer
+            stop.set()
+            stream.close()
+            await producer
     
-    def _get_fallback_recommendation(self, context: Dict[str, Any]) -> str:
+    def _get_fallback_recommendation(self, ctx: DraftContext) -> str:
         """Provide fallback recommendation if Bedrock fails"""
-        current_pick = context.get('current_pick', 'Unknown')
+        # An unknown pick is treated as a late pick
+        current_pick = ctx.current_pick if ctx.current_pick is not None else 99
         
         # Simple pick-based recommendations
-        if current_pick <= 4:
-            return """🎯 **Quick Recommendation** (Fallback):
-
-**Top 3 Options:**
-1. **Elite QB** (Josh Allen/Lamar Jackson) - SUPERFLEX premium makes them worth early picks
-2. **Elite RB** (Christian McCaffrey/Breece Hall) - Workhorse backs are scarce
-3. **Elite WR** (Tyreek Hill/CeeDee Lamb) - Consistent high-floor producers
-
-In SUPERFLEX, don't be afraid to take a QB early - they score more and are more consistent than other positions."""
-        
-        elif current_pick <= 8:
-            return """🎯 **Quick Recommendation** (Fallback):
-
-**Top 3 Options:**
-1. **Tier 2 QB** (Dak Prescott/Jalen Hurts) - Still elite in SUPERFLEX format
-2. **Top RB** (Bijan Robinson/Jonathan Taylor) - Volume-based RB1s
-3. **Elite WR** (Justin Jefferson/Ja'Marr Chase) - Target monsters
-
-Focus on securing at least one QB in the first 3 rounds for SUPERFLEX advantage."""
-        
-        else:
-            return """🎯 **Quick Recommendation** (Fallback):
-
-**Top 3 Options:**
-1. **Value QB** (Trevor Lawrence/Tua) - Don't wait too long on QB2
-2. **Upside RB** (James Cook/Rachaad White) - PPR value backs
-3. **Target WR** (Chris Olave/DK Metcalf) - High-upside WR2s
-
-From late position, consider going RB-heavy early then grabbing QBs in rounds 3-5."""
+        tier = 0 if current_pick <= 4 else 1 if current_pick <= 8 else 2
+        return FALLBACK_RECOMMENDATIONS[tier]
     
     async def create_bedrock_agent(self) -> Dict[str, Any]:
         """
@@ -282,13 +628,15 @@ From late position, consider going RB-heavy early then grabbing QBs in rounds 3-
         """
         try:
             agent_name = self.agent_config['name']
-            role_arn = os.getenv('AGENT_RUNTIME_ROLE_ARN')
+            role_arn = self.config.agent_runtime_role_arn
             
             if not role_arn:
                 raise ValueError("AGENT_RUNTIME_ROLE_ARN not set in .env.bedrock")
             
-            # Create agent request
-            response = self.bedrock_agent.create_agent(
+            # Create agent request (in a worker thread, like invoke_model, so it
+            # overlaps with recommendations running on the same loop)
+            response = await asyncio.to_thread(
+                self.bedrock_agent.create_agent,
                 agentName=agent_name,
                 agentResourceRoleArn=role_arn,
                 description=self.agent_config['description'],
@@ -299,6 +647,7 @@ From late position, consider going RB-heavy early then grabbing QBs in rounds 3-
             
             agent_id = response['agent']['agentId']
             agent_arn = response['agent']['agentArn']
+            self._remember_agent_id(agent_name, agent_id)
             
             print(f"✅ Created Bedrock Agent: {agent_id}")
             print(f"   ARN: {agent_arn}")
@@ -318,19 +667,77 @@ From late position, consider going RB-heavy early then grabbing QBs in rounds 3-
                 raise e
     
     async def _get_existing_agent(self) -> Dict[str, Any]:
-        """Get details of existing agent"""
-        # List agents and find ours
-        response = self.bedrock_agent.list_agents()
+        """
+        Get details of the existing agent
         
-        for agent in response.get('agentSummaries', []):
-            if agent['agentName'] == self.agent_config['name']:
-                return {
-                    "agent_id": agent['agentId'],
-                    "agent_arn": agent['agentArn'],
-                    "status": agent['agentStatus']
-                }
+        Tries the agent ID remembered from an earlier run first, then falls
+        back to paging through list_agents (a single page misses agents on
+        accounts with more than one page of them).
         
-        raise ValueError(f"Agent {self.agent_config['name']} not found")
+        Returns:
+            Agent details including ID and ARN
+        """
+        agent_name = self.agent_config['name']
+        
+        cached_id = self._load_agent_ids().get(agent_name)
+        if cached_id:
+            try:
+                response = await asyncio.to_thread(self.bedrock_agent.get_agent, agentId=cached_id)
+                agent = response['agent']
+                if agent['agentName'] == agent_name:
+                    return self._agent_details(agent)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ResourceNotFoundException':
+                    raise
+            print(f"⚠️ Cached agent ID {cached_id} is stale, searching list_agents...")
+        
+        agent = await asyncio.to_thread(self._find_agent_summary, agent_name)
+        if agent is None:
+            raise ValueError(f"Agent {agent_name} not found")
+        
+        self._remember_agent_id(agent_name, agent['agentId'])
+        return self._agent_details(agent)
+    
+    def _find_agent_summary(self, agent_name: str) -> Optional[Dict[str, Any]]:
+        """Page through list_agents until an agent named agent_name turns up"""
+        paginator = self.bedrock_agent.get_paginator('list_agents')
+        for page in paginator.paginate():
+            for agent in page.get('agentSummaries', []):
+                if agent['agentName'] == agent_name:
+                    return agent
+        return None
+    
+    @staticmethod
+    def _agent_details(agent: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a get_agent response or list_agents summary like create_bedrock_agent's result"""
+        details = {
+            "agent_id": agent['agentId'],
+            "status": agent['agentStatus']
+        }
+        # list_agents summaries don't carry the ARN
+        if 'agentArn' in agent:
+            details["agent_arn"] = agent['agentArn']
+        return details
+    
+    @staticmethod
+    def _load_agent_ids() -> Dict[str, str]:
+        """Read AGENT_ID_CACHE_FILE, treating a missing or corrupt file as empty"""
+        try:
+            return _json_loads(AGENT_ID_CACHE_FILE.read_bytes())
+        except (OSError, ValueError):
+            return {}
+    
+    def _remember_agent_id(self, agent_name: str, agent_id: str):
+        """Record agent_name's ID in AGENT_ID_CACHE_FILE for the next run"""
+        agent_ids = self._load_agent_ids()
+        if agent_ids.get(agent_name) == agent_id:
+            return
+        
+        agent_ids[agent_name] = agent_id
+        try:
+            AGENT_ID_CACHE_FILE.write_bytes(_json_dumps(agent_ids))
+        except OSError as e:
+            print(f"⚠️ Could not save agent ID cache: {e}")
 
 
 # Test function
@@ -359,27 +766,35 @@ async def test_bedrock_agent():
         "user_roster": []
     }
     
+    # The three tests are independent, so run them concurrently and report in order
+    basic, comparison, agent_details = await asyncio.gather(
+        agent.get_recommendation(test_context),
+        agent.get_recommendation(test_context, "Should I take Josh Allen or Justin Jefferson?"),
+        agent.create_bedrock_agent(),
+        return_exceptions=True
+    )
+    
     # Test 1: Basic recommendation
     print("\n📋 Test 1: Basic Pick Recommendation")
-    recommendation = await agent.get_recommendation(test_context)
-    print(recommendation)
+    print(basic)
     
     # Test 2: Specific question
     print("\n📋 Test 2: Player Comparison")
-    recommendation = await agent.get_recommendation(
-        test_context,
-        "Should I take Josh Allen or Justin Jefferson?"
-    )
-    print(recommendation)
+    print(comparison)
     
     # Test 3: Create agent in Bedrock (optional)
     print("\n📋 Test 3: Create Bedrock Agent")
-    try:
-        agent_details = await agent.create_bedrock_agent()
-        print(f"✅ Agent Details: {json.dumps(agent_details, indent=2)}")
-    except Exception as e:
-        print(f"⚠️ Could not create agent: {e}")
+    if isinstance(agent_details, Exception):
+        print(f"⚠️ Could not create agent: {agent_details}")
         print("   (This is normal if IAM roles aren't set up yet)")
+    else:
+        print(f"✅ Agent Details: {json.dumps(agent_details, indent=2)}")
+    
+    # Test 4: Streamed answer, printed as it arrives
+    print("\n📋 Test 4: Streamed Recommendation")
+    async for piece in agent.stream_recommendation(test_context, "Which QB should I target in round 2?"):
+        print(piece, end='', flush=True)
+    print()
     
     print("\n" + "=" * 50)
     print("✅ Bedrock Agent tests complete!")
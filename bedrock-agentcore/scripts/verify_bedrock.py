@@ -3,36 +3,69 @@
 Verify Amazon Bedrock is enabled and accessible
 """
 
-import boto3
+import asyncio
 import json
+import operator
+from contextlib import AsyncExitStack
+
+import aioboto3
 from botocore.exceptions import ClientError
 
-def verify_bedrock():
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+_json_dumps = orjson.dumps if HAS_ORJSON else (lambda obj: json.dumps(obj).encode('utf-8'))
+
+REGION = 'us-east-1'
+
+# Fields printed for each Claude model summary
+_summary_fields = operator.itemgetter('modelId', 'providerName', 'modelName')
+
+async def verify_bedrock():
     """Check Bedrock access and available models"""
     
     print("🔍 Verifying Amazon Bedrock Access")
     print("=" * 50)
     
-    # Initialize Bedrock client
-    bedrock = boto3.client('bedrock', region_name='us-east-1')
-    
+    session = aioboto3.Session()
+    async with AsyncExitStack() as stack:
+        bedrock = await stack.enter_async_context(session.client('bedrock', region_name=REGION))
+        bedrock_runtime = await stack.enter_async_context(session.client('bedrock-runtime', region_name=REGION))
+        sts = await stack.enter_async_context(session.client('sts'))
+        
+        # The identity lookup (step 4) doesn't depend on the model list - start
+        # it now so both round-trips are in flight together
+        sts_task = asyncio.create_task(sts.get_caller_identity())
+        try:
+            return await _run_checks(bedrock, bedrock_runtime, sts_task)
+        finally:
+            # Early returns never await it - cancel and reap so no error goes unretrieved
+            sts_task.cancel()
+            await asyncio.gather(sts_task, return_exceptions=True)
+
+async def _run_checks(bedrock, bedrock_runtime, sts_task) -> bool:
+    """Steps 1-4 of verify_bedrock, on already-open clients"""
     try:
         # Step 1: Check if we can list models
         print("\n1️⃣ Checking Bedrock API access...")
-        response = bedrock.list_foundation_models()
+        response = await bedrock.list_foundation_models()
         print("✅ Bedrock API is accessible!")
         
         # Step 2: List available Claude models
         print("\n2️⃣ Available Claude models:")
-        claude_models = []
-        for model in response['modelSummaries']:
-            if 'claude' in model['modelId'].lower():
-                claude_models.append(model)
-                status = "✅" if model.get('modelLifecycle', {}).get('status') == 'ACTIVE' else "⏳"
-                print(f"   {status} {model['modelId']}")
-                print(f"      Provider: {model['providerName']}")
-                print(f"      Name: {model['modelName']}")
-                print()
+        claude_models = [m for m in response['modelSummaries'] if 'claude' in m['modelId'].lower()]
+        for model in claude_models:
+            model_id, provider, name = _summary_fields(model)
+            lifecycle = model.get('modelLifecycle') or {}
+            status = "✅" if lifecycle.get('status') == 'ACTIVE' else "⏳"
+            print(f"   {status} {model_id}")
+            print(f"      Provider: {provider}")
+            print(f"      Name: {name}")
+            print()
         
         if not claude_models:
             print("   ⚠️ No Claude models found. Please enable them in the console.")
@@ -40,13 +73,12 @@ def verify_bedrock():
             
         # Step 3: Test model invocation
         print("3️⃣ Testing model invocation...")
-        bedrock_runtime = boto3.client('bedrock-runtime', region_name='us-east-1')
         
         # Try to invoke Claude 3.5 Sonnet
         test_model = 'anthropic.claude-3-5-sonnet-20241022-v2:0'
         
         try:
-            body = json.dumps({
+            body = _json_dumps({
                 "anthropic_version": "bedrock-2023-05-31",
                 "max_tokens": 100,
                 "messages": [
@@ -57,14 +89,14 @@ def verify_bedrock():
                 ]
             })
             
-            response = bedrock_runtime.invoke_model(
+            response = await bedrock_runtime.invoke_model(
                 modelId=test_model,
                 body=body,
                 contentType='application/json',
                 accept='application/json'
             )
             
-            result = json.loads(response['body'].read())
+            result = _json_loads(await response['body'].read())
             message = result['content'][0]['text']
             print(f"✅ Model invocation successful!")
             print(f"   Response: {message}")
@@ -76,7 +108,7 @@ def verify_bedrock():
                 # Try alternate model ID
                 test_model = 'anthropic.claude-3-sonnet-20240229-v1:0'
                 try:
-                    response = bedrock_runtime.invoke_model(
+                    response = await bedrock_runtime.invoke_model(
                         modelId=test_model,
                         body=body,
                         contentType='application/json',
@@ -93,10 +125,7 @@ def verify_bedrock():
                 
         # Step 4: Check IAM permissions
         print("\n4️⃣ Checking IAM permissions...")
-        iam = boto3.client('iam')
-        sts = boto3.client('sts')
-        
-        identity = sts.get_caller_identity()
+        identity = await sts_task
         print(f"   Current user: {identity['Arn']}")
         
         # Summary
@@ -142,4 +171,4 @@ def verify_bedrock():
         return False
 
 if __name__ == "__main__":
-    verify_bedrock()
\ No newline at end of file
+    asyncio.run(verify_bedrock())
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Fantasy Football Draft Assistant - Environment Configuration
+Reads the .env files once per process and exposes the settings as a frozen object
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from dotenv import load_dotenv
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Earlier files win - load_dotenv never overrides a variable that's already set.
+# The Bedrock agents read their own settings (bedrock-agentcore/agents/agentcore_config.py)
+ENV_FILES = (
+    PROJECT_ROOT / '.env.local',
+)
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """Settings used by the web server"""
+    anthropic_api_key: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """
+    Load the .env files and build the config on first call
+
+    Returns:
+        The same AppConfig for every later call in the process
+    """
+    for env_file in ENV_FILES:
+        load_dotenv(env_file)
+
+    return AppConfig(
+        anthropic_api_key=os.getenv('ANTHROPIC_API_KEY')
+    )
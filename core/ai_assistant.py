@@ -10,10 +10,12 @@ This module provides the AI brain of the draft assistant, capable of:
 """
 
 import os
+import hashlib
 import json
 import asyncio
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+import time
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Any, Union
 from pathlib import Path
 
 # Anthropic Claude integration
@@ -24,11 +26,112 @@ except ImportError:
     HAS_ANTHROPIC = False
     print("⚠️ Anthropic package not installed. Install with: pip install anthropic")
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional cross-session answer cache (enabled by setting REDIS_URL)
+try:
+    import redis.asyncio as redis_asyncio
+    from redis.exceptions import RedisError
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
 from core.league_context import league_manager
 from core.mcp_integration import MCPClient
 from api.sleeper_client import SleeperClient
 
 
+def _json_text(data: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """
+    Serialize data for a prompt, tool result or cache key (orjson when installed)
+    
+    Args:
+        data: JSON-compatible value
+        indent: Pretty-print with 2-space indentation
+        sort_keys: Emit object keys in sorted order (canonical form for hashing)
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option).decode('utf-8')
+    return json.dumps(data, indent=2 if indent else None, sort_keys=sort_keys)
+
+
+# Instructions shared by every Claude call. Kept byte-identical between requests
+# so it can be served from Anthropic's prompt cache once it is long enough to
+# qualify (see _build_system_prompt); anything that varies belongs in
+# _dynamic_league_block instead.
+STATIC_SYSTEM_PROMPT = """You are an expert fantasy football draft assistant with deep knowledge of player analysis, draft strategy, and league dynamics.
+
+DRAFT DATE: August 14, 2025
+
+YOUR EXPERTISE:
+- Player analysis and comparisons
+- Draft strategy optimization
+- Injury and trend analysis
+- Matchup evaluation
+- Roster construction
+- Value identification
+- Positional scarcity understanding
+
+PERSONALITY:
+- Direct and analytical, but conversational
+- Focus on actionable insights
+- Explain your reasoning clearly
+- Consider multiple factors in recommendations
+- Acknowledge uncertainty when appropriate
+- Be enthusiastic about good picks/strategy
+
+RESPONSE STYLE:
+- Start with a clear recommendation or answer
+- Provide 2-3 key supporting points
+- Include relevant stats or context when helpful
+- End with actionable advice
+- Use fantasy football terminology appropriately
+- Keep responses concise but comprehensive (2-4 paragraphs max)
+
+IMPORTANT CONSIDERATIONS:
+- SUPERFLEX leagues make QBs much more valuable
+- Position scarcity varies by league settings
+- ADP vs current availability creates value opportunities
+- Injury status and preseason performance matter
+- Playoff schedule (weeks 14-16) is crucial for late-season players
+- Keeper/dynasty vs redraft strategies differ significantly"""
+
+# ask() sends prompts under this many (estimated) tokens to the quick model...
+QUICK_MODEL_MAX_PROMPT_TOKENS = 500
+# ...unless they look like a head-to-head between several players
+COMPARISON_MARKERS = (' vs ', ' vs. ', ' versus ', 'compare', ' or ', ' better than ')
+
+# Redis keys for cached answers, kept for an hour
+RESPONSE_CACHE_PREFIX = 'fantasy-ai:response:'
+RESPONSE_CACHE_TTL = 3600  # seconds
+
+# Sampling temperature for answers. Only temperature 0 answers are cached -
+# a sampled reply is one of many Claude could give, so repeating it for an
+# hour would freeze that one sample
+ANSWER_TEMPERATURE = 0.0
+
+# Anthropic ignores a cache_control breakpoint on a shorter prefix (tokens);
+# Haiku models need twice the Sonnet/Opus minimum
+PROMPT_CACHE_MIN_TOKENS = 1024
+PROMPT_CACHE_MIN_TOKENS_HAIKU = 2048
+
+# Second system block - only the league details and date are filled in per build
+LEAGUE_PROMPT_TEMPLATE = """{league_info}
+
+CURRENT DATE: {date}
+
+Always consider the user's specific league context in your analysis."""
+
+
 class FantasyAIAssistant:
     """
     AI-powered fantasy football assistant using Claude
@@ -61,6 +164,26 @@ class FantasyAIAssistant:
         self.conversation_history = []
         self.current_draft_context = {}
         
+        # ((id of league context, date, cacheable), system blocks) - rebuilt only
+        # when the league changes, the day rolls over or the model's cache
+        # eligibility differs
+        self._system_prompt_cache = None
+        
+        # (expires_at, id of league context, rankings by name) - the top-200 rankings
+        # are reused across questions instead of re-fetched from MCP each time
+        self._rankings_cache = None
+        self._rankings_ttl = 60  # seconds
+        
+        # One MCP client for the assistant's lifetime (opened on first use,
+        # closed by aclose) instead of a fresh session per lookup
+        self._mcp = None
+        self._mcp_lock = asyncio.Lock()
+        
+        # Exact-match answer cache shared across sessions - None when redis
+        # isn't installed, REDIS_URL isn't set, or the server stops answering
+        redis_url = os.getenv('REDIS_URL')
+        self._redis = redis_asyncio.from_url(redis_url, decode_responses=True) if HAS_REDIS and redis_url else None
+        
         # Model preferences (most advanced first)
         self.model_preferences = [
             "claude-3-5-sonnet-20241022",  # Current working Sonnet 3.5  
@@ -68,69 +191,189 @@ class FantasyAIAssistant:
             "claude-3-5-sonnet-20240620",  # Fallback: Older Sonnet 3.5
             "claude-3-sonnet-20240229",    # Fallback: Sonnet 3.0
         ]
+        
+        # Cheaper, faster model for short single-subject questions in ask()
+        self.quick_model = "claude-3-5-haiku-20241022"
+    
+    async def _mcp_client(self) -> MCPClient:
+        """Get the shared MCP client, opening it on first call"""
+        async with self._mcp_lock:
+            if self._mcp is None:
+                self._mcp = await MCPClient().__aenter__()
+            return self._mcp
+    
+    async def __aenter__(self):
+        """Async context manager entry - aclose() runs on exit"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the shared MCP client (if one was opened) and the Redis connection"""
+        if self._mcp is not None:
+            mcp, self._mcp = self._mcp, None
+            await mcp.__aexit__(None, None, None)
+        if self._redis is not None:
+            redis_client, self._redis = self._redis, None
+            await redis_client.aclose()
+    
+    def _response_cache_key(self, model: str, temperature: float, question: str, *contexts: Dict[str, Any]) -> Optional[str]:
+        """
+        Redis key for an answer - hashes everything that shapes the reply
+        
+        Args:
+            model: Model the request goes to
+            temperature: Sampling temperature of the request
+            question: What is being asked
+            *contexts: Context dicts embedded in the prompt (these carry only
+                the date, so a question repeated the same day hashes the same)
+                
+        Returns:
+            The key, or None when temperature > 0 (sampled answers aren't cached)
+        """
+        if temperature > 0:
+            return None
+        
+        system_text = ''.join(block['text'] for block in self._build_system_prompt(model))
+        
+        digest = hashlib.sha256()
+        for part in (model, repr(temperature), system_text, question, _json_text(contexts, sort_keys=True)):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return RESPONSE_CACHE_PREFIX + digest.hexdigest()
+    
+    async def _cached_response(self, key: Optional[str], on_text: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """
+        Look up a cached answer, passing a hit to on_text like a streamed reply
+        
+        Returns:
+            The cached text, or None on a miss (or with the cache off)
+        """
+        if self._redis is None or key is None:
+            return None
+        
+        try:
+            cached = await self._redis.get(key)
+        except RedisError as e:
+            print(f"⚠️ Redis unavailable, answer cache disabled: {e}")
+            self._redis = None
+            return None
+        
+        if cached is not None:
+            print("⚡ Answer served from cache")
+            if on_text:
+                on_text(cached)
+        return cached
     
-    def _build_system_prompt(self) -> str:
+    async def _store_response(self, key: Optional[str], text: str):
+        """Cache a successful answer for RESPONSE_CACHE_TTL seconds"""
+        if self._redis is None or key is None:
+            return
+        
+        try:
+            await self._redis.setex(key, RESPONSE_CACHE_TTL, text)
+        except RedisError as e:
+            print(f"⚠️ Redis unavailable, answer cache disabled: {e}")
+            self._redis = None
+    
+    def _build_system_prompt(self, model: str) -> List[Dict[str, Any]]:
         """
-        Build comprehensive system prompt with league context and current data
+        Build the system prompt as Claude content blocks
+        
+        The static instructions come first, followed by the league details and
+        date. The static block only carries a cache_control breakpoint when it
+        reaches the model's minimum cacheable length - below that Anthropic
+        ignores the breakpoint, so none is sent.
+        
+        Args:
+            model: Model the prompt is sent to
+            
+        Returns:
+            System content blocks for messages.create
         """
-        # Get current league context
         context = league_manager.get_current_context()
+        today = date.today()
+        # ~4 characters per token, same estimate as _pick_model
+        min_tokens = PROMPT_CACHE_MIN_TOKENS_HAIKU if 'haiku' in model else PROMPT_CACHE_MIN_TOKENS
+        cacheable = len(STATIC_SYSTEM_PROMPT) // 4 >= min_tokens
+        key = (id(context), today, cacheable)
+        
+        if self._system_prompt_cache and self._system_prompt_cache[0] == key:
+            return self._system_prompt_cache[1]
+        
+        static_block = {"type": "text", "text": STATIC_SYSTEM_PROMPT}
+        if cacheable:
+            static_block["cache_control"] = {"type": "ephemeral"}
+        
+        system = [
+            static_block,
+            {
+                "type": "text",
+                "text": self._dynamic_league_block(context, today)
+            }
+        ]
+        self._system_prompt_cache = (key, system)
+        return system
+    
+    def _dynamic_league_block(self, context, today: date) -> str:
+        """
+        League context and current date - the part of the system prompt that changes
         
+        Args:
+            context: Current LeagueSettings, or None for the defaults
+            today: Date to show as the current date
+        """
         if context:
-            league_info = f"""
-LEAGUE CONTEXT:
+            league_info = f"""LEAGUE CONTEXT:
 - League: {context.league_name}
 - Platform: {context.platform.title()}
 - Scoring: {context.scoring_format.upper()} ({context.receptions} points per reception)
 - Teams: {context.total_teams}
 - Format: {'SUPERFLEX' if context.is_superflex else 'Standard'} ({context.total_qb_spots} QB spots)
 - Roster: {', '.join(context.roster_positions)}
-- Position Scarcity: {context.get_position_scarcity()}
-"""
+- Position Scarcity: {context.get_position_scarcity()}"""
         else:
             league_info = "LEAGUE CONTEXT: Using default SUPERFLEX Half-PPR settings"
         
-        return f"""You are an expert fantasy football draft assistant with deep knowledge of player analysis, draft strategy, and league dynamics.
-
-{league_info}
-
-CURRENT DATE: {datetime.now().strftime('%B %d, %Y')}
-DRAFT DATE: August 14, 2025
-
-YOUR EXPERTISE:
-- Player analysis and comparisons
-- Draft strategy optimization
-- Injury and trend analysis
-- Matchup evaluation
-- Roster construction
-- Value identification
-- Positional scarcity understanding
-
-PERSONALITY:
-- Direct and analytical, but conversational
-- Focus on actionable insights
-- Explain your reasoning clearly
-- Consider multiple factors in recommendations
-- Acknowledge uncertainty when appropriate
-- Be enthusiastic about good picks/strategy
-
-RESPONSE STYLE:
-- Start with a clear recommendation or answer
-- Provide 2-3 key supporting points
-- Include relevant stats or context when helpful
-- End with actionable advice
-- Use fantasy football terminology appropriately
-- Keep responses concise but comprehensive (2-4 paragraphs max)
-
-IMPORTANT CONSIDERATIONS:
-- SUPERFLEX leagues make QBs much more valuable
-- Position scarcity varies by league settings
-- ADP vs current availability creates value opportunities
-- Injury status and preseason performance matter
-- Playoff schedule (weeks 14-16) is crucial for late-season players
-- Keeper/dynasty vs redraft strategies differ significantly
-
-Always consider the user's specific league context in your analysis."""
+        return LEAGUE_PROMPT_TEMPLATE.format(
+            league_info=league_info,
+            date=today.strftime('%B %d, %Y')
+        )
+    
+    @staticmethod
+    def _log_cache_usage(response):
+        """Print how much of the prompt was read from / written to Anthropic's prompt cache"""
+        usage = getattr(response, 'usage', None)
+        # Older SDK versions don't declare these fields, so read them defensively
+        cache_read = getattr(usage, 'cache_read_input_tokens', None) or 0
+        cache_write = getattr(usage, 'cache_creation_input_tokens', None) or 0
+        if cache_read or cache_write:
+            print(f"💾 Prompt cache: {cache_read} tokens read, {cache_write} tokens written")
+    
+    async def _create_message(self, on_text: Optional[Callable[[str], None]] = None, **request):
+        """
+        Send a Messages API request, streaming it when a text callback is given
+        
+        Args:
+            on_text: Called with each text delta as it arrives (None = wait for
+                the whole reply with messages.create)
+            **request: messages.create/messages.stream arguments
+            
+        Returns:
+            The complete Message, same as messages.create
+        """
+        if on_text is None:
+            response = await self.claude.messages.create(**request)
+        else:
+            async with self.claude.messages.stream(**request) as stream:
+                async for text in stream.text_stream:
+                    on_text(text)
+                response = await stream.get_final_message()
+        
+        self._log_cache_usage(response)
+        return response
     
     def _get_best_available_model(self) -> str:
         """
@@ -143,6 +386,29 @@ Always consider the user's specific league context in your analysis."""
         # In production, we could add logic to test model availability
         return self.model_preferences[0]  # Latest Sonnet 4
     
+    def _pick_model(self, question: str, has_players: bool, prompt: str) -> str:
+        """
+        Route a question to Haiku or Sonnet
+        
+        Args:
+            question: User's question as asked
+            has_players: Whether the context carries a list of players to weigh
+            prompt: Full user message that will be sent (question plus context)
+            
+        Returns:
+            quick_model for short questions about one subject, otherwise the
+            best available model
+        """
+        # ~4 characters per token is close enough for routing
+        if has_players or len(prompt) // 4 >= QUICK_MODEL_MAX_PROMPT_TOKENS:
+            return self._get_best_available_model()
+        
+        padded = f" {question.lower()} "
+        if any(marker in padded for marker in COMPARISON_MARKERS):
+            return self._get_best_available_model()
+        
+        return self.quick_model
+    
     def _get_available_tools(self) -> List[Dict[str, Any]]:
         """
         Define tools that the AI can use for live data integration
@@ -230,34 +496,34 @@ Always consider the user's specific league context in your analysis."""
         """
         try:
             if tool_name == "get_live_rankings":
-                async with MCPClient() as mcp:
-                    position = tool_input.get("position", "ALL")
-                    limit = tool_input.get("limit", 20)
-                    rankings = await mcp.get_rankings(limit=limit)
-                    
-                    # Filter by position if specified
-                    if position != "ALL":
-                        filtered_players = []
-                        for player in rankings.get('players', []):
-                            if player.get('position') == position:
-                                filtered_players.append(player)
-                        rankings['players'] = filtered_players[:limit]
-                    
-                    return {
-                        "status": "success",
-                        "data": rankings,
-                        "message": f"Retrieved {len(rankings.get('players', []))} {position} players"
-                    }
+                mcp = await self._mcp_client()
+                position = tool_input.get("position", "ALL")
+                limit = tool_input.get("limit", 20)
+                rankings = await mcp.get_rankings(limit=limit)
+                
+                # Filter by position if specified
+                if position != "ALL":
+                    filtered_players = []
+                    for player in rankings.get('players', []):
+                        if player.get('position') == position:
+                            filtered_players.append(player)
+                    rankings['players'] = filtered_players[:limit]
+                
+                return {
+                    "status": "success",
+                    "data": rankings,
+                    "message": f"Retrieved {len(rankings.get('players', []))} {position} players"
+                }
             
             elif tool_name == "get_player_projections":
-                async with MCPClient() as mcp:
-                    player_names = tool_input.get("player_names", [])
-                    projections = await mcp.get_projections(player_names)
-                    return {
-                        "status": "success",
-                        "data": projections,
-                        "message": f"Retrieved projections for {len(player_names)} players"
-                    }
+                mcp = await self._mcp_client()
+                player_names = tool_input.get("player_names", [])
+                projections = await mcp.get_projections(player_names)
+                return {
+                    "status": "success",
+                    "data": projections,
+                    "message": f"Retrieved projections for {len(player_names)} players"
+                }
             
             elif tool_name == "get_available_players":
                 # This would integrate with draft monitor for live draft data
@@ -313,13 +579,15 @@ Always consider the user's specific league context in your analysis."""
                 return False
             return True  # Other errors don't indicate model unavailability
 
-    async def ask(self, question: str, context: Dict[str, Any] = None) -> str:
+    async def ask(self, question: str, context: Dict[str, Any] = None,
+                  on_text: Optional[Callable[[str], None]] = None) -> str:
         """
         Answer any fantasy football question with AI analysis
         
         Args:
             question: User's question in natural language
             context: Additional context (draft pick, available players, etc.)
+            on_text: Optional callback receiving the answer as it streams in
             
         Returns:
             AI-generated response with analysis and recommendations
@@ -338,20 +606,30 @@ Always consider the user's specific league context in your analysis."""
 QUESTION: {question}
 
 CURRENT CONTEXT:
-{json.dumps(full_context, indent=2)}
+{_json_text(full_context, indent=True)}
 
 Please provide a detailed analysis and recommendation based on the current league settings, available data, and fantasy football best practices.
 """
             }
         ]
         
+        # Haiku for quick lookups, Sonnet once several players are in play
+        model = self._pick_model(question, bool(full_context.get("available_players")), messages[0]["content"])
+        
+        cache_key = self._response_cache_key(model, ANSWER_TEMPERATURE, question, full_context)
+        cached = await self._cached_response(cache_key, on_text)
+        if cached is not None:
+            self._record_exchange(question, cached, full_context)
+            return cached
+        
         try:
-            # Call Claude API with most advanced model and tool use capability
-            response = await self.claude.messages.create(
-                model=self._get_best_available_model(),
+            # Call Claude API with the routed model and tool use capability
+            response = await self._create_message(
+                on_text,
+                model=model,
                 max_tokens=1000,
-                temperature=0.3,
-                system=self._build_system_prompt(),
+                temperature=ANSWER_TEMPERATURE,
+                system=self._build_system_prompt(model),
                 messages=messages
                 # tools=self._get_available_tools()  # Temporarily disabled for testing
             )
@@ -378,7 +656,7 @@ Please provide a detailed analysis and recommendation based on the current leagu
                         tool_results.append({
                             "type": "tool_result",
                             "tool_use_id": content_block.id,
-                            "content": json.dumps(tool_result)
+                            "content": _json_text(tool_result)
                         })
                 
                 # Add tool results and get final response
@@ -388,11 +666,12 @@ Please provide a detailed analysis and recommendation based on the current leagu
                 })
                 
                 # Get final response with tool results
-                final_response = await self.claude.messages.create(
-                    model=self._get_best_available_model(),
+                final_response = await self._create_message(
+                    on_text,
+                    model=model,
                     max_tokens=1000,
-                    temperature=0.3,
-                    system=self._build_system_prompt(),
+                    temperature=ANSWER_TEMPERATURE,
+                    system=self._build_system_prompt(model),
                     messages=conversation_messages
                 )
                 
@@ -401,13 +680,8 @@ Please provide a detailed analysis and recommendation based on the current leagu
                 # No tool use, just get the text response
                 ai_response = response.content[0].text
             
-            # Store in conversation history for context
-            self.conversation_history.append({
-                "question": question,
-                "response": ai_response,
-                "timestamp": datetime.now().isoformat(),
-                "context": full_context
-            })
+            self._record_exchange(question, ai_response, full_context)
+            await self._store_response(cache_key, ai_response)
             
             return ai_response
             
@@ -415,7 +689,8 @@ Please provide a detailed analysis and recommendation based on the current leagu
             print(f"DEBUG: AI Error details: {str(e)}")
             return f"❌ AI Error: {str(e)}\n\nFalling back to basic analysis..."
     
-    async def compare_players(self, player1: str, player2: str, context: Dict[str, Any] = None) -> str:
+    async def compare_players(self, player1: str, player2: str, context: Dict[str, Any] = None,
+                              on_text: Optional[Callable[[str], None]] = None) -> str:
         """
         Compare two players with detailed AI analysis
         
@@ -423,6 +698,7 @@ Please provide a detailed analysis and recommendation based on the current leagu
             player1: First player name
             player2: Second player name
             context: Additional context (draft position, team needs, etc.)
+            on_text: Optional callback receiving the comparison as it streams in
             
         Returns:
             Detailed comparison with recommendation
@@ -430,9 +706,11 @@ Please provide a detailed analysis and recommendation based on the current leagu
         if not self.has_ai:
             return self._fallback_comparison(player1, player2)
         
-        # Get player data
-        player_data = await self._get_player_comparison_data([player1, player2])
-        full_context = await self._gather_context(context or {})
+        # Get player data and draft context concurrently
+        player_data, full_context = await asyncio.gather(
+            self._get_player_comparison_data([player1, player2]),
+            self._gather_context(context or {})
+        )
         
         question = f"Compare {player1} vs {player2} for my draft. Who should I pick and why?"
         
@@ -443,10 +721,10 @@ Please provide a detailed analysis and recommendation based on the current leagu
 PLAYER COMPARISON REQUEST: {player1} vs {player2}
 
 PLAYER DATA:
-{json.dumps(player_data, indent=2)}
+{_json_text(player_data, indent=True)}
 
 DRAFT CONTEXT:
-{json.dumps(full_context, indent=2)}
+{_json_text(full_context, indent=True)}
 
 Please provide a detailed head-to-head comparison considering:
 1. Current rankings and ADP value
@@ -461,21 +739,31 @@ Format as: RECOMMENDATION, KEY FACTORS, ANALYSIS
             }
         ]
         
+        model = self._get_best_available_model()
+        cache_key = self._response_cache_key(model, ANSWER_TEMPERATURE, question, player_data, full_context)
+        cached = await self._cached_response(cache_key, on_text)
+        if cached is not None:
+            return cached
+        
         try:
-            response = await self.claude.messages.create(
-                model=self._get_best_available_model(),
+            response = await self._create_message(
+                on_text,
+                model=model,
                 max_tokens=1200,
-                temperature=0.3,
-                system=self._build_system_prompt(),
+                temperature=ANSWER_TEMPERATURE,
+                system=self._build_system_prompt(model),
                 messages=messages
             )
             
-            return response.content[0].text
+            comparison = response.content[0].text
+            await self._store_response(cache_key, comparison)
+            return comparison
             
         except Exception as e:
             return f"❌ AI Error: {str(e)}\n\n{self._fallback_comparison(player1, player2)}"
     
-    async def get_draft_recommendation(self, current_pick: int, available_players: List[str] = None, context: Dict[str, Any] = None) -> str:
+    async def get_draft_recommendation(self, current_pick: int, available_players: List[str] = None, context: Dict[str, Any] = None,
+                                       on_text: Optional[Callable[[str], None]] = None) -> str:
         """
         Get AI-powered draft recommendation for current pick
         
@@ -483,6 +771,7 @@ Format as: RECOMMENDATION, KEY FACTORS, ANALYSIS
             current_pick: Current draft pick number
             available_players: List of available player names
             context: Additional context (team needs, strategy, etc.)
+            on_text: Optional callback receiving the recommendation as it streams in
             
         Returns:
             Detailed recommendation with reasoning
@@ -490,14 +779,17 @@ Format as: RECOMMENDATION, KEY FACTORS, ANALYSIS
         if not self.has_ai:
             return self._fallback_recommendation(current_pick)
         
-        # Gather comprehensive data
-        full_context = await self._gather_context(context or {})
+        # Gather comprehensive data - the available players lookup (if needed)
+        # doesn't depend on the context, so run the two together
+        if available_players:
+            full_context = await self._gather_context(context or {})
+        else:
+            full_context, available_players = await asyncio.gather(
+                self._gather_context(context or {}),
+                self._get_top_available_players(current_pick, limit=20)
+            )
         full_context['current_pick'] = current_pick
         
-        # Get available players data if not provided
-        if not available_players:
-            available_players = await self._get_top_available_players(current_pick, limit=20)
-        
         # Get detailed analysis of top options
         player_analysis = await self._get_player_comparison_data(available_players[:10])
         
@@ -508,10 +800,10 @@ Format as: RECOMMENDATION, KEY FACTORS, ANALYSIS
 DRAFT RECOMMENDATION REQUEST for Pick #{current_pick}
 
 AVAILABLE PLAYERS (Top 10):
-{json.dumps(player_analysis, indent=2)}
+{_json_text(player_analysis, indent=True)}
 
 DRAFT CONTEXT:
-{json.dumps(full_context, indent=2)}
+{_json_text(full_context, indent=True)}
 
 Please provide a draft recommendation considering:
 1. Best value picks based on ADP
@@ -529,24 +821,44 @@ Provide:
             }
         ]
         
+        model = self._get_best_available_model()
+        cache_key = self._response_cache_key(model, ANSWER_TEMPERATURE, f"Draft recommendation for pick #{current_pick}", player_analysis, full_context)
+        cached = await self._cached_response(cache_key, on_text)
+        if cached is not None:
+            return cached
+        
         try:
-            response = await self.claude.messages.create(
-                model=self._get_best_available_model(),
+            response = await self._create_message(
+                on_text,
+                model=model,
                 max_tokens=1200,
-                temperature=0.3,
-                system=self._build_system_prompt(),
+                temperature=ANSWER_TEMPERATURE,
+                system=self._build_system_prompt(model),
                 messages=messages
             )
             
-            return response.content[0].text
+            recommendation = response.content[0].text
+            await self._store_response(cache_key, recommendation)
+            return recommendation
             
         except Exception as e:
             return f"❌ AI Error: {str(e)}\n\n{self._fallback_recommendation(current_pick)}"
     
+    def _record_exchange(self, question: str, response: str, context: Dict[str, Any]):
+        """Store a question/answer in conversation history for context"""
+        self.conversation_history.append({
+            "question": question,
+            "response": response,
+            "timestamp": datetime.now().isoformat(),
+            "context": context
+        })
+    
     async def _gather_context(self, additional_context: Dict[str, Any]) -> Dict[str, Any]:
         """Gather all relevant context for AI analysis"""
         context = {
-            "timestamp": datetime.now().isoformat(),
+            # Day granularity - a per-second timestamp would make every prompt
+            # (and answer cache key) unique
+            "date": date.today().isoformat(),
             "league": None,
             "draft_status": None,
             **additional_context
@@ -569,37 +881,61 @@ Provide:
     async def _get_player_comparison_data(self, player_names: List[str]) -> Dict[str, Any]:
         """Get comprehensive data for player comparison"""
         data = {"players": {}}
+        mcp = await self._mcp_client()
+        
+        # Rankings (for these players) and projections are independent lookups
+        rankings_index, projections = await asyncio.gather(
+            self._get_rankings_index(mcp),
+            mcp.get_projections(player_names)
+        )
         
-        async with MCPClient() as mcp:
-            # Get rankings for these players
-            rankings = await mcp.get_rankings(limit=200)
+        for name in player_names:
+            player_info = {"name": name}
             
-            # Get projections
-            projections = await mcp.get_projections(player_names)
+            # Find in rankings
+            player = rankings_index.get(name.lower())
+            if player:
+                player_info.update({
+                    "rank": player['rank'],
+                    "adp": player['adp'],
+                    "tier": player['tier'],
+                    "position": player['position'],
+                    "team": player['team']
+                })
             
-            for name in player_names:
-                player_info = {"name": name}
-                
-                # Find in rankings
-                for player in rankings.get('players', []):
-                    if player['name'].lower() == name.lower():
-                        player_info.update({
-                            "rank": player['rank'],
-                            "adp": player['adp'],
-                            "tier": player['tier'],
-                            "position": player['position'],
-                            "team": player['team']
-                        })
-                        break
-                
-                # Add projections
-                if name in projections.get('players', {}):
-                    player_info["projections"] = projections['players'][name]
-                
-                data["players"][name] = player_info
+            # Add projections
+            if name in projections.get('players', {}):
+                player_info["projections"] = projections['players'][name]
+            
+            data["players"][name] = player_info
         
         return data
     
+    async def _get_rankings_index(self, mcp: MCPClient) -> Dict[str, Dict[str, Any]]:
+        """
+        Top-200 rankings for the current league keyed by lowercased player name,
+        cached for _rankings_ttl seconds
+        
+        Args:
+            mcp: Open MCP client to fetch with on a miss
+        """
+        context_id = id(league_manager.get_current_context())
+        now = time.monotonic()
+        
+        if self._rankings_cache:
+            expires_at, cached_context_id, index = self._rankings_cache
+            if expires_at > now and cached_context_id == context_id:
+                return index
+        
+        rankings = await mcp.get_rankings(limit=200)
+        # Reversed so the first (best-ranked) entry wins if a name repeats
+        index = {player['name'].lower(): player for player in reversed(rankings.get('players', []))}
+        
+        # Don't hold on to a failed lookup
+        if 'error' not in rankings:
+            self._rankings_cache = (now + self._rankings_ttl, context_id, index)
+        return index
+    
     async def _get_top_available_players(self, current_pick: int, limit: int = 20) -> List[str]:
         """Get top available players for current draft state"""
         try:
@@ -666,20 +1002,23 @@ Enable AI for personalized recommendations:
 # Test function
 async def test_ai_assistant():
     """Test the AI assistant functionality"""
-    assistant = FantasyAIAssistant()
-    
     print("🤖 Testing AI Assistant...")
     
+    # The three requests are independent - issue them concurrently
+    async with FantasyAIAssistant() as assistant:
+        response, comparison, recommendation = await asyncio.gather(
+            assistant.ask("Should I draft Josh Allen in the first round of a SUPERFLEX league?"),
+            assistant.compare_players("Josh Allen", "Lamar Jackson"),
+            assistant.get_draft_recommendation(current_pick=25)
+        )
+    
     # Test basic question
-    response = await assistant.ask("Should I draft Josh Allen in the first round of a SUPERFLEX league?")
     print(f"\nQ: Should I draft Josh Allen in round 1?\nA: {response}")
     
     # Test comparison
-    comparison = await assistant.compare_players("Josh Allen", "Lamar Jackson")
     print(f"\nComparison: Josh Allen vs Lamar Jackson\n{comparison}")
     
     # Test recommendation  
-    recommendation = await assistant.get_draft_recommendation(current_pick=25)
     print(f"\nRecommendation for pick #25:\n{recommendation}")
 
 
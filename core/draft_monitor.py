@@ -16,7 +16,7 @@ from rich.panel import Panel
 from rich.columns import Columns
 from rich.text import Text
 
-from api.sleeper_client import SleeperClient
+from api.sleeper_client import SleeperClient, run_with_session
 from core.pre_computation import PreComputationEngine
 
 
@@ -654,4 +654,4 @@ if __name__ == "__main__":
     load_dotenv('.env.local')
     load_dotenv()
     
-    asyncio.run(test_draft_monitor())
\ No newline at end of file
+    run_with_session(test_draft_monitor())
\ No newline at end of file
@@ -18,7 +18,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from api.sleeper_client import SleeperClient
+from api.sleeper_client import SleeperClient, run_with_session
 
 
 @dataclass
@@ -347,10 +347,9 @@ async def test_league_context():
 
 
 if __name__ == "__main__":
-    import asyncio
     from dotenv import load_dotenv
     
     load_dotenv('.env.local')
     load_dotenv()
     
-    asyncio.run(test_league_context())
\ No newline at end of file
+    run_with_session(test_league_context())
\ No newline at end of file
@@ -3,7 +3,6 @@ Fantasy Football Draft Assistant - Pre-computation Engine
 Analyzes draft scenarios when user is 3 picks away from their turn
 """
 
-import asyncio
 import json
 import time
 from datetime import datetime, timedelta
@@ -11,7 +10,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
 from agents.draft_crew import FantasyDraftCrew
-from api.sleeper_client import SleeperClient
+from api.sleeper_client import SleeperClient, run_with_session
 from core.league_context import league_manager
 
 
@@ -388,4 +387,4 @@ async def test_precomputation():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_precomputation())
\ No newline at end of file
+    run_with_session(test_precomputation())
\ No newline at end of file
@@ -9,10 +9,9 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import aiohttp
-import asyncio
 from rich.console import Console
 
-from api.sleeper_client import SleeperClient
+from api.sleeper_client import SleeperClient, run_with_session
 
 
 class RankingsManager:
@@ -376,4 +375,4 @@ if __name__ == "__main__":
     load_dotenv('.env.local')
     load_dotenv()
     
-    asyncio.run(test_rankings_manager())
\ No newline at end of file
+    run_with_session(test_rankings_manager())
\ No newline at end of file
@@ -85,6 +85,7 @@ async def shutdown_event():
     """Clean shutdown"""
     if sleeper_client:
         await sleeper_client.__aexit__(None, None, None)
+    await SleeperClient.aclose_shared()
 
 def add_no_cache_headers(response: Response):
     """Add aggressive no-cache headers"""
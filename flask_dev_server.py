@@ -7,6 +7,7 @@ Using Flask to avoid FastAPI/Python 3.13 compatibility issues
 import json
 import os
 import asyncio
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -20,6 +21,27 @@ app = Flask(__name__)
 
 # Global variables
 draft_crew = None
+agent_loop = None  # long-lived event loop the agents' coroutines run on
+
+# Upper bound on one chat answer before the request falls back
+CHAT_TIMEOUT = 60  # seconds
+
+def start_agent_loop():
+    """
+    Start one event loop in a daemon thread for every agent call
+    
+    Flask handlers are synchronous, so coroutines are handed to this loop with
+    run_coroutine_threadsafe rather than each request building and closing its
+    own loop - clients and keep-alive connections created on it get reused.
+    The blocking crew.kickoff() calls run on draft_crew.CREW_EXECUTOR
+    (see FantasyDraftCrew.analyze_draft_question), so concurrent chats
+    overlap instead of queueing behind each other on this one thread.
+    """
+    global agent_loop
+    if agent_loop is None:
+        agent_loop = asyncio.new_event_loop()
+        threading.Thread(target=agent_loop.run_forever, name='agent-loop', daemon=True).start()
+    return agent_loop
 
 def init_agents():
     """Initialize CrewAI agents"""
@@ -33,6 +55,7 @@ def init_agents():
         try:
             from agents.draft_crew import FantasyDraftCrew
             draft_crew = FantasyDraftCrew(anthropic_api_key=api_key)
+            start_agent_loop()
             print("✅ CrewAI agents ready!")
         except Exception as e:
             print(f"❌ Error loading CrewAI: {e}")
@@ -335,16 +358,16 @@ def chat_endpoint():
         # Get real AI response - need to run async function
         print("🤖 Calling CrewAI agents...")
         
-        async def get_response():
-            return await draft_crew.analyze_draft_question(message, context)
-        
-        # Run async function in new event loop
+        # Run on the shared agent loop and block this request thread for the result
+        future = asyncio.run_coroutine_threadsafe(
+            draft_crew.analyze_draft_question(message, context), agent_loop
+        )
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            response = loop.run_until_complete(get_response())
-            loop.close()
+            response = future.result(timeout=CHAT_TIMEOUT)
         except Exception as e:
+            # Stops the coroutine; a kickoff already running in its worker
+            # thread finishes on its own without holding up the loop
+            future.cancel()
             print(f"❌ CrewAI error: {e}")
             response = f"CrewAI system had an error: {str(e)}\n\nFor SUPERFLEX leagues, remember:\n- QBs are premium (Josh Allen, Lamar Jackson worth early picks)\n- Target 2-3 QBs by round 7\n- Positional scarcity matters more than standard leagues"
         
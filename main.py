@@ -4,7 +4,6 @@ Fantasy Football Draft Assistant - Main Entry Point
 Day 1 (Aug 5): Basic setup and Sleeper API testing
 """
 
-import asyncio
 import os
 import sys
 from pathlib import Path
@@ -18,7 +17,7 @@ from rich import print as rprint
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from api.sleeper_client import SleeperClient, test_sleeper_connection
+from api.sleeper_client import SleeperClient, test_sleeper_connection, install_uvloop, run_with_session
 from core.draft_monitor import DraftMonitor
 from core.mcp_integration import MCPClient, EnhancedRankingsManager
 from core.league_context import league_manager
@@ -53,7 +52,7 @@ def test():
     console.print("🏈 Fantasy Football Draft Assistant - Connection Test", style="bold blue")
     console.print("=" * 60)
     
-    success = asyncio.run(test_sleeper_connection())
+    success = run_with_session(test_sleeper_connection())
     
     if success:
         console.print("\n✅ All tests passed! Sleeper API connection working.", style="bold green")
@@ -67,7 +66,7 @@ def test():
 @click.option('--enhanced', '-e', is_flag=True, help='Show enhanced data (ADP, bye weeks, playoff outlook)')
 def available(position, limit, enhanced):
     """Show available players in your draft"""
-    asyncio.run(show_available_players(position, limit, enhanced))
+    run_with_session(show_available_players(position, limit, enhanced))
 
 
 async def show_available_players(position: str = None, limit: int = 10, enhanced: bool = False):
@@ -155,7 +154,7 @@ async def show_available_players(position: str = None, limit: int = 10, enhanced
 @cli.command()
 def league():
     """Show your league information"""
-    asyncio.run(show_league_info())
+    run_with_session(show_league_info())
 
 
 @cli.command()
@@ -165,13 +164,13 @@ def league():
 @click.option('--draft-id', '-d', help='Specific draft ID to monitor (for mock drafts)')
 def monitor(position, no_available, enhanced, draft_id):
     """🚨 Start real-time draft monitoring (polls every 5 seconds)"""
-    asyncio.run(start_draft_monitoring(position, not no_available, enhanced, draft_id))
+    run_with_session(start_draft_monitoring(position, not no_available, enhanced, draft_id))
 
 
 @cli.command()
 def status():
     """Show current draft status without monitoring"""
-    asyncio.run(show_draft_status())
+    run_with_session(show_draft_status())
 
 
 @cli.command()
@@ -182,14 +181,14 @@ def mock(draft_id, position, enhanced):
     """🎮 Test with Sleeper mock draft - provide draft ID from Sleeper app"""
     console.print(f"🎮 Starting mock draft mode with draft ID: {draft_id}", style="bright_cyan")
     console.print("💡 Use this to test the assistant with any Sleeper mock draft!", style="dim")
-    asyncio.run(start_draft_monitoring(position, True, enhanced, draft_id))
+    run_with_session(start_draft_monitoring(position, True, enhanced, draft_id))
 
 
 @cli.command()
 @click.option('--pick', '-p', type=int, help='Current pick number to analyze')
 def precompute(pick):
     """🎯 Run pre-computation analysis for upcoming pick"""
-    asyncio.run(run_precomputation_analysis(pick))
+    run_with_session(run_precomputation_analysis(pick))
 
 
 async def start_draft_monitoring(position_filter: str = None, show_available: bool = True, enhanced: bool = False, draft_id: str = None):
@@ -294,20 +293,20 @@ async def run_precomputation_analysis(pick: int = None):
 @click.option('--limit', '-l', default=20, help='Number of players to show')
 def rankings(position, limit):
     """Show FantasyPros consensus rankings with ADP and tiers"""
-    asyncio.run(show_rankings(position, limit))
+    run_with_session(show_rankings(position, limit))
 
 
 @cli.command()
 def strategy():
     """Get SUPERFLEX draft strategy advice"""
-    asyncio.run(show_strategy())
+    run_with_session(show_strategy())
 
 
 @cli.command()
 @click.option('--league-id', '-l', help='Specific league ID to analyze')
 def setup(league_id):
     """Analyze and setup league-specific settings"""
-    asyncio.run(setup_league_context(league_id))
+    run_with_session(setup_league_context(league_id))
 
 
 @cli.command()
@@ -315,14 +314,14 @@ def setup(league_id):
 @click.option('--limit', '-l', default=10, help='Number of available players to analyze')
 def value(pick, limit):
     """Find value picks based on ADP analysis"""
-    asyncio.run(show_value_picks(pick, limit))
+    run_with_session(show_value_picks(pick, limit))
 
 
 @cli.command()
 @click.argument('question', required=True)
 def ask(question):
     """🤖 Ask AI assistant any fantasy football question"""
-    asyncio.run(ai_ask_question(question))
+    run_with_session(ai_ask_question(question))
 
 
 @cli.command()
@@ -330,14 +329,14 @@ def ask(question):
 @click.argument('player2', required=True)
 def compare(player1, player2):
     """🤖 AI-powered player comparison analysis"""
-    asyncio.run(ai_compare_players(player1, player2))
+    run_with_session(ai_compare_players(player1, player2))
 
 
 @cli.command()
 @click.option('--pick', '-p', required=True, type=int, help='Current draft pick number')
 def recommend(pick):
     """🤖 Get AI draft recommendation for current pick"""
-    asyncio.run(ai_draft_recommendation(pick))
+    run_with_session(ai_draft_recommendation(pick))
 
 
 async def setup_league_context(league_id: str = None):
@@ -540,8 +539,8 @@ async def ai_ask_question(question: str):
         console.print("🔄 Falling back to single AI assistant...", style="yellow")
         
         # Fallback to single assistant
-        assistant = FantasyAIAssistant()
-        response = await assistant.ask(question)
+        async with FantasyAIAssistant() as assistant:
+            response = await assistant.ask(question)
         console.print(f"\n🎯 AI Analysis:", style="bold cyan")
         console.print(response)
 
@@ -563,8 +562,8 @@ async def ai_compare_players(player1: str, player2: str):
         console.print("🔄 Falling back to single AI assistant...", style="yellow")
         
         # Fallback to single assistant
-        assistant = FantasyAIAssistant()
-        comparison = await assistant.compare_players(player1, player2)
+        async with FantasyAIAssistant() as assistant:
+            comparison = await assistant.compare_players(player1, player2)
         console.print(f"\n⚖️ Player Comparison: {player1} vs {player2}", style="bold cyan")
         console.print(comparison)
 
@@ -591,8 +590,8 @@ async def ai_draft_recommendation(current_pick: int):
         console.print("🔄 Falling back to single AI assistant...", style="yellow")
         
         # Fallback to single assistant
-        assistant = FantasyAIAssistant()
-        recommendation = await assistant.get_draft_recommendation(current_pick)
+        async with FantasyAIAssistant() as assistant:
+            recommendation = await assistant.get_draft_recommendation(current_pick)
         console.print(f"\n🎯 AI Draft Recommendation for Pick #{current_pick}:", style="bold cyan")
         console.print(recommendation)
 
@@ -657,4 +656,6 @@ if __name__ == "__main__":
     console.print("🏈 Fantasy Football Draft Assistant", style="bold blue")
     console.print("Day 4 (Aug 8) - AI-Powered Analysis with Claude\n", style="dim")
     
+    # Faster event loop for all the run_with_session() commands below (no-op without uvloop)
+    install_uvloop()
     cli()
\ No newline at end of file
@@ -3,7 +3,6 @@
 Quick script to examine the existing draft picks in detail
 """
 
-import asyncio
 import os
 from pathlib import Path
 import sys
@@ -12,7 +11,7 @@ import sys
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from api.sleeper_client import SleeperClient
+from api.sleeper_client import SleeperClient, install_uvloop, run_with_session
 from dotenv import load_dotenv
 
 # Load environment
@@ -67,4 +66,5 @@ async def check_existing_picks():
 
 
 if __name__ == "__main__":
-    asyncio.run(check_existing_picks())
\ No newline at end of file
+    install_uvloop()
+    run_with_session(check_existing_picks())
\ No newline at end of file
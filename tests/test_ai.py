@@ -25,33 +25,32 @@ async def test_ai_features():
     print("🤖 Testing AI features...")
     print(f"API Key: {api_key[:20]}...{api_key[-10:]}")  # Show partial key for verification
     
-    assistant = FantasyAIAssistant()
-    
-    if not assistant.has_ai:
-        print("❌ AI not initialized properly")
-        return
-    
-    print("✅ AI initialized successfully!")
-    
-    # Test 1: Simple question
-    print("\n🧪 Test 1: Simple Question")
-    try:
-        response = await assistant.ask("Is Josh Allen worth a first round pick in SUPERFLEX?")
-        print("✅ AI Response received!")
-        print(f"Response preview: {response[:150]}...")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    # Test 2: Player comparison
-    print("\n🧪 Test 2: Player Comparison")
-    try:
-        comparison = await assistant.compare_players("Josh Allen", "Lamar Jackson")
-        print("✅ Comparison received!")
-        print(f"Comparison preview: {comparison[:150]}...")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    print("\n🎉 AI testing complete! If you see responses above, everything is working!")
+    async with FantasyAIAssistant() as assistant:
+        if not assistant.has_ai:
+            print("❌ AI not initialized properly")
+            return
+        
+        print("✅ AI initialized successfully!")
+        
+        # Test 1: Simple question
+        print("\n🧪 Test 1: Simple Question")
+        try:
+            response = await assistant.ask("Is Josh Allen worth a first round pick in SUPERFLEX?")
+            print("✅ AI Response received!")
+            print(f"Response preview: {response[:150]}...")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+        
+        # Test 2: Player comparison
+        print("\n🧪 Test 2: Player Comparison")
+        try:
+            comparison = await assistant.compare_players("Josh Allen", "Lamar Jackson")
+            print("✅ Comparison received!")
+            print(f"Comparison preview: {comparison[:150]}...")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+        
+        print("\n🎉 AI testing complete! If you see responses above, everything is working!")
 
 if __name__ == "__main__":
     asyncio.run(test_ai_features())
\ No newline at end of file
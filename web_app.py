@@ -389,6 +389,11 @@ class ConnectionManager:
 # Global connection manager
 manager = ConnectionManager()
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared Sleeper HTTP session"""
+    await SleeperClient.aclose_shared()
+
 @app.get("/", response_class=HTMLResponse)
 async def get_homepage(request: Request):
     """Main draft assistant interface"""
@@ -482,8 +487,8 @@ Provide a concise, actionable answer (2-3 sentences max)."""
                             context_info = f"SUPERFLEX Half-PPR League Question: {user_message}"
                     
                     # Use fast single AI assistant
-                    ai_assistant = FantasyAIAssistant(anthropic_api_key=api_key)
-                    response = await ai_assistant.get_recommendation(context_info)
+                    async with FantasyAIAssistant(anthropic_api_key=api_key) as ai_assistant:
+                        response = await ai_assistant.get_recommendation(context_info)
                     print(f"✅ Got fast AI response: {response[:100]}...")
                 
                 await manager.send_personal_message({